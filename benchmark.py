@@ -0,0 +1,549 @@
+# Imports
+# -------
+
+from __future__ import annotations
+import time, subprocess, contextlib, io, json, tempfile, concurrent.futures
+from telemetry import ft_rss_reset, ft_rss_peak
+from train import ft_load, ft_train, ft_train_vectorized, ft_save, Convergence
+from predict import ft_thetas, ft_price, ft_precision, ft_main_batch
+from regressor import LinearRegressor
+from parallel import ft_train_parallel
+from tools import *
+
+
+# Globals
+# -------
+
+BENCHMARK_ROWS = [100, 1000, 10000]
+BENCHMARK_SCALER_ROWS = [1000, 10000, 100000, 1000000, 10000000]
+BENCHMARK_PIPELINE_ROWS = [1000, 10000, 100000, 1000000]
+BENCHMARK_MODELS_ROWS = [100000, 1000000]
+BENCHMARK_MODELS = 8
+BENCHMARK_PARALLEL_ROWS = [1000000, 10000000]
+BENCHMARKS = ('engines', 'scaler', 'startup', 'pipeline', 'models', 'parallel')
+BENCHMARK_SEED = 42
+BENCHMARK_FIELDS = {
+    'engines': (('rows',), ('baseline', 'loop', 'numpy')),
+    'scaler': (('rows',), ('fit', 'scale')),
+    'startup': (('module',), ('import',)),
+    'pipeline': (('rows', 'stage'), ('time', 'peak_rss')),
+    'models': (('rows',), ('serial', 'threads', 'processes')),
+    'parallel': (('rows', 'workers'), ('time',)),
+}
+PIPELINE_STAGES = ('load', 'normalize', 'train', 'save', 'predict', 'batch', 'precision')
+GENERATE_CHUNK = 1000000
+THRESHOLD = 0.1
+THRESHOLD_FLOORS = {'peak_rss': 1.0}
+THRESHOLD_FLOOR = 1e-3
+STARTUP_BUDGET = 0.1
+STARTUP_MODULES = ('predict', 'train')
+STARTUP_HEAVY = ('numpy', 'pandas', 'matplotlib')
+STARTUP_REPEAT = 5
+
+
+# Functions
+# ---------
+
+def ft_dataset(rows: int, seed: int = BENCHMARK_SEED) -> tuple:
+
+    """
+    Generates a reproducible synthetic dataset of mileages and prices
+    following the shape of data.csv (price decreasing with mileage, plus noise).
+
+    Args:
+        rows (int): Number of data points to generate.
+        seed (int): Seed of the random generator (default: 42).
+
+    Returns:
+        dataset (tuple): Arrays of mileages and prices.
+    """
+
+    generator: numpy.random.Generator = numpy.random.default_rng(seed)
+    x_km: numpy.ndarray = generator.uniform(0, 250000, rows).round()
+    y_price: numpy.ndarray = 8500 - 0.0214 * x_km + generator.normal(0, 650, rows)
+    return x_km, numpy.clip(y_price, 0, None).round()
+
+# ----------
+
+def ft_generate(path: str, rows: int, seed: int = BENCHMARK_SEED) -> None:
+
+    """
+    Writes a reproducible synthetic 'km,price' csv file, generated
+    by chunks so that datasets larger than memory can be written.
+
+    Args:
+        path (str): Path to the csv file to write.
+        rows (int): Number of data points to generate.
+        seed (int): Seed of the random generator (default: 42).
+
+    Returns:
+        None
+    """
+
+    with open(path, 'w', newline='') as file:
+        for index, start in enumerate(range(0, rows, GENERATE_CHUNK)):
+            x_km, y_price = ft_dataset(min(GENERATE_CHUNK, rows - start), [seed, index])
+            pandas.DataFrame({'km': x_km.astype(numpy.int64), 'price': y_price.astype(numpy.int64)}).to_csv(file, header=index == 0, index=False)
+
+# ----------
+
+def ft_timeit(function: callable, *args) -> tuple:
+
+    """
+    Calls a function once and measures its wall time.
+
+    Args:
+        function (callable): Function to call.
+        *args: Arguments passed to the function.
+
+    Returns:
+        timing (tuple): Value returned by the function and elapsed seconds.
+    """
+
+    start: float = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+# ----------
+
+def ft_train_baseline(x_km: list, y_price: list, iterations: int = ITERATIONS, learning_rate: float = LEARNING_RATE) -> dict:
+
+    """
+    Frozen copy of the training loop of the original program, kept as
+    the reference of the engines benchmark: a fixed number of iterations
+    (500) at a fixed learning rate, each one a pass over the data for the
+    gradient and another one for the loss recorded in the history. Its
+    learning rate adjustment never fired (the list of losses it was given
+    stayed empty) and is left out.
+
+    Args:
+        x_km (list): List of normalized mileage values.
+        y_price (list): List of normalized price values.
+        iterations (int): Number of iterations (default: 500).
+        learning_rate (float): Learning rate (default: 0.5).
+
+    Returns:
+        histories (dict): Dictionary containing the history of theta0, theta1 and loss.
+    """
+
+    thetas: list = [0.0, 0.0]
+    histories: dict = {'theta0': [], 'theta1': [], 'loss': []}
+
+    for _ in range(iterations):
+        tmp: list = [0.0, 0.0]
+        for km, price in zip(x_km, y_price):
+            prediction: float = thetas[1] * km + thetas[0]
+            tmp[0] += prediction - price
+            tmp[1] += (prediction - price) * km
+        thetas[0] -= tmp[0] / len(x_km) * learning_rate
+        thetas[1] -= tmp[1] / len(y_price) * learning_rate
+        histories['theta0'].append(thetas[0])
+        histories['theta1'].append(thetas[1])
+        histories['loss'].append(sum((price - (thetas[1] * km + thetas[0])) ** 2 for km, price in zip(x_km, y_price)) / len(x_km))
+    return histories
+
+# ----------
+
+def ft_benchmark_engines(rows: list = BENCHMARK_ROWS) -> list:
+
+    """
+    Compares the training loop of the original program (baseline, see
+    ft_train_baseline), the current pure-Python training loop (ft_train,
+    stopping on convergence) and the vectorized engine on synthetic
+    datasets of increasing size, and checks the last two agree.
+
+    Args:
+        rows (list): List of dataset sizes to benchmark (default: [100, 1000, 10000]).
+
+    Returns:
+        results (list): List of dictionaries with the timings of each run.
+    """
+
+    results: list = []
+
+    print(message(f'{ "rows":>10} { "baseline (s)":>12} { "loop (s)":>10} { "numpy (s)":>10} { "speedup":>9} { "max diff":>10}'))
+    for count in rows:
+        x_km, y_price = ft_dataset(count)
+        x_km = (x_km - x_km.min()) / (x_km.max() - x_km.min())
+        y_price = (y_price - y_price.min()) / (y_price.max() - y_price.min())
+        _, baseline_time = ft_timeit(ft_train_baseline, x_km.tolist(), y_price.tolist())
+        loop, loop_time = ft_timeit(ft_train, x_km.tolist(), y_price.tolist(), False)
+        vectorized, numpy_time = ft_timeit(ft_train_vectorized, x_km, y_price, False)
+        difference: float = max(abs(loop[key][-1] - vectorized[key][-1]) for key in ('theta0', 'theta1'))
+        results.append({'rows': count, 'baseline': baseline_time, 'loop': loop_time, 'numpy': numpy_time, 'difference': difference})
+        print(message(f'{ count:>10} { baseline_time:>12.4f} { loop_time:>10.4f} { numpy_time:>10.4f} { baseline_time / numpy_time:>8.1f}x { difference:>10.2e}'))
+    return results
+
+# ----------
+
+def ft_benchmark_scaler(rows: list = BENCHMARK_SCALER_ROWS) -> list:
+
+    """
+    Measures fitting a scaler and transforming then inverse-transforming
+    the data, on synthetic datasets of increasing size.
+    A constant time per row shows that scaling is linear in the number of rows.
+
+    Args:
+        rows (list): List of dataset sizes to benchmark (default: 10^3 to 10^7).
+
+    Returns:
+        results (list): List of dictionaries with the timings of each run.
+    """
+
+    results: list = []
+
+    print(message(f'{ "rows":>10} { "fit (s)":>10} { "scale (s)":>10} { "ns/row":>9}'))
+    for count in rows:
+        x_km, _ = ft_dataset(count)
+        scaler, fit_time = ft_timeit(Scaler().fit, x_km)
+        _, scale_time = ft_timeit(lambda data: scaler.inverse_transform(scaler.transform(data)), x_km)
+        results.append({'rows': count, 'fit': fit_time, 'scale': scale_time})
+        print(message(f'{ count:>10} { fit_time:>10.4f} { scale_time:>10.4f} { (fit_time + scale_time) / count * 1e9:>9.2f}'))
+    return results
+
+
+# ----------
+
+def ft_importtime(module: str) -> tuple:
+
+    """
+    Imports a module in a fresh interpreter with 'python -X importtime'
+    and parses its report.
+
+    Args:
+        module (str): Name of the module to import.
+
+    Returns:
+        timing (tuple): Cumulative import time of the module (in seconds) and names of all imported modules.
+    """
+
+    times: dict = {}
+    result: subprocess.CompletedProcess = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import { module }'],
+        capture_output=True, text=True, cwd=os.path.dirname(os.path.abspath(__file__))
+    )
+
+    if result.returncode != 0: raise Exception(f"Cannot import '{ module }': { result.stderr.strip().splitlines()[-1] }")
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line: continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        times[name.strip()] = int(cumulative) / 1e6
+    return times[module], set(times)
+
+# ----------
+
+def ft_benchmark_startup(modules: tuple = STARTUP_MODULES, budget: float = STARTUP_BUDGET) -> list:
+
+    """
+    Measures the startup cost of the command line programs with
+    'python -X importtime' (best of several runs) and checks it against
+    a budget: importing them must not load any heavy module
+    (numpy, pandas, matplotlib) and must fit in the budget.
+
+    Args:
+        modules (tuple): Names of the modules to import (default: ('predict', 'train')).
+        budget (float): Maximum import time in seconds (default: 0.1).
+
+    Returns:
+        results (list): List of dictionaries with the import time of each module.
+    """
+
+    results: list = []
+
+    print(message(f'{ "module":>10} { "import (ms)":>12} { "budget (ms)":>12}   heavy modules loaded'))
+    for module in modules:
+        timings: list = [ft_importtime(module) for _ in range(STARTUP_REPEAT)]
+        seconds: float = min(timing[0] for timing in timings)
+        heavy: list = [name for name in STARTUP_HEAVY if name in timings[0][1]]
+        results.append({'module': module, 'import': seconds, 'budget': budget, 'heavy': heavy})
+        print(message(f'{ module:>10} { seconds * 1e3:>12.1f} { budget * 1e3:>12.1f}   { ", ".join(heavy) or "none" }'))
+    for result in results:
+        if result['import'] > budget or result['heavy']:
+            raise Exception(f"Startup budget exceeded by '{ result['module'] }' ({ result['import'] * 1e3:.1f} ms, heavy modules: { ', '.join(result['heavy']) or 'none' }).")
+    return results
+
+# ----------
+
+def ft_measure(function: callable, *args) -> tuple:
+
+    """
+    Calls a function once, silencing its output messages,
+    and measures its wall time and peak resident memory.
+
+    Args:
+        function (callable): Function to call.
+        *args: Arguments passed to the function.
+
+    Returns:
+        measure (tuple): Value returned by the function, and elapsed seconds and peak memory (in MiB).
+    """
+
+    ft_rss_reset()
+    with contextlib.redirect_stdout(io.StringIO()): result, elapsed = ft_timeit(function, *args)
+    return result, (elapsed, ft_rss_peak())
+
+# ----------
+
+def ft_scale(x_km: numpy.ndarray, y_price: numpy.ndarray) -> tuple:
+
+    """
+    Fits the scalers of mileages and prices and normalizes them,
+    as the training program does.
+
+    Args:
+        x_km (numpy.ndarray): Array of mileage values.
+        y_price (numpy.ndarray): Array of corresponding price values.
+
+    Returns:
+        normalization (tuple): Dictionary containing the scalers of km and price, and normalized arrays.
+    """
+
+    scalers: dict = {'km': Scaler().fit(x_km), 'price': Scaler().fit(y_price)}
+    return scalers, (scalers['km'].transform(x_km), scalers['price'].transform(y_price))
+
+# ----------
+
+def ft_benchmark_pipeline(rows: list = BENCHMARK_PIPELINE_ROWS, seed: int = BENCHMARK_SEED) -> list:
+
+    """
+    Runs the whole program on synthetic csv files of increasing size
+    and measures each stage separately: loading (ft_load), normalization,
+    training (numpy engine), saving (ft_save), prediction of every
+    mileage the way predict.py does it (ft_thetas then ft_price), batch
+    prediction of the csv file as predict.py -input runs it (ft_main_batch,
+    reading and writing csv files included) and precision (ft_precision).
+    Every stage records its wall time, the peak resident memory of the
+    process while it ran and its throughput in rows per second.
+
+    Args:
+        rows (list): List of dataset sizes to benchmark (default: 10^3 to 10^6).
+        seed (int): Seed of the random generator (default: 42).
+
+    Returns:
+        results (list): List of dictionaries with the measures of each stage of each run.
+    """
+
+    results: list = []
+
+    print(message(f'{ "rows":>10} { "stage":>10} { "time (s)":>10} { "peak (MiB)":>11} { "rows/s":>12}'))
+    with tempfile.TemporaryDirectory() as directory:
+        for count in rows:
+            data: str = os.path.join(directory, f'data_{ count }.csv')
+            thetas: str = os.path.join(directory, f'thetas_{ count }.csv')
+            prices: str = os.path.join(directory, f'prices_{ count }.csv')
+            ft_generate(data, count, seed)
+            measures: dict = {}
+            frame, measures['load'] = ft_measure(ft_load, data, False)
+            x_km, y_price = frame['km'].to_numpy(dtype=numpy.float64), frame['price'].to_numpy(dtype=numpy.float64)
+            (scalers, normalized), measures['normalize'] = ft_measure(ft_scale, x_km, y_price)
+            histories, measures['train'] = ft_measure(ft_train_vectorized, *normalized, False, Convergence(LEARNING_RATE, TOLERANCE, MAX_ITERATIONS))
+            _, measures['save'] = ft_measure(ft_save, (histories['theta0'][-1], histories['theta1'][-1]), scalers, thetas, False)
+            _, measures['predict'] = ft_measure(lambda: ft_price(ft_thetas(thetas, False), x_km))
+            with contextlib.redirect_stdout(io.StringIO()): _, measures['batch'] = ft_measure(ft_main_batch, thetas, data, prices)
+            _, measures['precision'] = ft_measure(ft_precision, LinearRegressor.load(thetas, False), data)
+            for stage in PIPELINE_STAGES:
+                elapsed, peak = measures[stage]
+                results.append({'rows': count, 'stage': stage, 'time': elapsed, 'peak_rss': peak, 'rows_per_second': count / elapsed if elapsed > 0 else math.inf})
+                print(message(f'{ count:>10} { stage:>10} { elapsed:>10.4f} { peak:>11.1f} { results[-1]["rows_per_second"]:>12.0f}'))
+            for path in (data, f'{ data }.cache', thetas, prices):
+                if os.path.exists(path): os.remove(path)
+    return results
+
+# ----------
+
+def ft_fit_model(task: tuple) -> tuple:
+
+    """
+    Generates a dataset and fits a LinearRegressor on it, in a thread
+    or a worker process of ft_benchmark_models.
+
+    Args:
+        task (tuple): Number of data points and seed of the dataset.
+
+    Returns:
+        coefficients (tuple): Intercept and slope of the fitted model.
+    """
+
+    return LinearRegressor().fit(*ft_dataset(*task)).coefficients
+
+# ----------
+
+def ft_benchmark_models(rows: list = BENCHMARK_MODELS_ROWS, models: int = BENCHMARK_MODELS, seed: int = BENCHMARK_SEED) -> list:
+
+    """
+    Measures the throughput of training many independent models
+    (LinearRegressor) in one process: one after the other, in a pool
+    of threads and in a pool of processes, with as many workers as CPUs.
+    Each model gets its own dataset, and all three runs must give the
+    same coefficients.
+
+    Args:
+        rows (list): List of dataset sizes to benchmark (default: 10^5 and 10^6).
+        models (int): Number of models trained per run (default: 8).
+        seed (int): Seed of the random generator (default: 42).
+
+    Returns:
+        results (list): List of dictionaries with the wall time of each run (in seconds).
+    """
+
+    results: list = []
+    workers: int = os.cpu_count() or 1
+
+    print(message(f'{ "rows":>10} { "serial (s)":>12} { "threads (s)":>12} { "processes (s)":>14} { "models/s":>10}   ({ models } models, { workers } workers)'))
+    for count in rows:
+        tasks: list = [(count, [seed, index]) for index in range(models)]
+        serial, (elapsed_serial, _) = ft_measure(lambda: [ft_fit_model(task) for task in tasks])
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool: threads, (elapsed_threads, _) = ft_measure(lambda: list(pool.map(ft_fit_model, tasks)))
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool: processes, (elapsed_processes, _) = ft_measure(lambda: list(pool.map(ft_fit_model, tasks)))
+        if not serial == threads == processes: raise Exception(f'Models trained concurrently differ from models trained one after the other ({ count } rows).')
+        results.append({'rows': count, 'serial': elapsed_serial, 'threads': elapsed_threads, 'processes': elapsed_processes})
+        print(message(f'{ count:>10} { elapsed_serial:>12.4f} { elapsed_threads:>12.4f} { elapsed_processes:>14.4f} { models / min(elapsed_threads, elapsed_processes):>10.1f}'))
+    return results
+
+# ----------
+
+def ft_benchmark_parallel(rows: list = BENCHMARK_PARALLEL_ROWS, seed: int = BENCHMARK_SEED) -> list:
+
+    """
+    Measures the speedup of the parallel engine from 1 to N processes
+    (powers of two up to the number of CPUs), against the numpy engine
+    in a single process. Runs on any number of processes must give the
+    same thetas, bit for bit.
+
+    Args:
+        rows (list): List of dataset sizes to benchmark (default: 10^6 and 10^7).
+        seed (int): Seed of the random generator (default: 42).
+
+    Returns:
+        results (list): List of dictionaries with the wall time of each run (in seconds) and its speedup.
+    """
+
+    results: list = []
+    cpus: int = os.cpu_count() or 1
+    counts: list = sorted({2 ** power for power in range(cpus.bit_length()) if 2 ** power <= cpus} | {cpus})
+
+    print(message(f'{ "rows":>10} { "workers":>8} { "time (s)":>10} { "speedup":>8} { "numpy (s)":>10} { "iterations":>11}'))
+    for count in rows:
+        _, normalized = ft_scale(*ft_dataset(count, seed))
+        histories, (elapsed_numpy, _) = ft_measure(ft_train_vectorized, *normalized, False, None, None)
+        reference: tuple = None
+        for workers in counts:
+            histories, (elapsed, _) = ft_measure(ft_train_parallel, *normalized, False, None, None, None, None, workers)
+            thetas: tuple = histories['theta0'][-1], histories['theta1'][-1]
+            reference = reference or (thetas, elapsed)
+            if thetas != reference[0]: raise Exception(f'Thetas trained across { workers } processes differ from those trained in a single one ({ count } rows).')
+            results.append({'rows': count, 'workers': workers, 'time': elapsed, 'speedup': reference[1] / elapsed, 'numpy': elapsed_numpy})
+            print(message(f'{ count:>10} { workers:>8} { elapsed:>10.4f} { reference[1] / elapsed:>7.2f}x { elapsed_numpy:>10.4f} { histories["iterations"]:>11}'))
+    return results
+
+# ----------
+
+def ft_compare(before: dict, after: dict, threshold: float = THRESHOLD) -> list:
+
+    """
+    Compares two benchmark runs saved with -json and returns the
+    regressions: measures of the second run exceeding those of the
+    first one by more than the threshold (relative). Differences below
+    a noise floor (1 ms, or 1 MiB of memory) are ignored.
+
+    Args:
+        before (dict): Results of the reference run.
+        after (dict): Results of the run to check.
+        threshold (float): Relative increase tolerated (default: 0.1, i.e. 10%).
+
+    Returns:
+        regressions (list): List of dictionaries describing each regression.
+    """
+
+    regressions: list = []
+
+    print(message(f'{ "benchmark":>10} { "run":>20} { "measure":>10} { "before":>10} { "after":>10} { "change":>8}'))
+    for benchmark, (keys, measures) in BENCHMARK_FIELDS.items():
+        reference: dict = {tuple(result[key] for key in keys): result for result in before.get(benchmark, [])}
+        for result in after.get(benchmark, []):
+            run: tuple = tuple(result[key] for key in keys)
+            if run not in reference: continue
+            for measure in measures:
+                if measure not in reference[run] or measure not in result: continue
+                old, new = reference[run][measure], result[measure]
+                change: float = (new - old) / old if old > 0 else 0.0
+                flagged: bool = change > threshold and new - old > THRESHOLD_FLOORS.get(measure, THRESHOLD_FLOOR)
+                if flagged: regressions.append({'benchmark': benchmark, 'run': run, 'measure': measure, 'before': old, 'after': new, 'change': change})
+                print((error if flagged else message)(f'{ benchmark:>10} { " ".join(map(str, run)):>20} { measure:>10} { old:>10.4f} { new:>10.4f} { change:>+7.1%}'))
+    return regressions
+
+
+# Main function
+# -------------
+
+def ft_main(args: list) -> None:
+
+    """
+        Main function.
+
+        Args:
+            args (list): List of arguments that can be either:
+                benchmark (str): Optional benchmark to run, 'engines', 'scaler', 'startup', 'pipeline', 'models' or 'parallel' (default: all).
+                rows (int): Optional dataset sizes to benchmark (default: depends on the benchmark).
+                -json (str): Optional json file receiving the results (default: None).
+                -compare (str): Optional json file of a reference run: the two json files passed as arguments are compared instead.
+                -threshold (float): Optional relative increase flagged as a regression by -compare (default: 0.1).
+
+        Returns:
+            None
+    """
+
+    benchmarks: tuple = BENCHMARKS
+    rows: list = None
+    results: dict = {}
+
+    target: str = ft_option(args, '-json')
+    threshold: float = ft_option(args, '-threshold', THRESHOLD, float)
+    if '-compare' in args:
+        args.remove('-compare')
+        if len(args) != 2: raise Exception('Please provide the json files of the two runs to compare: -compare before.json after.json.')
+        with open(args[0]) as before, open(args[1]) as after: regressions: list = ft_compare(json.load(before)['results'], json.load(after)['results'], threshold)
+        if regressions: raise Exception(f'{ len(regressions) } regression(s) above { threshold:.0%}.')
+        print(message(f'\nNo regression above { threshold:.0%} √'))
+        return
+    if len(args) > 0 and args[0] in BENCHMARKS: benchmarks = (args.pop(0),)
+    try: rows = [int(arg) for arg in args] if len(args) > 0 else None
+    except ValueError: raise Exception(f"Dataset sizes must be integers, benchmarks are: { ', '.join(BENCHMARKS) }.")
+    if rows is not None and any(count < 2 for count in rows): raise Exception('Dataset sizes must be at least 2.')
+    if 'engines' in benchmarks:
+        print(message('Training engines (original 500-iteration loop vs current loop vs numpy, speedup of numpy over the original):'))
+        results['engines'] = ft_benchmark_engines(rows or BENCHMARK_ROWS)
+    if 'scaler' in benchmarks:
+        print(message('\nScaler (fit, transform and inverse transform):'))
+        results['scaler'] = ft_benchmark_scaler(rows or BENCHMARK_SCALER_ROWS)
+    if 'startup' in benchmarks:
+        print(message('\nStartup (python -X importtime):'))
+        results['startup'] = ft_benchmark_startup()
+    if 'pipeline' in benchmarks:
+        print(message('\nPipeline (load, normalize, train, save, predict, batch, precision):'))
+        results['pipeline'] = ft_benchmark_pipeline(rows or BENCHMARK_PIPELINE_ROWS)
+    if 'models' in benchmarks:
+        print(message('\nConcurrent models (LinearRegressor in threads and processes):'))
+        results['models'] = ft_benchmark_models(rows or BENCHMARK_MODELS_ROWS)
+    if 'parallel' in benchmarks:
+        print(message('\nParallel engine (1 to N processes vs numpy engine):'))
+        results['parallel'] = ft_benchmark_parallel(rows or BENCHMARK_PARALLEL_ROWS)
+    if target is not None:
+        with open(target, 'w') as file: json.dump({'seed': BENCHMARK_SEED, 'python': sys.version.split()[0], 'results': results}, file, indent=4)
+        print(message(f'\nResults saved in { target } √'))
+
+
+# Main
+# ----
+
+if __name__ == '__main__':
+
+    try:
+        print(header(f'--------------------------- BENCHMARK ---------------------------\n'))
+        ft_main(sys.argv[1:])
+        sys.exit(0)
+
+    except (KeyboardInterrupt, EOFError): print(error('[ WARNING ]: Program interrupted by user.'))
+    except Exception as exc:
+        print(error(f'[ ERROR ]: { exc }'))
+        sys.exit(1)
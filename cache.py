@@ -0,0 +1,190 @@
+# Imports
+# -------
+
+from __future__ import annotations
+import hashlib, json
+from registry import ft_fsync_directory
+from tools import *
+
+
+# Globals
+# -------
+
+CACHE_MAGIC = b'FTCACHE\n'
+CACHE_VERSION = 1
+CACHE_ALIGN = 64
+CACHE_COLUMNS = ('km', 'price')
+CACHE_DTYPE = '<f8'
+
+
+# Functions
+# ---------
+
+def ft_cache_path(path: str) -> str:
+
+    """
+    Returns the path of the binary cache of a csv file,
+    which is written alongside it.
+
+    Args:
+        path (str): Path to csv file.
+
+    Returns:
+        cache (str): Path to the binary cache.
+    """
+
+    return f'{ path }.cache'
+
+# ----------
+
+def ft_digest(path: str) -> str:
+
+    """
+    Computes the content hash (SHA-256) of a file, reading it by blocks.
+
+    Args:
+        path (str): Path to the file.
+
+    Returns:
+        digest (str): Hexadecimal content hash of the file.
+    """
+
+    digest = hashlib.sha256()
+
+    with open(path, 'rb') as file:
+        while block := file.read(1 << 20):
+            digest.update(block)
+    return digest.hexdigest()
+
+# ----------
+
+def ft_key(path: str) -> dict:
+
+    """
+    Returns what a binary cache is keyed on: absolute path,
+    size, modification time and content hash of the csv file.
+
+    Args:
+        path (str): Path to csv file.
+
+    Returns:
+        key (dict): Dictionary containing path, size, mtime_ns and hash of the csv file.
+    """
+
+    stat: os.stat_result = os.stat(path)
+    return {'path': os.path.abspath(path), 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'hash': ft_digest(path)}
+
+# ----------
+
+def ft_cache_write(path: str, x_km: numpy.ndarray, y_price: numpy.ndarray, key: dict) -> None:
+
+    """
+    Writes the binary cache of a csv file: a magic line, a JSON header
+    (key of the csv file, row count, columns and type) padded so that
+    data is aligned, then each column as raw little-endian float64.
+    The cache is written to a temporary file, flushed to disk, then
+    renamed, so neither a reader nor a crash ever leaves a partial cache.
+
+    Args:
+        path (str): Path to csv file.
+        x_km (numpy.ndarray): Array of mileage values.
+        y_price (numpy.ndarray): Array of corresponding price values.
+        key (dict): Key of the csv file returned by ft_key.
+
+    Returns:
+        None
+    """
+
+    cache: str = ft_cache_path(path)
+    header: bytes = json.dumps({**key, 'version': CACHE_VERSION, 'rows': len(x_km), 'columns': CACHE_COLUMNS, 'dtype': CACHE_DTYPE}).encode()
+    header += b' ' * (-(len(CACHE_MAGIC) + len(header) + 1) % CACHE_ALIGN) + b'\n'
+
+    with open(f'{ cache }.tmp', 'wb') as file:
+        file.write(CACHE_MAGIC + header)
+        for column in (x_km, y_price):
+            file.write(numpy.ascontiguousarray(column, dtype=CACHE_DTYPE).tobytes())
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(f'{ cache }.tmp', cache)
+    ft_fsync_directory(os.path.dirname(cache))
+
+# ----------
+
+def ft_cache_header(cache: str) -> tuple:
+
+    """
+    Reads the header of a binary cache.
+
+    Args:
+        cache (str): Path to the binary cache.
+
+    Returns:
+        header (tuple): Header of the cache and offset of its data (None if missing or corrupted).
+    """
+
+    try:
+
+        with open(cache, 'rb') as file:
+            if file.readline() != CACHE_MAGIC: return None
+            header: dict = json.loads(file.readline())
+            offset: int = file.tell()
+        if header.get('version') != CACHE_VERSION or tuple(header.get('columns', ())) != CACHE_COLUMNS: return None
+        if os.path.getsize(cache) != offset + header['rows'] * len(CACHE_COLUMNS) * numpy.dtype(CACHE_DTYPE).itemsize: return None
+        return header, offset
+
+    except (OSError, ValueError, KeyError): return None
+
+# ----------
+
+def ft_cache_read(path: str) -> tuple:
+
+    """
+    Opens the binary cache of a csv file with memory mapping, if it is
+    still fresh: same path and size, and same modification time or else
+    same content hash (the cache is then re-keyed with the new time).
+    Data is neither parsed nor validated again, it was when the cache
+    was written; the csv file must still be a readable csv file though,
+    otherwise the cache is not used and ft_load reports the error.
+
+    Args:
+        path (str): Path to csv file.
+
+    Returns:
+        data (tuple): Read-only arrays of mileage and price values (None if missing or stale).
+    """
+
+    cache: str = ft_cache_path(path)
+    found: tuple = ft_cache_header(cache)
+
+    if found is None or not path.endswith('.csv'): return None
+    header, offset = found
+    try:
+        with open(path, 'rb') as file: stat: os.stat_result = os.fstat(file.fileno())
+    except OSError: return None
+    if header['path'] != os.path.abspath(path) or header['size'] != stat.st_size: return None
+    data: numpy.memmap = numpy.memmap(cache, dtype=CACHE_DTYPE, mode='r', offset=offset, shape=(len(CACHE_COLUMNS), header['rows']))
+    if header['mtime_ns'] != stat.st_mtime_ns:
+        key: dict = ft_key(path)
+        if key['hash'] != header['hash']: return None
+        try: ft_cache_write(path, data[0], data[1], key)
+        except OSError: pass
+    return data[0], data[1]
+
+# ----------
+
+def ft_cache_invalidate(path: str) -> bool:
+
+    """
+    Deletes the binary cache of a csv file.
+
+    Args:
+        path (str): Path to csv file.
+
+    Returns:
+        deleted (bool): True if there was a cache to delete.
+    """
+
+    try:
+        os.remove(ft_cache_path(path))
+        return True
+    except FileNotFoundError: return False
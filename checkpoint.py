@@ -0,0 +1,198 @@
+# Imports
+# -------
+
+from __future__ import annotations
+import time, json, array
+from registry import ft_fsync_directory
+from shards import Shards
+from train import History, Convergence
+from tools import *
+
+
+# Globals
+# -------
+
+CHECKPOINT_MAGIC = b'FTCHECKPOINT\n'
+CHECKPOINT_VERSION = 1
+CHECKPOINT_EVERY = 10000
+CHECKPOINT_SECONDS = 60.0
+CHECKPOINT_TYPES = {'iteration': 'q', 'theta0': 'd', 'theta1': 'd', 'loss': 'd'}
+PATH_CHECKPOINT = './DataSets/checkpoint.bin'
+
+
+# Functions
+# ---------
+
+def ft_fingerprint(*paths: str) -> list:
+
+    """
+    Returns what tells whether a run is resumed on the same data:
+    absolute path, size and modification time of each file read,
+    in the order their rows are trained on (e.g. the new rows, then
+    the -full rows of a warm start).
+
+    Args:
+        paths (str): Paths to csv files, or Shards (None ones are left out).
+
+    Returns:
+        fingerprint (list): List of [path, size, mtime_ns] of each file.
+    """
+
+    fingerprint: list = []
+
+    for path in filter(None, paths):
+        for file in (path.files if isinstance(path, Shards) else [path]):
+            stat: os.stat_result = os.stat(file)
+            fingerprint.append([os.path.abspath(file), stat.st_size, stat.st_mtime_ns])
+    return fingerprint
+
+# ----------
+
+def ft_checkpoint_read(path: str = PATH_CHECKPOINT) -> dict:
+
+    """
+    Reads a checkpoint written by Checkpoint.save.
+
+    Args:
+        path (str): Path to the checkpoint (default: 'checkpoint.bin').
+
+    Returns:
+        state (dict): Context of the run (data, scalers, settings), and thetas, loss, learning rate, iteration,
+            elapsed time and History of the run at the checkpoint.
+    """
+
+    try:
+
+        with open(path, 'rb') as file:
+            if file.readline() != CHECKPOINT_MAGIC: raise ValueError
+            state: dict = json.loads(file.readline())
+            if state.get('version') != CHECKPOINT_VERSION: raise ValueError
+            history: History = History(state['history']['mode'], state['history']['step'], state['history']['size'])
+            history.count = state['history']['count']
+            for key, kind in CHECKPOINT_TYPES.items():
+                history.arrays[key] = array.array(kind)
+                history.arrays[key].frombytes(file.read(state['history']['length'] * history.arrays[key].itemsize))
+                if len(history.arrays[key]) != state['history']['length']: raise ValueError
+        state['history'] = history
+        return state
+
+    except FileNotFoundError: raise Exception(f'Checkpoint { path } not found, nothing to resume.')
+    except (ValueError, KeyError, TypeError): raise Exception(f'Checkpoint { path } is corrupted.')
+
+# ----------
+
+def ft_checkpoint_restore(state: dict) -> tuple:
+
+    """
+    Rebuilds the convergence controller and the history of a run
+    as they were at a checkpoint, so that it goes on exactly as if it
+    had never stopped.
+
+    Args:
+        state (dict): State returned by ft_checkpoint_read.
+
+    Returns:
+        run (tuple): Convergence controller and History of the run.
+    """
+
+    controller: Convergence = Convergence(state['learning_rate'], state['tolerance'], state['iterations'])
+    controller.iteration = state['iteration']
+    controller.start = time.perf_counter() - state['elapsed']
+    return controller, state['history']
+
+
+# Classes
+# -------
+
+class Checkpoint:
+
+    """
+    Periodic checkpoint of a gradient descent run: every N iterations
+    or T seconds (whichever comes first), the engine saves the thetas,
+    loss, learning rate, iteration and history of the run, along with
+    its context (scalers, settings, data), in a compact binary file:
+    a magic line, a JSON header, then the raw typed arrays of the history.
+    The file is written to a temporary file then renamed, so a run
+    killed while saving leaves the previous checkpoint intact.
+    """
+
+    def __init__(self, path: str = PATH_CHECKPOINT, every: int = CHECKPOINT_EVERY, seconds: float = CHECKPOINT_SECONDS) -> None:
+
+        """
+        Args:
+            path (str): Path to the checkpoint (default: 'checkpoint.bin').
+            every (int): Number of iterations between checkpoints, 0 to disable (default: 10000).
+            seconds (float): Number of seconds between checkpoints, 0 to disable (default: 60).
+        """
+
+        self.path: str = path
+        self.every: int = every
+        self.seconds: float = seconds
+        self.context: dict = {}
+        self.last: float = time.monotonic()
+        self.saved: int = 0
+
+    def due(self, iteration: int) -> bool:
+
+        """
+        Tells whether a checkpoint is due at an iteration.
+
+        Args:
+            iteration (int): Iteration of the run.
+
+        Returns:
+            due (bool): True if a checkpoint must be saved.
+        """
+
+        return (self.every > 0 and iteration % self.every == 0) or (self.seconds > 0 and time.monotonic() - self.last >= self.seconds)
+
+    def save(self, thetas: list, loss: float, controller: Convergence, history: History) -> None:
+
+        """
+        Saves the state of a run.
+
+        Args:
+            thetas (list): Current theta0 and theta1.
+            loss (float): Loss of the current thetas.
+            controller (Convergence): Convergence controller of the run.
+            history (History): Recorder of the history of the run.
+
+        Returns:
+            None
+        """
+
+        length: int = len(history.arrays['iteration'])
+        state: dict = {
+            **self.context,
+            'version': CHECKPOINT_VERSION,
+            'thetas': [float(theta) for theta in thetas],
+            'loss': float(loss),
+            'learning_rate': controller.learning_rate,
+            'tolerance': controller.tolerance,
+            'iterations': controller.iterations,
+            'iteration': controller.iteration,
+            'elapsed': time.perf_counter() - controller.start,
+            'history': {'mode': history.mode, 'step': history.step, 'size': history.size, 'count': history.count, 'length': length},
+        }
+
+        with open(f'{ self.path }.tmp', 'wb') as file:
+            file.write(CHECKPOINT_MAGIC + json.dumps(state).encode() + b'\n')
+            for key in CHECKPOINT_TYPES: file.write(history.arrays[key].tobytes())
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(f'{ self.path }.tmp', self.path)
+        ft_fsync_directory(os.path.dirname(self.path))
+        self.last = time.monotonic()
+        self.saved += 1
+
+    def remove(self) -> None:
+
+        """
+        Deletes the checkpoint, once the run it belongs to is saved.
+
+        Returns:
+            None
+        """
+
+        try: os.remove(self.path)
+        except FileNotFoundError: pass
@@ -0,0 +1,453 @@
+# Imports
+# -------
+
+from __future__ import annotations
+import json, concurrent.futures
+from train import ft_dataset, ft_chunks, ft_moments, ft_merge, ft_solve, ft_train_vectorized, History, Convergence
+from tools import *
+
+
+# Globals
+# -------
+
+FOLDS = 5
+PATH_EVALUATION = './DataSets/evaluation.json'
+METRICS = ('mae', 'rmse', 'r2', 'max_error')
+HASH_SPREAD = numpy.uint64(0x9E3779B97F4A7C15)
+HASH_FIRST = numpy.uint64(0xBF58476D1CE4E5B9)
+HASH_SECOND = numpy.uint64(0x94D049BB133111EB)
+HASH_SCALE = float(2 ** 64)
+
+
+# Functions
+# ---------
+
+def ft_hash(indices: numpy.ndarray, seed: int = SEED) -> numpy.ndarray:
+
+    """
+    Hashes row indices with a seeded splitmix64, a bijection of 64-bit
+    integers: different rows never get the same hash.
+
+    Args:
+        indices (numpy.ndarray): Array of row indices.
+        seed (int): Seed of the hash (default: 42).
+
+    Returns:
+        hashed (numpy.ndarray): Array of 64-bit hashes.
+    """
+
+    hashed: numpy.ndarray = (indices.astype(numpy.uint64) + numpy.uint64(seed)) * HASH_SPREAD
+    hashed = (hashed ^ (hashed >> numpy.uint64(30))) * HASH_FIRST
+    hashed = (hashed ^ (hashed >> numpy.uint64(27))) * HASH_SECOND
+    return hashed ^ (hashed >> numpy.uint64(31))
+
+# ----------
+
+def ft_assign(start: int, length: int, folds: int = FOLDS, holdout: float = None, seed: int = SEED) -> numpy.ndarray:
+
+    """
+    Assigns rows to the validation splits from their index in the csv
+    file, with a seeded hash (see ft_hash) instead of a shuffle: the same
+    row always lands in the same split, whatever the chunk it is read in,
+    so splits can be streamed and every worker agrees on them.
+    For k-fold, rows are taken by blocks of k consecutive rows and the
+    rows of each block are dealt to the k folds in the order of their
+    hashes, so fold sizes differ by one row at most.
+
+    Args:
+        start (int): Index of the first row.
+        length (int): Number of rows.
+        folds (int): Number of folds of k-fold cross-validation (default: 5).
+        holdout (float): Fraction of rows held out for validation instead of k-fold (default: None).
+        seed (int): Seed of the assignment (default: 42).
+
+    Returns:
+        labels (numpy.ndarray): Split validating each row, -1 for rows used for training only.
+    """
+
+    if holdout is not None: return numpy.where(ft_hash(numpy.arange(start, start + length), seed) / HASH_SCALE < holdout, 0, -1)
+    first: int = start - start % folds
+    last: int = start + length + (-(start + length) % folds)
+    blocks: numpy.ndarray = ft_hash(numpy.arange(first, last), seed).reshape(-1, folds)
+    ranks: numpy.ndarray = blocks.argsort(axis=1).argsort(axis=1).ravel()
+    return ranks[start - first:start - first + length].astype(numpy.int64)
+
+# ----------
+
+def ft_check(rows: int, validation: dict) -> None:
+
+    """
+    Checks the sizes of the splits before any model is trained: each
+    split must validate at least one row and train on at least two.
+
+    Args:
+        rows (int): Number of rows of the data.
+        validation (dict): Dictionary mapping each split to its number of validation rows.
+
+    Returns:
+        None
+    """
+
+    for split, count in validation.items():
+        if count == 0: raise Exception(f'Validation split { split } is empty ({ rows } rows for { len(validation) } split(s)), use fewer folds or a larger holdout.')
+        if rows - count < 2: raise Exception(f'Split { split } has not enought training data.')
+
+# ----------
+
+def ft_fit_split(task: tuple) -> tuple:
+
+    """
+    Trains the model of a single split with gradient descent, on its
+    training rows only, in a worker process of ft_fit_gradient.
+    The data is memory mapped from the binary cache, so workers share it.
+
+    Args:
+        task (tuple): Path to csv file, split, folds, holdout, seed and settings (learning rate, tolerance, maximum iterations) of the controller.
+
+    Returns:
+        result (tuple): Split, coefficients in raw space and number of training rows.
+    """
+
+    path, split, folds, holdout, seed, settings = task
+    x_km, y_price = ft_dataset(path, output=False)
+    training: numpy.ndarray = ft_assign(0, len(x_km), folds, holdout, seed) != split
+    x_km, y_price = numpy.asarray(x_km)[training], numpy.asarray(y_price)[training]
+    scalers: dict = {'km': Scaler().fit(x_km), 'price': Scaler().fit(y_price)}
+
+    if len(x_km) < 2: raise Exception(f'Split { split } has not enought training data.')
+    if scalers['km'].minimum == scalers['km'].maximum or scalers['price'].minimum == scalers['price'].maximum:
+        raise Exception(f'Split { split } is corrupted, constant column(s) cannot be normalized.')
+    histories: dict = ft_train_vectorized(scalers['km'].transform(x_km), scalers['price'].transform(y_price), False, Convergence(*settings), History('off'))
+    return split, ft_fold((histories['theta0'][-1], histories['theta1'][-1]), scalers), len(x_km)
+
+# ----------
+
+def ft_fit_gradient(path: str, splits: list, folds: int, holdout: float, seed: int, controller: Convergence, workers: int = None) -> dict:
+
+    """
+    Trains the model of every split with gradient descent, spreading
+    the splits across a pool of worker processes. The binary cache is
+    written beforehand, so that workers only memory map it, and the
+    sizes of the splits are checked before any of them is trained.
+
+    Args:
+        path (str): Path to csv file.
+        splits (list): Splits to train a model for.
+        folds (int): Number of folds.
+        holdout (float): Fraction of rows held out for validation (None for k-fold).
+        seed (int): Seed of the assignment.
+        controller (Convergence): Controller whose settings are used for every split.
+        workers (int): Number of worker processes (default: number of CPUs).
+
+    Returns:
+        models (dict): Dictionary mapping each split to its coefficients and number of training rows.
+    """
+
+    settings: tuple = (controller.learning_rate, controller.tolerance, controller.iterations)
+    workers = min(workers or os.cpu_count() or 1, len(splits))
+    models: dict = {}
+
+    assigned: numpy.ndarray = ft_assign(0, len(ft_dataset(path, output=False)[0]), folds, holdout, seed)
+    ft_check(len(assigned), {split: int((assigned == split).sum()) for split in splits})
+    print(message(f'1. Training { len(splits) } models across { workers } processes...'), end='\r')
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+        for split, coefficients, rows in pool.map(ft_fit_split, [(path, split, folds, holdout, seed, settings) for split in splits]):
+            models[split] = (coefficients, rows)
+    print(message(f'1. Training { len(splits) } models across { workers } processes... Done √'))
+    return models
+
+# ----------
+
+def ft_fit_exact(path: str, splits: list, folds: int, holdout: float, seed: int, chunksize: int = CHUNK_SIZE) -> dict:
+
+    """
+    Trains the model of every split with the exact solver, in a single
+    streaming pass: the sufficient statistics of each split are
+    accumulated separately, then those of its training rows are merged
+    (every split but itself), so no split is ever loaded in memory.
+    The sizes of the splits are checked before any of them is solved.
+
+    Args:
+        path (str): Path to csv file.
+        splits (list): Splits to train a model for.
+        folds (int): Number of folds.
+        holdout (float): Fraction of rows held out for validation (None for k-fold).
+        seed (int): Seed of the assignment.
+        chunksize (int): Number of rows per chunk (default: 100000).
+
+    Returns:
+        models (dict): Dictionary mapping each split to its coefficients and number of training rows.
+    """
+
+    labels: list = [-1] + list(splits) if holdout is not None else list(splits)
+    statistics: dict = {label: {'rows': 0} for label in labels}
+    models: dict = {}
+    start: int = 0
+
+    print(message(f'1. Accumulating statistics of { len(splits) } splits...'), end='\r')
+    for x_km, y_price in ft_chunks(path, chunksize):
+        assigned: numpy.ndarray = ft_assign(start, len(x_km), folds, holdout, seed)
+        start += len(x_km)
+        for label in labels:
+            rows: numpy.ndarray = assigned == label
+            if rows.any(): statistics[label] = ft_merge(statistics[label], ft_moments(x_km[rows], y_price[rows]))
+    ft_check(start, {split: statistics[split]['rows'] for split in splits})
+    for split in splits:
+        training: dict = {'rows': 0}
+        for label in labels:
+            if label != split: training = ft_merge(training, statistics[label])
+        if training['rows'] < 2: raise Exception(f'Split { split } has not enought training data.')
+        solved: dict = ft_solve(training, False)
+        scalers: dict = {'km': Scaler(training['km_min'], training['km_max']), 'price': Scaler(training['price_min'], training['price_max'])}
+        models[split] = (ft_fold((solved['theta0'][-1], solved['theta1'][-1]), scalers), training['rows'])
+    print(message(f'1. Accumulating statistics of { len(splits) } splits... Done √'))
+    return models
+
+# ----------
+
+def ft_errors(x_km: numpy.ndarray, y_price: numpy.ndarray, coefficients: tuple) -> dict:
+
+    """
+    Computes the error sums of a model on a set of data points,
+    to be merged with others by ft_combine.
+
+    Args:
+        x_km (numpy.ndarray): Array of mileage values (not empty).
+        y_price (numpy.ndarray): Array of corresponding price values.
+        coefficients (tuple): Intercept and slope in raw km -> price space.
+
+    Returns:
+        errors (dict): Row count, sums of absolute and squared errors, maximum error, mean and sum of squared deviations of prices.
+    """
+
+    residuals: numpy.ndarray = y_price - (coefficients[0] + coefficients[1] * x_km)
+    deviations: numpy.ndarray = y_price - y_price.mean()
+    return {
+        'rows': len(x_km),
+        'absolute': float(numpy.abs(residuals).sum()),
+        'squared': float(residuals.dot(residuals)),
+        'maximum': float(numpy.abs(residuals).max()),
+        'mean': float(y_price.mean()),
+        'm2': float(deviations.dot(deviations)),
+    }
+
+# ----------
+
+def ft_combine(first: dict, second: dict) -> dict:
+
+    """
+    Merges the error sums of two sets of data points. The spread of
+    prices, needed by R², is merged like in ft_merge (Chan et al.).
+
+    Args:
+        first (dict): Errors of the first set of data points.
+        second (dict): Errors of the second set of data points.
+
+    Returns:
+        errors (dict): Errors of both sets of data points.
+    """
+
+    rows: int = first['rows'] + second['rows']
+
+    if first['rows'] == 0: return dict(second)
+    if second['rows'] == 0: return dict(first)
+    delta: float = second['mean'] - first['mean']
+    return {
+        'rows': rows,
+        'absolute': first['absolute'] + second['absolute'],
+        'squared': first['squared'] + second['squared'],
+        'maximum': max(first['maximum'], second['maximum']),
+        'mean': first['mean'] + delta * second['rows'] / rows,
+        'm2': first['m2'] + second['m2'] + delta * delta * first['rows'] * second['rows'] / rows,
+    }
+
+# ----------
+
+def ft_score(path: str, models: dict, folds: int, holdout: float, seed: int, chunksize: int = CHUNK_SIZE) -> dict:
+
+    """
+    Measures every model on its validation split, in a single streaming
+    pass over the csv file: each row only updates the error sums of
+    the split it validates.
+
+    Args:
+        path (str): Path to csv file.
+        models (dict): Dictionary mapping each split to its coefficients and number of training rows.
+        folds (int): Number of folds.
+        holdout (float): Fraction of rows held out for validation (None for k-fold).
+        seed (int): Seed of the assignment.
+        chunksize (int): Number of rows per chunk (default: 100000).
+
+    Returns:
+        errors (dict): Dictionary mapping each split to its error sums.
+    """
+
+    errors: dict = {split: {'rows': 0} for split in models}
+    start: int = 0
+
+    print(message(f'2. Validating { len(models) } models...'), end='\r')
+    for x_km, y_price in ft_chunks(path, chunksize):
+        assigned: numpy.ndarray = ft_assign(start, len(x_km), folds, holdout, seed)
+        start += len(x_km)
+        for split, (coefficients, _) in models.items():
+            rows: numpy.ndarray = assigned == split
+            if rows.any(): errors[split] = ft_combine(errors[split], ft_errors(x_km[rows], y_price[rows], coefficients))
+    print(message(f'2. Validating { len(models) } models... Done √'))
+    return errors
+
+# ----------
+
+def ft_metrics(errors: dict) -> dict:
+
+    """
+    Turns the error sums of a validation split into metrics.
+
+    Args:
+        errors (dict): Error sums returned by ft_score.
+
+    Returns:
+        metrics (dict): Mean absolute error, root mean squared error, R² (None for constant prices) and maximum error.
+    """
+
+    if errors['rows'] == 0: raise Exception('A validation split is empty, use fewer folds or a larger holdout.')
+    return {
+        'mae': errors['absolute'] / errors['rows'],
+        'rmse': math.sqrt(errors['squared'] / errors['rows']),
+        'r2': 1 - errors['squared'] / errors['m2'] if errors['m2'] > 0 else None,
+        'max_error': errors['maximum'],
+    }
+
+# ----------
+
+def ft_evaluate(path: str = PATH_DATA, folds: int = FOLDS, holdout: float = None, solver: str = SOLVER, seed: int = SEED, controller: Convergence = None, workers: int = None, chunksize: int = CHUNK_SIZE) -> dict:
+
+    """
+    Cross-validates the model: rows are split into k folds (or a
+    holdout split), a model is trained on the training rows of each
+    split, then measured on its validation rows only.
+
+    Args:
+        path (str): Path to csv file (default: 'data.csv').
+        folds (int): Number of folds of k-fold cross-validation (default: 5).
+        holdout (float): Fraction of rows held out for validation instead of k-fold (default: None).
+        solver (str): Solver, 'gradient' or 'exact' (default: 'gradient').
+        seed (int): Seed of the assignment of rows to splits (default: 42).
+        controller (Convergence): Controller of gradient descent (default: Convergence()).
+        workers (int): Number of worker processes of the gradient solver (default: number of CPUs).
+        chunksize (int): Number of rows per chunk (default: 100000).
+
+    Returns:
+        evaluation (dict): Settings, metrics of every split and their mean, standard deviation and number of splits they are computed over.
+    """
+
+    splits: list = [0] if holdout is not None else list(range(folds))
+
+    if solver == 'exact': models: dict = ft_fit_exact(path, splits, folds, holdout, seed, chunksize)
+    else: models = ft_fit_gradient(path, splits, folds, holdout, seed, controller or Convergence(), workers)
+    errors: dict = ft_score(path, models, folds, holdout, seed, chunksize)
+    results: list = [{'split': split, 'training_rows': models[split][1], 'validation_rows': errors[split]['rows'], **ft_metrics(errors[split])} for split in splits]
+    summary: dict = {}
+    for metric in METRICS:
+        values: list = [result[metric] for result in results if result[metric] is not None]
+        summary[metric] = {'mean': float(numpy.mean(values)), 'std': float(numpy.std(values)), 'splits': len(values)} if values else None
+    return {
+        'path': path,
+        'method': 'holdout' if holdout is not None else 'kfold',
+        'folds': None if holdout is not None else folds,
+        'holdout': holdout,
+        'solver': solver,
+        'seed': seed,
+        'splits': results,
+        'summary': summary,
+    }
+
+# ----------
+
+def ft_table(evaluation: dict) -> None:
+
+    """
+    Outputs the metrics of a cross-validation as a table, with the
+    number of splits each mean is computed over (R² is undefined on a
+    split of constant prices, which is left out).
+
+    Args:
+        evaluation (dict): Evaluation returned by ft_evaluate.
+
+    Returns:
+        None
+    """
+
+    cell = lambda value: f'{ value:>12.4f}' if value is not None else f'{ "-":>12}'
+
+    print(message(f'\n{ "split":>8} { "train":>10} { "valid":>10} { "mae":>12} { "rmse":>12} { "r2":>12} { "max error":>12}'))
+    for result in evaluation['splits']:
+        print(message(f'{ result["split"]:>8} { result["training_rows"]:>10} { result["validation_rows"]:>10} ' + ' '.join(cell(result[metric]) for metric in METRICS)))
+    if len(evaluation['splits']) > 1:
+        summary: dict = evaluation['summary']
+        print(message(f'{ "mean":>8} { "":>10} { "":>10} ' + ' '.join(cell(summary[metric] and summary[metric]['mean']) for metric in METRICS)))
+        print(message(f'{ "std":>8} { "":>10} { "":>10} ' + ' '.join(cell(summary[metric] and summary[metric]['std']) for metric in METRICS)))
+        print(message(f'{ "splits":>8} { "":>10} { "":>10} ' + ' '.join(f'{ summary[metric]["splits"] if summary[metric] else 0:>12}' for metric in METRICS)))
+
+
+# Main function
+# -------------
+
+def ft_main(args: list) -> None:
+
+    """
+        Main function.
+
+        Args:
+            args (list): List of arguments that can be either:
+                path (str): Optional argument to specify path to csv file (default: 'data.csv').
+                -folds (int): Optional number of folds of k-fold cross-validation (default: 5).
+                -holdout (float): Optional fraction of rows held out for validation, instead of k-fold (default: None).
+                -solver (str): Optional solver, 'gradient' or 'exact', the latter streaming files too large to load (default: 'gradient').
+                -seed (int): Optional seed of the assignment of rows to splits (default: 42).
+                -workers (int): Optional number of worker processes of the gradient solver (default: number of CPUs).
+                -chunk (int): Optional number of rows per chunk (default: 100000).
+                -tolerance (float): Optional tolerance on the relative improvement of the loss and the gradient norm (default: 1e-14).
+                -iterations (int): Optional maximum number of gradient descent iterations (default: 100000).
+                -json (str): Optional json file receiving the results (default: 'evaluation.json').
+
+        Returns:
+            None
+    """
+
+    folds: int = ft_option(args, '-folds', FOLDS, int)
+    holdout: float = ft_option(args, '-holdout', None, float)
+    solver: str = ft_option(args, '-solver', SOLVER)
+    seed: int = ft_option(args, '-seed', SEED, int)
+    workers: int = ft_option(args, '-workers', None, int)
+    chunksize: int = ft_option(args, '-chunk', CHUNK_SIZE, int)
+    controller: Convergence = Convergence(LEARNING_RATE, ft_option(args, '-tolerance', TOLERANCE, float), ft_option(args, '-iterations', MAX_ITERATIONS, int))
+    target: str = ft_option(args, '-json', PATH_EVALUATION)
+    path: str = args.pop(0) if len(args) > 0 else PATH_DATA
+
+    if len(args) > 0: raise Exception(f"Unknown argument(s): { ' '.join(args) }.")
+    if folds < 2: raise Exception('Number of folds must be at least 2.')
+    if holdout is not None and not 0 < holdout < 1: raise Exception('Holdout fraction must be between 0 and 1 (excluded).')
+    if solver not in SOLVERS: raise Exception(f"Unknown solver '{ solver }', must be one of: { ', '.join(SOLVERS) }.")
+    if seed < 0: raise Exception('Seed cannot be negative.')
+    if (workers is not None and workers < 1) or chunksize < 1: raise Exception('Number of worker processes and chunk size must be positive.')
+    if controller.tolerance < 0 or controller.iterations < 1: raise Exception('Tolerance cannot be negative and the maximum number of iterations must be positive.')
+    evaluation: dict = ft_evaluate(path, folds, holdout, solver, seed, controller, workers, chunksize)
+    ft_table(evaluation)
+    with open(target, 'w') as file: json.dump(evaluation, file, indent=4)
+    print(message(f'\nResults saved to { target } √'))
+
+
+# Main
+# ----
+
+if __name__ == '__main__':
+
+    try:
+        print(header(f'-------------------------- CROSS-VALIDATION --------------------------\n'))
+        ft_main(sys.argv[1:])
+        sys.exit(0)
+
+    except (KeyboardInterrupt, EOFError): print(error('[ WARNING ]: Program interrupted by user.'))
+    except Exception as exc:
+        print(error(f'[ ERROR ]: { exc }'))
+        sys.exit(1)
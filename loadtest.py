@@ -0,0 +1,141 @@
+# Imports
+# -------
+
+from __future__ import annotations
+import asyncio, time
+from server import HOST, PORT
+from tools import *
+
+
+# Globals
+# -------
+
+REQUESTS = 10000
+CONCURRENCY = 8
+
+
+# Functions
+# ---------
+
+async def ft_connection(host: str, port: int, socket: str, requests: int, batch: int, latencies: list) -> None:
+
+    """
+    Opens one connection to the prediction server and sends requests
+    one after the other, recording the latency of each of them.
+
+    Args:
+        host (str): Host of the server.
+        port (int): TCP port of the server.
+        socket (str): Path of the Unix socket of the server (None for TCP).
+        requests (int): Number of requests to send.
+        batch (int): Number of mileages per request, 0 for plain single-mileage requests.
+        latencies (list): List receiving the latency of each request (in seconds).
+
+    Returns:
+        None
+    """
+
+    if socket is not None: reader, writer = await asyncio.open_unix_connection(socket)
+    else: reader, writer = await asyncio.open_connection(host, port)
+    generator: numpy.random.Generator = numpy.random.default_rng(SEED)
+
+    for _ in range(requests):
+        if batch: line: str = '{"km": [' + ', '.join(str(km) for km in generator.integers(0, 250000, batch)) + ']}\n'
+        else: line = f'{ generator.integers(0, 250000) }\n'
+        start: float = time.perf_counter()
+        writer.write(line.encode())
+        answer: bytes = await reader.readline()
+        latencies.append(time.perf_counter() - start)
+        if not answer or b'error' in answer: raise Exception(f'Server answered { answer.decode().strip() or "nothing" }.')
+    writer.close()
+    await writer.wait_closed()
+
+# ----------
+
+async def ft_loadtest(host: str = HOST, port: int = PORT, socket: str = None, requests: int = REQUESTS, concurrency: int = CONCURRENCY, batch: int = 0) -> dict:
+
+    """
+    Load-tests the prediction server with concurrent connections
+    and reports the latency percentiles and the throughput.
+
+    Args:
+        host (str): Host of the server (default: '127.0.0.1').
+        port (int): TCP port of the server (default: 4242).
+        socket (str): Path of the Unix socket of the server (default: None).
+        requests (int): Total number of requests to send (default: 10000).
+        concurrency (int): Number of concurrent connections (default: 8).
+        batch (int): Number of mileages per request, 0 for plain requests (default: 0).
+
+    Returns:
+        report (dict): Dictionary containing the p50 and p99 latencies (in µs) and the requests per second.
+    """
+
+    latencies: list = []
+    shares: list = [requests // concurrency + (index < requests % concurrency) for index in range(concurrency)]
+
+    start: float = time.perf_counter()
+    await asyncio.gather(*(ft_connection(host, port, socket, share, batch, latencies) for share in shares))
+    elapsed: float = time.perf_counter() - start
+    return {
+        'requests': len(latencies),
+        'p50': float(numpy.percentile(latencies, 50)) * 1e6,
+        'p99': float(numpy.percentile(latencies, 99)) * 1e6,
+        'rps': len(latencies) / elapsed,
+    }
+
+
+# Main function
+# -------------
+
+def ft_main(args: list) -> None:
+
+    """
+        Main function.
+
+        Args:
+            args (list): List of arguments that can be either:
+                -host (str): Optional host of the server (default: '127.0.0.1').
+                -port (int): Optional TCP port of the server (default: 4242).
+                -socket (str): Optional Unix socket of the server instead of TCP (default: None).
+                -requests (int): Optional total number of requests (default: 10000).
+                -concurrency (int): Optional number of concurrent connections (default: 8).
+                -batch (int): Optional number of mileages per request, 0 for plain requests (default: 0).
+
+        Returns:
+            None
+    """
+
+    host: str = ft_option(args, '-host', HOST)
+    port: int = ft_option(args, '-port', PORT, int)
+    socket: str = ft_option(args, '-socket')
+    requests: int = ft_option(args, '-requests', REQUESTS, int)
+    concurrency: int = ft_option(args, '-concurrency', CONCURRENCY, int)
+    batch: int = ft_option(args, '-batch', 0, int)
+
+    if len(args) > 0: raise Exception(f"Unknown argument(s): { ' '.join(args) }.")
+    if requests < 1 or concurrency < 1 or batch < 0: raise Exception('Requests and concurrency must be positive, batch cannot be negative.')
+    print(message(f'Sending { requests } requests over { concurrency } connection(s)...'), end='\r')
+    report: dict = asyncio.run(ft_loadtest(host, port, socket, requests, concurrency, batch))
+    print(message(f'Sending { requests } requests over { concurrency } connection(s)... Done √'))
+    print(message(f'\n   - p50 latency: { report["p50"]:.1f} µs'))
+    print(message(f'   - p99 latency: { report["p99"]:.1f} µs'))
+    print(message(f'   - Throughput: { report["rps"]:.0f} requests/s'))
+
+
+# Main
+# ----
+
+if __name__ == '__main__':
+
+    try:
+        print(header(f'---------------------------- LOAD TEST ----------------------------\n'))
+        ft_main(sys.argv[1:])
+        sys.exit(0)
+
+    except (KeyboardInterrupt, EOFError): print(error('[ WARNING ]: Program interrupted by user.'))
+    except ConnectionError:
+        print(error('[ ERROR ]: Cannot reach the prediction server, start it beforehand (python3 server.py).'))
+        sys.exit(1)
+    except Exception as exc:
+        print(error(f'[ ERROR ]: { exc }'))
+        sys.exit(1)
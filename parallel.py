@@ -0,0 +1,192 @@
+# Imports
+# -------
+
+from __future__ import annotations
+import time, multiprocessing
+from multiprocessing import shared_memory
+from train import ft_residuals, History, Convergence
+from tools import *
+
+
+# Globals
+# -------
+
+PARALLEL_TIMEOUT = 600.0
+PARALLEL_POLL = 0.1
+PARALLEL_BLOCK = 65536
+PARALLEL_SUMS = 3
+PARALLEL_RUN = 1.0
+PARALLEL_STOP = 0.0
+
+
+# Functions
+# ---------
+
+def ft_shard_worker(data: str, control: str, rows: int, workers: int, index: int, start: multiprocessing.Semaphore, done: multiprocessing.Semaphore, parent: int) -> None:
+
+    """
+    Worker process of ft_train_parallel, owning one shard of the data.
+    Both the data and the control block live in shared memory: on each
+    iteration, the worker reads the candidate thetas from the control
+    block, computes the residuals of its shard and writes their sums
+    (residuals, residuals times km, squared residuals) block by block
+    into the slots of its blocks.
+    Nothing is copied nor pickled between iterations, semaphores only
+    tell when thetas are ready and when sums were written. The worker
+    exits if the coordinator dies.
+
+    Args:
+        data (str): Name of the shared memory holding the normalized km and price arrays.
+        control (str): Name of the shared memory holding the thetas, the command and the sums of every block.
+        rows (int): Number of rows of the data.
+        workers (int): Number of workers.
+        index (int): Index of the worker, which owns the index-th shard of blocks.
+        start (multiprocessing.Semaphore): Semaphore of the worker, released once the thetas of an iteration are written.
+        done (multiprocessing.Semaphore): Semaphore released by each worker once its sums are written.
+        parent (int): Process id of the coordinator.
+
+    Returns:
+        None
+    """
+
+    memory: shared_memory.SharedMemory = shared_memory.SharedMemory(name=data)
+    block: shared_memory.SharedMemory = shared_memory.SharedMemory(name=control)
+    arrays: numpy.ndarray = None
+    board: numpy.ndarray = None
+    x: numpy.ndarray = None
+    y: numpy.ndarray = None
+    sums: numpy.ndarray = None
+
+    try:
+        arrays = numpy.ndarray((2, rows), dtype=numpy.float64, buffer=memory.buf)
+        blocks: int = -(-rows // PARALLEL_BLOCK)
+        board = numpy.ndarray(3 + PARALLEL_SUMS * blocks, dtype=numpy.float64, buffer=block.buf)
+        first, last = blocks * index // workers, blocks * (index + 1) // workers
+        low, high = first * PARALLEL_BLOCK, min(last * PARALLEL_BLOCK, rows)
+        x, y = arrays[0, low:high], arrays[1, low:high]
+        residuals: numpy.ndarray = numpy.empty_like(x)
+        sums: numpy.ndarray = board[3 + PARALLEL_SUMS * first:3 + PARALLEL_SUMS * last].reshape(-1, PARALLEL_SUMS)
+        while True:
+            while not start.acquire(timeout=PARALLEL_POLL):
+                if os.getppid() != parent: return
+            if board[2] == PARALLEL_STOP: break
+            ft_residuals(board[:2], x, y, residuals)
+            for number, offset in enumerate(range(0, high - low, PARALLEL_BLOCK)):
+                part, values = residuals[offset:offset + PARALLEL_BLOCK], x[offset:offset + PARALLEL_BLOCK]
+                sums[number] = part.sum(), part.dot(values), part.dot(part)
+            done.release()
+    except KeyboardInterrupt: pass
+    finally:
+        del arrays, board, x, y, sums
+        memory.close()
+        block.close()
+
+# ----------
+
+def ft_reduce(board: numpy.ndarray, semaphores: tuple, thetas: list, rows: int, processes: list) -> tuple:
+
+    """
+    Runs one iteration of the workers of ft_train_parallel: broadcasts
+    thetas through the control block, waits for every worker, then
+    reduces the partial sums of the blocks, always in the same order.
+    Workers are waited for in short slices, checking in between that
+    none of them exited (e.g. killed by the system when out of memory),
+    so that a dead worker is reported at once.
+
+    Args:
+        board (numpy.ndarray): Control block shared with the workers.
+        semaphores (tuple): Start semaphores of the workers and done semaphore.
+        thetas (list): Theta0 and theta1 to evaluate.
+        rows (int): Number of rows of the data.
+        processes (list): Worker processes.
+
+    Returns:
+        evaluation (tuple): Loss and gradient of the thetas over the whole data.
+    """
+
+    board[0], board[1] = thetas
+    for semaphore in semaphores[0]: semaphore.release()
+    for _ in processes:
+        deadline: float = time.monotonic() + PARALLEL_TIMEOUT
+        while not semaphores[1].acquire(timeout=PARALLEL_POLL):
+            stopped: list = [f'{ index } (exit code { process.exitcode })' for index, process in enumerate(processes) if process.exitcode is not None]
+            if stopped: raise Exception(f"Training worker(s) { ', '.join(stopped) } stopped unexpectedly.")
+            if time.monotonic() > deadline: raise Exception(f'Training workers did not respond for { PARALLEL_TIMEOUT:.0f} seconds.')
+    total: list = board[3:].reshape(-1, PARALLEL_SUMS).sum(axis=0).tolist()
+    return total[2] / rows, [total[0] / rows, total[1] / rows]
+
+# ----------
+
+def ft_train_parallel(x_km: list, y_price: list, output: bool = True, controller: Convergence = None, history: History = None, start: list = None, checkpoint: Checkpoint = None, workers: int = None) -> dict:
+
+    """
+    Trains a linear regression model by batch gradient descent, exactly
+    like ft_train, with the data split in shards across worker processes
+    (data parallelism). The normalized arrays are copied once into shared
+    memory and cut in blocks of 65536 rows, each worker owning a contiguous
+    shard of blocks; on every iteration the coordinator broadcasts the
+    candidate thetas, each worker computes the partial sums of its blocks
+    (see ft_shard_worker) and the coordinator reduces them into the loss
+    and gradient. Blocks do not depend on the number of workers and are
+    always reduced in the same order, so the run gives the same thetas,
+    bit for bit, on 1 or N processes. They match those of
+    ft_train_vectorized, which sums the whole arrays at once, within the
+    accuracy of the tolerance.
+
+    Args:
+        x_km (list): List of mileage values (independent variable).
+        y_price (list): List of corresponding price values (dependent variable).
+        output (bool): Print output messages (default: True).
+        controller (Convergence): Convergence controller of the run (default: new one with default settings).
+        history (History): Recorder of the history of the run (default: new one recording every iteration).
+        start (list): Initial theta0 and theta1, e.g. of a model to retrain (default: [0.0, 0.0]).
+        checkpoint (Checkpoint): Periodic checkpoint of the run (default: None).
+        workers (int): Number of worker processes (default: number of CPUs).
+
+    Returns:
+        histories (dict): Dictionary containing the history of theta0, theta1 and loss, and the report of the run.
+    """
+
+    thetas: list = list(start or [0.0, 0.0])
+    controller = controller or Convergence()
+    history = history or History()
+    rows: int = len(x_km)
+    blocks: int = -(-rows // PARALLEL_BLOCK)
+    workers = max(1, min(workers or os.cpu_count() or 1, blocks))
+    memory: shared_memory.SharedMemory = shared_memory.SharedMemory(create=True, size=2 * rows * 8)
+    block: shared_memory.SharedMemory = shared_memory.SharedMemory(create=True, size=(3 + PARALLEL_SUMS * blocks) * 8)
+    semaphores: tuple = [multiprocessing.Semaphore(0) for _ in range(workers)], multiprocessing.Semaphore(0)
+    processes: list = []
+    arrays: numpy.ndarray = None
+    board: numpy.ndarray = None
+
+    try:
+        arrays = numpy.ndarray((2, rows), dtype=numpy.float64, buffer=memory.buf)
+        board = numpy.ndarray(3 + PARALLEL_SUMS * blocks, dtype=numpy.float64, buffer=block.buf)
+        arrays[0], arrays[1], board[2] = x_km, y_price, PARALLEL_RUN
+        for index in range(workers):
+            processes.append(multiprocessing.Process(target=ft_shard_worker, args=(memory.name, block.name, rows, workers, index, semaphores[0][index], semaphores[1], os.getpid()), daemon=True))
+            processes[-1].start()
+        loss, gradient = ft_reduce(board, semaphores, thetas, rows, processes)
+        if output: print(message(f'2. Training model across { workers } processes...'), end='\r')
+        while controller.running():
+            candidate: list = [thetas[0] - gradient[0] * controller.learning_rate, thetas[1] - gradient[1] * controller.learning_rate]
+            candidate_loss, candidate_gradient = ft_reduce(board, semaphores, candidate, rows, processes)
+            if controller.adjust(loss, candidate_loss, gradient): thetas, loss, gradient = candidate, candidate_loss, candidate_gradient
+            if history.wants(controller.iteration): history.record(controller.iteration, thetas[0], thetas[1], loss)
+            if checkpoint is not None and controller.reason is None and checkpoint.due(controller.iteration): checkpoint.save(thetas, loss, controller, history)
+    finally:
+        if board is not None: board[2] = PARALLEL_STOP
+        for semaphore in semaphores[0]: semaphore.release()
+        for process in processes:
+            process.join(PARALLEL_POLL * 10)
+            if process.is_alive(): process.terminate()
+            process.join()
+        del arrays, board
+        for shared in (memory, block):
+            shared.close()
+            shared.unlink()
+    histories: dict = history.histories(controller.iteration, thetas[0], thetas[1], loss)
+    histories.update(controller.report())
+    if output: print(message(f'2. Training model across { workers } processes... Done √'))
+    return histories
@@ -1,20 +1,25 @@
 # Imports
 # -------
 
-from train import ft_load
+from __future__ import annotations
+import contextlib
+from train import ft_dataset
+from regressor import LinearRegressor
+from telemetry import telemetry
 from tools import *
 
 
 # Functions
 # ---------
 
-def ft_thetas(path: str = PATH_THETAS, output: bool = True) -> list :
+def ft_thetas(path: str = PATH_THETAS, output: bool = True) -> dict :
 
     """
-    Load thetas from csv file.
+    Load model from csv file.
     Check if data is corrupted, this includes:
-    - Missing or unecessary column(s) (must be 2)
-    - Wrong column(s) (not 'theta0' or 'theta1')
+    - Missing or unecessary column(s)
+    - Wrong column(s)
+    - Unsupported model version
     - Not enought data to train program
     - Nan or negative value(s)
     - Wrong data type (must be int or float)
@@ -22,6 +27,11 @@ def ft_thetas(path: str = PATH_THETAS, output: bool = True) -> list :
     - File not found
     - Is a directory
 
+    Keyed files (see train.py -group) hold one model per group, their
+    first column being the key column. Files of models with many features
+    (see train.py -features) hold one row per coefficient.
+    Files written before models were versioned only hold theta0 and theta1,
+    they are still supported by fetching the bounds from the data file.
     If thetas file is not found, default values 0.0
     will be applied to prediction and the user will be warned.
 
@@ -30,28 +40,129 @@ def ft_thetas(path: str = PATH_THETAS, output: bool = True) -> list :
         output (bool): Print output messages (default: True).
     
     Returns:
-        thetas (list): List containing theta0 and theta1.
+        model (dict): Dictionary containing version, thetas, scalers and coefficients (None if not found),
+            or, for a keyed file, the name of the key column and a dictionary mapping each group to its model,
+            or, for a model with many features, their names too (and the scalers of all columns).
     """
 
     try:
 
         if output: print(message('1. Fetching thetas from thetas.csv...'), end='\r')        
-        data: pandas.DataFrame = pandas.read_csv(path)
-        if len(data.columns) > 2: raise Exception('Thetas file is corrupted, unecessary column(s).')
-        elif len(data.columns) < 2: raise Exception('Thetas file is corrupted, missing column(s).')
-        elif 'theta0' not in data or 'theta1' not in data: raise Exception('Thetas file is corrupted, wrong column(s).')
-        elif len(data['theta0']) != 1 or len(data['theta1']) != 1: raise Exception('Thetas file is corrupted, should only contain one value for each column.')
-        elif any(math.isnan(data) for data in data['theta0'].tolist()) or any(math.isnan(data) for data in data['theta1'].tolist()): raise Exception('Thetas file is corrupted, Nan values.')
+        with open(path, 'r', newline='') as file:
+            rows: list = [row for row in csv.reader(file) if row]
+        columns: tuple = tuple(rows[0]) if len(rows) > 0 else ()
+        legacy: bool = columns == ('theta0', 'theta1')
+        model: dict = None
+        if columns == FEATURES_MODEL:
+            model = ft_model_features(rows[1:])
+            if output: print(message(f"1. Fetching thetas from thetas.csv... Done √ ({ len(model['features']) } features)"))
+            return model
+        if columns[1:] == MODEL:
+            if len(rows) < 2: raise Exception('Thetas file is corrupted, should contain one model per group.')
+            model = {'key': columns[0], 'groups': {row[0]: ft_model(MODEL, row[1:]) for row in rows[1:]}}
+            if len(model['groups']) != len(rows) - 1: raise Exception('Thetas file is corrupted, duplicated group(s).')
+            if output: print(message(f"1. Fetching thetas from thetas.csv... Done √ ({ len(model['groups']) } models)"))
+            return model
+        if len(columns) > len(MODEL) or (len(columns) > 2 and legacy): raise Exception('Thetas file is corrupted, unecessary column(s).')
+        elif len(columns) < len(MODEL) and not legacy: raise Exception('Thetas file is corrupted, missing column(s).')
+        elif not legacy and columns != MODEL: raise Exception('Thetas file is corrupted, wrong column(s).')
+        elif len(rows) != 2: raise Exception('Thetas file is corrupted, should only contain one value for each column.')
+        model = ft_model(columns, rows[1])
         if output: print(message('1. Fetching thetas from thetas.csv... Done √'))
-        return (data['theta0'].item(), data['theta1'].item())
+        return model
     
-    except TypeError: raise Exception("Data file is corrupted, wrong data type (must be int or float).")
+    except (TypeError, ValueError): raise Exception("Data file is corrupted, wrong data type (must be int or float).")
     except PermissionError: raise Exception("Data file is corrupted, permission denied.")
     except IsADirectoryError: raise Exception(f"Data file is corrupted, '{ path }' is a directory.")
     except FileNotFoundError:
         if output: print(message('1. Fetching thetas from thetas.csv... ⤫'), end='\r')        
         print(error(f'\n\n[ WARNING ]: { path } not found, default values 0.0 will be applied to prediction.\nTrain beforehand to avoid this warning (python3 train.py).\n'))
-        return (None, None)
+        return None
+
+# ----------
+
+def ft_model(columns: tuple, values: list) -> dict:
+
+    """
+    Builds a model from a row of a thetas file.
+
+    Args:
+        columns (tuple): Columns of the thetas file (MODEL, or ('theta0', 'theta1') for legacy files).
+        values (list): Values of the row, as read from the file.
+
+    Returns:
+        model (dict): Dictionary containing version, thetas, scalers and coefficients.
+    """
+
+    legacy: bool = columns == ('theta0', 'theta1')
+
+    if len(values) > len(columns): raise Exception('Thetas file is corrupted, should only contain one value for each column.')
+    data: dict = dict(zip(columns, [float(value) if value.strip() else math.nan for value in values]))
+    if len(data) < len(columns) or any(math.isnan(value) for value in data.values()): raise Exception('Thetas file is corrupted, Nan values.')
+    elif not legacy and int(data['version']) > MODEL_VERSION: raise Exception(f"Thetas file is corrupted, unsupported version { int(data['version']) } (must be { MODEL_VERSION } at most).")
+    model: dict = {'version': 0 if legacy else int(data['version']), 'thetas': (data['theta0'], data['theta1'])}
+    if legacy:
+        x_km, y_price = ft_dataset(PATH_DATA, output=False)
+        model['km'] = Scaler().fit(x_km)
+        model['price'] = Scaler().fit(y_price)
+    else:
+        model['km'] = Scaler(data['km_min'], data['km_max'])
+        model['price'] = Scaler(data['price_min'], data['price_max'])
+    model['coefficients'] = ft_fold(model['thetas'], model) if legacy else (data['intercept'], data['slope'])
+    return model
+
+# ----------
+
+def ft_model_features(rows: list) -> dict:
+
+    """
+    Builds a model with many features from the rows of its thetas file
+    (see FEATURES_MODEL): the intercept row first, then one row per feature.
+
+    Args:
+        rows (list): Rows of the thetas file, without the header.
+
+    Returns:
+        model (dict): Dictionary containing version, names of the features, thetas, scalers and coefficients.
+    """
+
+    if len(rows) < 2 or rows[0][1] != 'price': raise Exception("Thetas file is corrupted, should start with the 'price' row followed by one row per feature.")
+    elif any(len(row) != len(FEATURES_MODEL) for row in rows): raise Exception('Thetas file is corrupted, should only contain one value for each column.')
+    names: list = [row[1] for row in rows]
+    if len(set(names)) != len(names): raise Exception('Thetas file is corrupted, duplicated feature(s).')
+    data: list = [[float(value) if value.strip() else math.nan for value in (row[0], *row[2:])] for row in rows]
+    if any(math.isnan(value) for values in data for value in values): raise Exception('Thetas file is corrupted, Nan values.')
+    elif max(int(values[0]) for values in data) > MODEL_VERSION: raise Exception(f"Thetas file is corrupted, unsupported version { max(int(values[0]) for values in data) } (must be { MODEL_VERSION } at most).")
+    return {
+        'version': int(data[0][0]),
+        'features': names[1:],
+        'thetas': [values[1] for values in data],
+        'scalers': {name: Scaler(values[2], values[3]) for name, values in zip(names, data)},
+        'price': Scaler(data[0][2], data[0][3]),
+        'coefficients': (data[0][4], [values[4] for values in data[1:]]),
+    }
+
+# ----------
+
+def ft_route(model: LinearRegressor, group: str) -> LinearRegressor:
+
+    """
+    Returns the model of a group from a keyed thetas file.
+    A single model is returned as is, and must not be given a group.
+
+    Args:
+        model (LinearRegressor): Model loaded from csv file (see LinearRegressor.load).
+        group (str): Group to predict for (None for a single model).
+
+    Returns:
+        model (LinearRegressor): Model of the group.
+    """
+
+    if model.models is None:
+        if group is not None: raise Exception('Thetas file holds a single model, option -group is only available for keyed thetas files.')
+        return model
+    if group is None: raise Exception(f"Thetas file holds one model per '{ model.key }', please select one with -group.")
+    return model.route(group)
 
 # ----------
 
@@ -77,15 +188,70 @@ def ft_kilometers() -> float:
 
 # ----------
 
-def ft_predict(thetas: list, km: float, output: bool = True) -> float:
+def ft_features(features: list) -> list:
+
+    """
+    Asks the user for the value of each feature of a model and returns them.
+
+    Args:
+        features (list): Names of the features.
+
+    Returns:
+        values (list): Values entered by the user, in the order of the features.
+    """
+
+    values: list = []
+
+    try:
+        for name in features:
+            values.append(float(input(message(f'2. Enter { name }: '))))
+            if values[-1] < 0: raise Exception(f'{ name.capitalize() } cannot be negative.')
+        return values
+
+    except (ValueError, KeyboardInterrupt): raise Exception(f'{ name.capitalize() } must be a number.')
+    except EOFError: raise Exception(f'{ name.capitalize() } must be a number.')
+
+# ----------
+
+def ft_price(model: dict, km: numpy.ndarray) -> numpy.ndarray:
+
+    """
+    Applies the model to one or many mileages at once.
+    Negative prices are clamped to 0.0, and all prices are 0.0
+    when there is no model.
+    A single mileage is priced with plain floats, without loading numpy.
+    With a model of many features, km holds the values of the features:
+    a list for a single car, or a matrix with one row per car.
+
+    Args:
+        model (dict): Model loaded from csv file (None if not found).
+        km (numpy.ndarray): Mileage or array of mileages (values of the features for a model of many features).
+
+    Returns:
+        prices (numpy.ndarray): Predicted price or array of predicted prices.
+    """
+
+    if model is not None and 'features' in model:
+        intercept, slopes = model['coefficients']
+        if isinstance(km, list): return max(intercept + sum(slope * value for slope, value in zip(slopes, km)), 0.0)
+        return numpy.maximum(intercept + numpy.asarray(km, dtype=numpy.float64) @ numpy.asarray(slopes), 0.0)
+    if isinstance(km, (int, float)): return 0.0 if model is None else max(model['coefficients'][0] + model['coefficients'][1] * km, 0.0)
+    if model is None: return numpy.zeros_like(km, dtype=numpy.float64)
+    return numpy.maximum(model['coefficients'][0] + model['coefficients'][1] * numpy.asarray(km, dtype=numpy.float64), 0.0)
+
+# ----------
+
+def ft_predict(model: LinearRegressor, km: float, output: bool = True) -> float:
     
         """
         Predicts the price of a car with a given mileage and 
         outputs the result to the user.
+        The model holds coefficients already folded into raw
+        km -> price space, so a prediction costs O(1).
     
         Args:
-            thetas (list): List containing thetas loaded from csv file.
-            mileage (float): Mileage entered by the user.
+            model (LinearRegressor): Model loaded from csv file (see LinearRegressor.load).
+            km (float): Mileage entered by the user (values of the features for a model with features).
             output (bool): Print output messages (default: True).
         
         Returns:
@@ -93,20 +259,121 @@ def ft_predict(thetas: list, km: float, output: bool = True) -> float:
         """
     
         price: float = 0.0
-        data: pandas.DataFrame = ft_load(PATH_DATA, False)
-        x_km: list = data['km'].tolist()
-        y_price: list = data['price'].tolist()
-
-        if output: print(message(f'3. Predicting price for a car with a mileage of { km } km...'), end='\r')
-        if thetas[0] == None or thetas[1] == None: price = 0.0
-        else: price = ft_denormalize_value(y_price, (thetas[0] + (thetas[1] * ft_normalize_value(x_km, km))))
-        if price < 0: price = 0.0
-        if output: print(message(f'3. Predicting price for a car with a mileage of { km } km... Done √'))
+
+        car: str = f'a mileage of { km } km' if model.features is None else ', '.join(f'{ name } { value }' for name, value in zip(model.features, km))
+
+        if output: print(message(f'3. Predicting price for a car with { car }...'), end='\r')
+        price = float(model.predict(km))
+        if output: print(message(f'3. Predicting price for a car with { car }... Done √'))
         return price
 
 # ----------
 
-def ft_precision(thetas: list) -> float:
+def ft_headerless(source) -> bool:
+
+    """
+    Tells whether a csv file of mileages holds a single column of
+    mileages without header, looking at its first line. A stream is
+    looked at without being consumed, which needs a buffered binary
+    stream (e.g. sys.stdin.buffer); other streams are taken as having
+    a header.
+
+    Args:
+        source (str): Path to csv file, or a readable stream.
+
+    Returns:
+        headerless (bool): True if the first line is already a mileage.
+    """
+
+    if isinstance(source, str):
+        with open(source, 'rb') as file: line: bytes = file.readline(1 << 16)
+    elif hasattr(source, 'peek'): line = source.peek(1 << 16).split(b'\n', 1)[0]
+    else: return False
+    try: float(line.strip())
+    except ValueError: return False
+    return True
+
+# ----------
+
+def ft_batch(model: LinearRegressor, source, destination, chunksize: int = CHUNK_SIZE, output: bool = True) -> int:
+
+    """
+    Predicts the prices of many cars at once: mileages are read in chunks
+    from the 'km' column of a csv file (or stream), scored with vectorized
+    math and written as 'km,price' rows to the destination. A file of a
+    single column of mileages without header is read as the 'km' column.
+    With a keyed model, each row is routed to the model of its group,
+    read from the key column, and written as '<key>,km,price' rows.
+    With a model of many features, the csv must hold a column per
+    feature and rows are written with their features and price.
+    Check if mileages are corrupted, this includes:
+    - Missing 'km' column (or key column, for a keyed model)
+    - Unknown group(s), for a keyed model
+    - Nan or negative value(s)
+    - Wrong data type (must be int or float)
+    - Permission denied
+    - File not found
+    - Is a directory
+
+    Args:
+        model (LinearRegressor): Model loaded from csv file (see LinearRegressor.load).
+        source (str): Path to csv file of mileages, or a readable stream.
+        destination (file): Writable stream receiving the predictions.
+        chunksize (int): Number of rows per chunk (default: 100000).
+        output (bool): Print output messages (default: True).
+
+    Returns:
+        rows (int): Number of predicted prices.
+    """
+
+    rows: int = 0
+    name: str = source if isinstance(source, str) else 'stdin'
+    key: str = model.key if model.models is not None else None
+    features: list = model.features
+    headerless: bool = False
+
+    try:
+
+        if output: print(message(f'2. Predicting prices of mileages from { name }...'), end='\r')
+        stream = source if isinstance(source, str) else getattr(source, 'buffer', source)
+        if key is None and features is None: headerless = ft_headerless(stream)
+        reader = pandas.read_csv(stream, chunksize=chunksize, dtype=None if key is None else {key: str}, header=None if headerless else 'infer', names=['km'] if headerless else None)
+        for index, data in enumerate(reader):
+            if features is not None:
+                missing: list = [name for name in features if name not in data]
+                if missing: raise Exception(f"Mileages file '{ name }' is corrupted, missing column(s): { ', '.join(missing) }.")
+                elif any(data[feature].dtype.kind not in 'iuf' for feature in features): raise TypeError
+                values: numpy.ndarray = data[features].to_numpy(dtype=numpy.float64)
+                if numpy.isnan(values).any(): raise Exception(f"Mileages file '{ name }' is corrupted, Nan values.")
+                elif (values < 0).any(): raise Exception(f"Mileages file '{ name }' is corrupted, negative value(s).")
+                data[features].assign(price=model.predict(values).round(2)).to_csv(destination, header=index == 0, index=False)
+                rows += len(values)
+                continue
+            if 'km' not in data: raise Exception(f"Mileages file '{ name }' is corrupted, missing 'km' column.")
+            km: numpy.ndarray = data['km'].to_numpy()
+            if km.dtype.kind not in 'iuf': raise TypeError
+            elif numpy.isnan(km).any(): raise Exception(f"Mileages file '{ name }' is corrupted, Nan values.")
+            elif (km < 0).any(): raise Exception(f"Mileages file '{ name }' is corrupted, negative value(s).")
+            if key is None:
+                pandas.DataFrame({'km': km, 'price': model.predict(km).round(2)}).to_csv(destination, header=index == 0, index=False)
+            else:
+                if key not in data: raise Exception(f"Mileages file '{ name }' is corrupted, missing '{ key }' column.")
+                unknown: pandas.Series = data[key][~data[key].isin(list(model.models))]
+                if len(unknown) > 0: raise Exception(f"Mileages file '{ name }' is corrupted, unknown { key } '{ unknown.iloc[0] }'.")
+                pandas.DataFrame({key: data[key], 'km': km, 'price': model.predict(km, data[key]).round(2)}).to_csv(destination, header=index == 0, index=False)
+            rows += len(km)
+        if output: print(message(f'2. Predicting prices of mileages from { name }... Done √ ({ rows } rows)'))
+        return rows
+
+    except pandas.errors.EmptyDataError: raise Exception(f"Mileages file '{ name }' is empty.")
+    except TypeError: raise Exception(f"Mileages file '{ name }' is corrupted, wrong data type (must be int or float).")
+    except PermissionError: raise Exception(f"Mileages file '{ name }' is corrupted, permission denied.")
+    except FileNotFoundError: raise Exception(f"Mileages file '{ name }' not found.")
+    except IsADirectoryError: raise Exception(f"Mileages file is corrupted, '{ name }' is a directory.")
+
+# ----------
+
+def ft_precision(model: LinearRegressor, path: str = PATH_DATA) -> float:
     
     """
     Calculates the precision of the program and outputs
@@ -115,25 +382,19 @@ def ft_precision(thetas: list) -> float:
     the predicted price and the actual price.
 
     Args:
-        thetas (list): List of thetas loaded from csv file.
+        model (LinearRegressor): Model loaded from csv file (see LinearRegressor.load), 0.0 if it was not found.
+        path (str): Path to csv file the precision is measured on (default: 'data.csv').
 
     Returns:
         precision (float): Precision of the program.
     """
 
-    prices: list = []
     precision: float = 0.0
-    data: pandas.DataFrame = ft_load(PATH_DATA, False)
-    x_km: list = data['km'].tolist()
-    y_price: list = data['price'].tolist()
+    x_km, y_price = ft_dataset(path, output=False)
 
     print(message(f'4. Calculating precision...'), end='\r')
-    if thetas[0] == -1.0 or thetas[1] == -1.0: precision = 0.0
-    else:
-        for km, _ in zip(x_km, y_price):
-            prices.append(ft_denormalize_value(y_price, (thetas[0] + (thetas[1] * ft_normalize_value(x_km, km)))))
-        precision = sum([abs(price - prices[index]) for index, price in enumerate(y_price)]) / len(y_price)
-    
+    if not model.fitted: precision = 0.0
+    else: precision = float(numpy.abs(y_price - model.predict(x_km)).mean())
     print(message(f'4. Calculating precision... Done √'))
     return precision
 
@@ -141,32 +402,89 @@ def ft_precision(thetas: list) -> float:
 # Main function
 # -------------
 
+def ft_main_batch(path: str, source: str, target: str) -> None:
+
+    """
+        Batch mode of the main function.
+        When predictions are written to stdout, all other messages
+        are sent to stderr so that the output can be piped.
+        Otherwise they are written to a temporary file renamed once
+        every row is predicted, so that an error leaves no partial file.
+
+        Args:
+            path (str): Path to the thetas csv file.
+            source (str): Path to csv file of mileages, '-' for stdin.
+            target (str): Path to csv file receiving the predictions, None for stdout.
+    """
+
+    destination = sys.stdout
+
+    with contextlib.redirect_stdout(sys.stderr if target is None else sys.stdout):
+        with telemetry.stage('load'): model: LinearRegressor = LinearRegressor.load(path, False, output=True)
+        if target is None:
+            with telemetry.stage('predict') as stage: stage.rows = ft_batch(model, sys.stdin if source == '-' else source, destination)
+            return
+        try:
+            with open(f'{ target }.tmp', 'w', newline='') as file:
+                with telemetry.stage('predict') as stage: stage.rows = ft_batch(model, sys.stdin if source == '-' else source, file)
+            os.replace(f'{ target }.tmp', target)
+        except BaseException:
+            with contextlib.suppress(OSError): os.remove(f'{ target }.tmp')
+            raise
+
+# ----------
+
 def ft_main(args: list) -> None:
 
     """
         Main function.
 
         Args:
+            path (str): Optional argument to specify path to csv file (default: 'thetas.csv').
             -bonus (bool): Optional argument to enable bonus mode (default: False).
+            -input (str): Optional csv file with a 'km' column, or mileages without header, to predict in batch, '-' for stdin (default: None).
+            -output (str): Optional csv file receiving the batch predictions (default: stdout).
+            -group (str): Optional group to predict for, with a keyed thetas file (default: None).
+            -metrics (str): Optional file receiving the duration, rows and peak memory of each stage, in the Prometheus text format for .prom files, JSON otherwise (default: None).
+            -profile (str): Optional file receiving a cProfile dump of the run (default: None).
     """
 
-    global BONUS
+    bonus: bool = BONUS
+    source: str = None
+    target: str = None
+    group: str = None
     km: float = None
-    thetas: tuple = None
+    model: LinearRegressor = None
     price: float = None
     precision: float = None
 
+    metrics: str = ft_option(args, '-metrics')
+    profile: str = ft_option(args, '-profile')
+    if metrics is not None or profile is not None: telemetry.start('predict', metrics, profile)
     if '-bonus' in args:
-        BONUS = True
+        bonus = True
         args.remove('-bonus')
+    source = ft_option(args, '-input')
+    target = ft_option(args, '-output')
+    group = ft_option(args, '-group')
+    if target is not None and source is None:
+        raise Exception('Option -output is only available in batch mode (-input).')
+    if group is not None and source is not None:
+        raise Exception("Option -group is not available in batch mode (-input), groups are read from the key column.")
     if len(args) > 1:
         raise Exception("Please provide path to CSV or/and -bonus flag only, or no arguments at all to use default path 'thetas.csv'.")
-    thetas = ft_thetas() if len(args) == 0 else ft_thetas(args[0])
-    km = ft_kilometers()
-    price = ft_predict(thetas, km)
-    if BONUS: precision = ft_precision(thetas)
+    if source is not None:
+        ft_main_batch(PATH_THETAS if len(args) == 0 else args[0], source, target)
+        return
+    with telemetry.stage('load'): model = ft_route(LinearRegressor.load(PATH_THETAS if len(args) == 0 else args[0], False, output=True), group)
+    if bonus and model.features is not None:
+        raise Exception('Precision (-bonus) is only available for models of the mileage alone, data.csv holds no other feature.')
+    km = ft_kilometers() if model.features is None else ft_features(model.features)
+    with telemetry.stage('predict', 1): price = ft_predict(model, km)
+    if bonus:
+        with telemetry.stage('precision'): precision = ft_precision(model)
     print(message(f"\nFinal price: { round(price, 2) } €"))
-    if BONUS: print(message(f"Precision: { round(precision, 2) } €"))
+    if bonus: print(message(f"Precision: { round(precision, 2) } €"))
 
 
 # Main
@@ -174,15 +492,18 @@ def ft_main(args: list) -> None:
 
 if __name__ == '__main__':
 
+    console = sys.stderr if '-input' in sys.argv and '-output' not in sys.argv else sys.stdout
+
     try:
-        print(header(f'___ ___   _   _ _  _ __ ___ ___   ___ __ ___ ___ __ ___ ___ _ ___ _  _'))
-        print(header(f'|_   |    |   | |\ | |_ |_| |_|   |_| |_ | _ |_| |_ |_  |_  | | | |\ |'))
-        print(header(f'|    |    |__ | | \| |_ | | | \   | \ |_ |_| | \ |_ __| __| | |_| | \|\n'))
-        print(header(f'----------------------------- PREDICTION -----------------------------\n'))
+        print(header(f'___ ___   _   _ _  _ __ ___ ___   ___ __ ___ ___ __ ___ ___ _ ___ _  _'), file=console)
+        print(header(f'|_   |    |   | |\ | |_ |_| |_|   |_| |_ | _ |_| |_ |_  |_  | | | |\ |'), file=console)
+        print(header(f'|    |    |__ | | \| |_ | | | \   | \ |_ |_| | \ |_ __| __| | |_| | \|\n'), file=console)
+        print(header(f'----------------------------- PREDICTION -----------------------------\n'), file=console)
         ft_main(sys.argv[1:])
         sys.exit(0)
     
-    except (KeyboardInterrupt, EOFError): print(error('[ WARNING ]: Program interrupted by user.'))
+    except (KeyboardInterrupt, EOFError): print(error('[ WARNING ]: Program interrupted by user.'), file=console)
     except Exception as exc:
-        print(error(f'[ ERROR ]: { exc }'))
-        sys.exit(1)
\ No newline at end of file
+        print(error(f'[ ERROR ]: { exc }'), file=console)
+        sys.exit(1)
+    finally: telemetry.finish()
\ No newline at end of file
@@ -0,0 +1,458 @@
+# Imports
+# -------
+
+from __future__ import annotations
+import io, fcntl, tempfile
+from tools import *
+
+
+# Globals
+# -------
+
+REGISTRY = 'models'
+REGISTRY_KEEP = 10
+REGISTRY_ATTEMPTS = 100
+REGISTRY_COMPANIONS = (os.path.basename(PATH_STATISTICS),)
+REGISTRY_UMASK = os.umask(0)
+os.umask(REGISTRY_UMASK)
+
+
+# Functions
+# ---------
+
+def ft_fsync_directory(path: str) -> None:
+
+    """
+    Flushes a directory to disk, so that a file renamed into it
+    survives a crash. Not available on every platform (e.g. Windows),
+    in which case nothing is done.
+
+    Args:
+        path (str): Path to the directory.
+
+    Returns:
+        None
+    """
+
+    try:
+        descriptor: int = os.open(path or '.', os.O_RDONLY)
+        try: os.fsync(descriptor)
+        finally: os.close(descriptor)
+    except OSError: pass
+
+# ----------
+
+def ft_write_temporary(path: str, content: str) -> str:
+
+    """
+    Writes content to a temporary file next to path and flushes it to disk.
+    The temporary file gets a name of its own (tempfile.mkstemp), so that
+    concurrent writers, threads of one process included, never share it.
+
+    Args:
+        path (str): Path of the file the temporary file stands for.
+        content (str): Content to write.
+
+    Returns:
+        temporary (str): Path to the temporary file.
+    """
+
+    descriptor, temporary = tempfile.mkstemp(prefix=f'{ os.path.basename(path) }.', suffix='.tmp', dir=os.path.dirname(path) or '.')
+
+    os.fchmod(descriptor, 0o666 & ~REGISTRY_UMASK)
+    with open(descriptor, 'w', newline='') as file:
+        file.write(content)
+        file.flush()
+        os.fsync(file.fileno())
+    return temporary
+
+# ----------
+
+def ft_write_atomic(path: str, content: str) -> None:
+
+    """
+    Writes a file atomically: content is written to a temporary file,
+    flushed to disk, then renamed over path. Readers see either the
+    old file or the new one, never a missing or half-written file.
+
+    Args:
+        path (str): Path to the file.
+        content (str): Content to write.
+
+    Returns:
+        None
+    """
+
+    os.replace(ft_write_temporary(path, content), path)
+    ft_fsync_directory(os.path.dirname(path))
+
+# ----------
+
+def ft_csv(rows: list) -> str:
+
+    """
+    Formats rows as csv content.
+
+    Args:
+        rows (list): List of rows (lists of values).
+
+    Returns:
+        content (str): Csv content.
+    """
+
+    buffer: io.StringIO = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue()
+
+# ----------
+
+def ft_stamp(rows: list, generation: int) -> list:
+
+    """
+    Records the generation a companion file belongs to in a last
+    'generation' column, so that a reader can tell whether it goes
+    with the model file it reads (see ft_companion_generation).
+
+    Args:
+        rows (list): Rows of the companion file, header included.
+        generation (int): Number of the generation.
+
+    Returns:
+        rows (list): Rows of the companion file, stamped.
+    """
+
+    return [list(rows[0]) + ['generation']] + [list(row) + [generation] for row in rows[1:]]
+
+# ----------
+
+def ft_companion_generation(rows: list) -> tuple:
+
+    """
+    Splits the 'generation' column stamped by ft_stamp off the rows of
+    a companion file.
+
+    Args:
+        rows (list): Rows of the companion file, header included.
+
+    Returns:
+        companion (tuple): Rows without the column and generation they belong to (None if not stamped).
+    """
+
+    if not rows or not rows[0] or rows[0][-1] != 'generation': return rows, None
+    generations: set = {row[-1] for row in rows[1:]}
+    if len(generations) != 1: return rows, None
+    try: generation: int = int(generations.pop())
+    except ValueError: return rows, None
+    return [row[:-1] for row in rows], generation
+
+# ----------
+
+def ft_registry(path: str) -> tuple:
+
+    """
+    Returns where the generations of a model file are kept: in the
+    'models' directory next to it, named after it (e.g. thetas.csv
+    is kept as models/thetas.000001.csv, models/thetas.000002.csv...).
+
+    Args:
+        path (str): Path to the model file.
+
+    Returns:
+        registry (tuple): Path to the registry directory and name of the model.
+    """
+
+    return os.path.join(os.path.dirname(path), REGISTRY), os.path.splitext(os.path.basename(path))[0]
+
+# ----------
+
+def ft_generation_path(path: str, generation: int) -> str:
+
+    """
+    Returns the path of a generation of a model file.
+
+    Args:
+        path (str): Path to the model file.
+        generation (int): Number of the generation.
+
+    Returns:
+        generation (str): Path to the generation.
+    """
+
+    directory, name = ft_registry(path)
+    return os.path.join(directory, f'{ name }.{ generation:06d}.csv')
+
+# ----------
+
+def ft_generations(path: str) -> list:
+
+    """
+    Lists the generations of a model file kept in the registry.
+
+    Args:
+        path (str): Path to the model file.
+
+    Returns:
+        generations (list): Sorted numbers of the generations.
+    """
+
+    directory, name = ft_registry(path)
+    generations: list = []
+
+    try: files: list = os.listdir(directory)
+    except FileNotFoundError: return []
+    for file in files:
+        parts: list = file.split('.')
+        if len(parts) == 3 and parts[0] == name and parts[2] == 'csv' and parts[1].isdigit(): generations.append(int(parts[1]))
+    return sorted(generations)
+
+# ----------
+
+def ft_companion_path(path: str, generation: int, companion: str) -> str:
+
+    """
+    Returns the path of the copy of a companion file (see
+    REGISTRY_COMPANIONS) kept with a generation of a model file,
+    e.g. models/thetas.000002.statistics.csv.
+
+    Args:
+        path (str): Path to the model file.
+        generation (int): Number of the generation.
+        companion (str): Name of the companion file.
+
+    Returns:
+        companion (str): Path to the copy of the companion file.
+    """
+
+    directory, name = ft_registry(path)
+    return os.path.join(directory, f'{ name }.{ generation:06d}.{ companion }')
+
+# ----------
+
+def ft_current(path: str) -> int:
+
+    """
+    Returns the generation a model file currently holds, as recorded
+    by its 'current' pointer in the registry.
+
+    Args:
+        path (str): Path to the model file.
+
+    Returns:
+        generation (int): Number of the current generation (None if never published).
+    """
+
+    directory, name = ft_registry(path)
+
+    try:
+        with open(os.path.join(directory, f'{ name }.current')) as file: return int(file.read())
+    except (OSError, ValueError): return None
+
+# ----------
+
+def ft_activate(path: str, generation: int, forward: bool = False) -> bool:
+
+    """
+    Makes a generation the current model: the copies of its companion
+    files and its content are atomically renamed over the companion files
+    and the model file next to it (a companion file the generation was
+    published without is deleted), then the 'current' pointer is updated.
+    Each rename is atomic but they are not atomic together: a reader that
+    needs a companion file to match the model checks the generation
+    stamped in it against the 'current' pointer, which is moved last
+    (see ft_stamp).
+    Activations are serialized by a lock on the registry, and the
+    'current' pointer is read again under it, so that a publisher never
+    moves it back to an older generation than a concurrent one did.
+
+    Args:
+        path (str): Path to the model file.
+        generation (int): Number of the generation.
+        forward (bool): Only activate the generation if it is newer than the current one (default: False).
+
+    Returns:
+        activated (bool): True if the generation is now the current model.
+    """
+
+    directory, name = ft_registry(path)
+
+    with RegistryLock(path):
+        current: int = ft_current(path)
+        if forward and current is not None and current >= generation: return False
+        for companion in REGISTRY_COMPANIONS:
+            target: str = os.path.join(os.path.dirname(path), companion)
+            try:
+                with open(ft_companion_path(path, generation, companion), newline='') as file: ft_write_atomic(target, file.read())
+            except FileNotFoundError:
+                try: os.remove(target)
+                except FileNotFoundError: pass
+        with open(ft_generation_path(path, generation), newline='') as file: ft_write_atomic(path, file.read())
+        ft_write_atomic(os.path.join(directory, f'{ name }.current'), f'{ generation }\n')
+        return True
+
+# ----------
+
+def ft_publish(path: str, rows: list, keep: int = REGISTRY_KEEP, companions: dict = None) -> int:
+
+    """
+    Publishes a model: its rows are saved as a new numbered generation
+    in the registry, which becomes the current model unless a newer
+    one was published meanwhile. Every write is atomic (temporary file,
+    fsync, rename), so readers never need a lock, and the generation
+    number is claimed with a hard link, so concurrent publishers never
+    overwrite each other.
+    Companion files (see REGISTRY_COMPANIONS, e.g. the statistics of
+    the exact solver) are kept with each generation, stamped with its
+    number, and restored with it. Only the rows passed for them are
+    published: a generation published without a companion file has
+    none, and its activation deletes the one next to the model file.
+    Only the last generations are kept, and never the current one.
+
+    Args:
+        path (str): Path to the model file.
+        rows (list): Rows of the model file, header included.
+        keep (int): Number of generations to keep (default: 10).
+        companions (dict): Rows of companion files published with the model, by name (default: None).
+
+    Returns:
+        generation (int): Number of the published generation.
+    """
+
+    directory, _ = ft_registry(path)
+    os.makedirs(directory, exist_ok=True)
+    generations: list = ft_generations(path)
+    generation: int = (generations[-1] if generations else 0) + 1
+    companions = companions or {}
+    temporary: str = ft_write_temporary(ft_generation_path(path, 0), ft_csv(rows))
+
+    try:
+        for _ in range(REGISTRY_ATTEMPTS):
+            try:
+                os.link(temporary, ft_generation_path(path, generation))
+                break
+            except FileExistsError: generation += 1
+        else: raise Exception(f'Cannot publish { path }, too many concurrent publishers.')
+    finally: os.remove(temporary)
+    for companion in REGISTRY_COMPANIONS:
+        if companion in companions: ft_write_atomic(ft_companion_path(path, generation, companion), ft_csv(ft_stamp(companions[companion], generation)))
+    ft_fsync_directory(directory)
+    ft_activate(path, generation, True)
+    current: int = ft_current(path)
+    for old in ft_generations(path)[:-keep]:
+        if old in (generation, current): continue
+        for file in [ft_generation_path(path, old)] + [ft_companion_path(path, old, companion) for companion in REGISTRY_COMPANIONS]:
+            try: os.remove(file)
+            except FileNotFoundError: pass
+    return generation
+
+# ----------
+
+def ft_rollback(path: str, generation: int = None) -> int:
+
+    """
+    Rolls a model file back to a previous generation, along with the
+    companion files it was published with.
+
+    Args:
+        path (str): Path to the model file.
+        generation (int): Number of the generation to restore (default: the one before the current one).
+
+    Returns:
+        generation (int): Number of the restored generation.
+    """
+
+    generations: list = ft_generations(path)
+    current: int = ft_current(path)
+
+    if generation is None:
+        older: list = [number for number in generations if current is None or number < current]
+        if not older: raise Exception(f'No generation of { path } older than the current one to roll back to.')
+        generation = older[-1]
+    elif generation not in generations: raise Exception(f"Generation { generation } of { path } not found, available: { ', '.join(map(str, generations)) or 'none' }.")
+    ft_activate(path, generation)
+    return generation
+
+
+# Classes
+# -------
+
+class RegistryLock:
+
+    """
+    Exclusive lock on the registry of a model file, held while a
+    generation is activated. It is an advisory lock (flock) on a lock
+    file of the registry, released by the system if its holder dies.
+    """
+
+    def __init__(self, path: str) -> None:
+
+        """
+        Args:
+            path (str): Path to the model file.
+        """
+
+        directory, name = ft_registry(path)
+        self.path: str = os.path.join(directory, f'{ name }.lock')
+        self.descriptor: int = None
+
+    def __enter__(self) -> RegistryLock:
+
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self.descriptor = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        fcntl.flock(self.descriptor, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc) -> bool:
+
+        fcntl.flock(self.descriptor, fcntl.LOCK_UN)
+        os.close(self.descriptor)
+        return False
+
+
+# Main function
+# -------------
+
+def ft_main(args: list) -> None:
+
+    """
+        Main function.
+
+        Args:
+            args (list): List of arguments that can be either:
+                command (str): Optional command, 'list' or 'rollback' (default: 'list').
+                generation (int): Optional generation to roll back to (default: the one before the current one).
+                -model (str): Optional path to the model file (default: 'thetas.csv').
+
+        Returns:
+            None
+    """
+
+    path: str = ft_option(args, '-model', PATH_THETAS)
+    command: str = args.pop(0) if len(args) > 0 else 'list'
+
+    if command == 'list' and len(args) == 0:
+        current: int = ft_current(path)
+        generations: list = ft_generations(path)
+        if not generations: print(message(f'No generation of { path } published yet.'))
+        for generation in generations:
+            print(message(f"{ '*' if generation == current else ' ' } { generation:>6}   { ft_generation_path(path, generation) }"))
+    elif command == 'rollback' and len(args) <= 1:
+        try: generation: int = int(args[0]) if len(args) == 1 else None
+        except ValueError: raise Exception('Generation must be an integer.')
+        print(message(f'Model { path } rolled back to generation { ft_rollback(path, generation) } √'))
+    else: raise Exception("Please provide a command, 'list' or 'rollback [generation]', and optionally -model path/to/thetas.csv.")
+
+
+# Main
+# ----
+
+if __name__ == '__main__':
+
+    try:
+        print(header(f'--------------------------- MODEL REGISTRY ---------------------------\n'))
+        ft_main(sys.argv[1:])
+        sys.exit(0)
+
+    except (KeyboardInterrupt, EOFError): print(error('[ WARNING ]: Program interrupted by user.'))
+    except Exception as exc:
+        print(error(f'[ ERROR ]: { exc }'))
+        sys.exit(1)
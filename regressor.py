@@ -0,0 +1,582 @@
+# Imports
+# -------
+
+from __future__ import annotations
+import threading
+from train import ft_train, ft_train_vectorized, ft_train_stream, ft_train_groups, ft_train_matrix, ft_solve_matrix, ft_bounds, ft_accumulate, ft_epochs
+from train import ft_moments, ft_merge, ft_solve, ft_save, ft_save_groups, ft_save_features, History, Convergence
+from telemetry import telemetry
+from tools import *
+
+
+# Classes
+# -------
+
+class LinearRegressor:
+
+    """
+    Linear regression of the price of a car from its mileage, usable
+    as a library: every setting and all of the state of a model are held
+    by its instance, so that many models can be trained at the same time
+    in threads or processes, and that runs never affect each other.
+    With features, the price is modeled from many columns instead (fit
+    takes a matrix with one column per feature); with a key, one model
+    is trained per group (fit takes the group of each row) and held in
+    models, predictions being routed to the model of their group.
+
+    Updates (fit, partial_fit, fit_stream) of an instance are serialized
+    by a lock. Predictions never wait for them: the coefficients are
+    replaced in a single assignment once an update is done, so a
+    prediction uses either the previous model or the new one.
+
+    Example:
+        model = LinearRegressor().fit(x_km, y_price)
+        model.predict(100000), model.predict([50000, 150000]), model.score(x_km, y_price)
+    """
+
+    def __init__(self, engine: str = ENGINE, solver: str = SOLVER, learning_rate: float = LEARNING_RATE, tolerance: float = TOLERANCE, iterations: int = MAX_ITERATIONS, history: str = 'off', step: int = HISTORY_STEP, size: int = HISTORY_SIZE, output: bool = False, checkpoint: Checkpoint = None, workers: int = None,
+        features: list = None, key: str = None, chunksize: int = CHUNK_SIZE, batchsize: int = BATCH_SIZE, shuffle: int = 0, epochs: int = None, seed: int = SEED) -> None:
+
+        """
+        Args:
+            engine (str): Training engine, 'loop', 'numpy' or 'parallel' (default: 'numpy').
+            solver (str): Solver, 'gradient' or 'exact' (default: 'gradient').
+            learning_rate (float): Initial learning rate of gradient descent (default: 0.5).
+            tolerance (float): Tolerance on the relative improvement and the gradient norm (default: 1e-14).
+            iterations (int): Maximum number of iterations (default: 100000).
+            history (str): History recording mode, 'off', 'every' or 'ring' (default: 'off').
+            step (int): Interval between recorded iterations (default: 1).
+            size (int): Number of iterations kept by the 'ring' history mode (default: 1000).
+            output (bool): Print output messages (default: False).
+            checkpoint (Checkpoint): Periodic checkpoint of gradient descent runs (default: None).
+            workers (int): Number of worker processes of the parallel engine, or training the groups (default: number of CPUs).
+            features (list): Names of the feature columns to model the price from (default: None, the mileage alone).
+            key (str): Name of the key column, to train one model per group (default: None, a single model).
+            chunksize (int): Number of rows per chunk read by fit_stream (default: 100000).
+            batchsize (int): Number of rows per mini-batch of fit_stream (default: 1024).
+            shuffle (int): Size of the shuffle buffer of fit_stream, 0 to disable shuffling (default: 0).
+            epochs (int): Maximum number of epochs of fit_stream (default: None, see train.ft_epochs).
+            seed (int): Seed of the shuffle buffer of fit_stream (default: 42).
+        """
+
+        if engine not in ENGINES: raise Exception(f"Unknown engine '{ engine }', must be one of: { ', '.join(ENGINES) }.")
+        if solver not in SOLVERS: raise Exception(f"Unknown solver '{ solver }', must be one of: { ', '.join(SOLVERS) }.")
+        if history not in HISTORIES: raise Exception(f"Unknown history mode '{ history }', must be one of: { ', '.join(HISTORIES) }.")
+        if tolerance < 0 or iterations < 1: raise Exception('Tolerance cannot be negative and the maximum number of iterations must be positive.')
+        if step < 1 or size < 1: raise Exception('History step and ring size must be positive.')
+        if workers is not None and workers < 1: raise Exception('Number of workers must be positive.')
+        if chunksize < 1 or batchsize < 1 or shuffle < 0: raise Exception('Chunk and batch sizes must be positive, shuffle buffer size cannot be negative.')
+        if epochs is not None and epochs < 1: raise Exception('Maximum number of epochs must be positive.')
+        if (features is not None or key is not None) and engine != 'numpy': raise Exception('Models with features or groups are only trained with the numpy engine.')
+        if features is not None and key is not None: raise Exception('Models with features cannot be trained per group.')
+        if key is not None and solver == 'exact': raise Exception('Models per group are only trained by gradient descent.')
+        self.engine: str = engine
+        self.solver: str = solver
+        self.learning_rate: float = learning_rate
+        self.tolerance: float = tolerance
+        self.iterations: int = iterations
+        self.history: str = history
+        self.step: int = step
+        self.size: int = size
+        self.output: bool = output
+        self.checkpoint: Checkpoint = checkpoint
+        self.workers: int = workers
+        self.features: list = features
+        self.key: str = key
+        self.chunksize: int = chunksize
+        self.batchsize: int = batchsize
+        self.shuffle: int = shuffle
+        self.epochs: int = epochs
+        self.seed: int = seed
+        self.scalers: dict = None
+        self.weights: list = None
+        self.coefficients: tuple = None
+        self.statistics: dict = None
+        self.histories: dict = None
+        self.models: dict = None
+        self.lock: threading.Lock = threading.Lock()
+
+    def __repr__(self) -> str:
+
+        """
+        Returns the representation of the model.
+        """
+
+        if self.key is not None: return f'LinearRegressor(key={ self.key !r}, models={ None if self.models is None else len(self.models) })'
+        return f'LinearRegressor(engine={ self.engine !r}, solver={ self.solver !r}, coefficients={ self.coefficients })'
+
+    def __getstate__(self) -> dict:
+
+        """
+        Returns the state of the model without its lock, so that it
+        can be sent to or returned by a worker process.
+        """
+
+        return {name: value for name, value in self.__dict__.items() if name != 'lock'}
+
+    def __setstate__(self, state: dict) -> None:
+
+        """
+        Restores the state of the model with a new lock.
+        """
+
+        self.__dict__.update(state)
+        self.lock = threading.Lock()
+
+    @property
+    def fitted(self) -> bool:
+
+        """
+        Tells whether the model was fitted or loaded.
+        """
+
+        return self.weights is not None or self.models is not None
+
+    @property
+    def thetas(self) -> list:
+
+        """
+        Returns the thetas in the normalized space of the scalers of the model:
+        theta0 and theta1, or theta0 and one theta per feature.
+        """
+
+        if not self.fitted: raise Exception('Model is not fitted yet, call fit beforehand.')
+        if self.models is not None: raise Exception(f"Model holds one model per '{ self.key }', see models.")
+        return list(self.weights)
+
+    def fit(self, x_km: list, y_price: list, groups: list = None) -> LinearRegressor:
+
+        """
+        Trains the model from scratch on a set of data points.
+
+        Args:
+            x_km (list): List or array of mileage values (matrix of feature values, one column per feature, for a model with features).
+            y_price (list): List or array of corresponding price values.
+            groups (list): List or array of the group of each data point, for a model per group (default: None).
+
+        Returns:
+            model (LinearRegressor): The model itself.
+        """
+
+        if self.key is not None: return self.partition(x_km, y_price, groups)
+        if groups is not None: raise Exception('Groups are only available for a model with a key.')
+        if self.features is not None: return self.regress(x_km, y_price)
+        x_km, y_price = self.arrays(x_km, y_price)
+        with self.lock:
+            if self.solver == 'exact': self.solve(ft_moments(x_km, y_price))
+            else: self.descend(x_km, y_price, {'km': Scaler().fit(x_km), 'price': Scaler().fit(y_price)}, None)
+        return self
+
+    def fit_statistics(self, statistics: dict) -> LinearRegressor:
+
+        """
+        Fits the model exactly from sufficient statistics accumulated
+        elsewhere, e.g. by train.ft_accumulate while streaming a csv file.
+
+        Args:
+            statistics (dict): Sufficient statistics of the data (see train.ft_accumulate).
+
+        Returns:
+            model (LinearRegressor): The model itself.
+        """
+
+        self.mileage('fit_statistics')
+        with self.lock: self.solve(dict(statistics))
+        return self
+
+    def fit_stream(self, path: str, warm: bool = False) -> LinearRegressor:
+
+        """
+        Trains the model while streaming a csv file (or Shards) in chunks,
+        so that memory is bounded by the chunk size rather than by the
+        number of rows. The exact solver accumulates the sufficient
+        statistics of the rows in a single pass (see train.ft_accumulate),
+        gradient descent scans the bounds of the data then runs by
+        mini-batches, one epoch per pass (see train.ft_train_stream).
+        In warm start, the exact solver folds the rows into the statistics
+        of the model, and gradient descent resumes from its coefficients,
+        with bounds widened by the rows when needed.
+
+        Args:
+            path (str): Path to csv file, or Shards.
+            warm (bool): Update the model instead of fitting it from scratch (default: False).
+
+        Returns:
+            model (LinearRegressor): The model itself.
+        """
+
+        self.mileage('fit_stream')
+        with self.lock:
+            if self.solver == 'exact':
+                if warm and self.statistics is None and self.fitted:
+                    raise Exception('An exact model can only be updated from its statistics (see fit_statistics).')
+                with telemetry.stage('train') as stage:
+                    statistics: dict = ft_accumulate(path, self.chunksize, self.statistics if warm else None, self.output)
+                    self.solve(statistics)
+                    stage.rows = statistics['rows']
+                return self
+            with telemetry.stage('normalize') as stage:
+                bounds: dict = ft_bounds(path, self.chunksize, self.output)
+                stage.rows = bounds['rows']
+                if warm and self.fitted:
+                    bounds['km'].partial_fit(self.scalers['km'].bounds)
+                    bounds['price'].partial_fit(self.scalers['price'].bounds)
+            start: list = ft_unfold(self.coefficients, bounds) if warm and self.fitted else None
+            controller: Convergence = Convergence(self.learning_rate, self.tolerance, self.epochs or ft_epochs(bounds['rows'], self.batchsize))
+            with telemetry.stage('train', bounds['rows']):
+                histories: dict = ft_train_stream(path, bounds, self.chunksize, self.batchsize, self.shuffle, self.output, History(self.history, self.step, self.size), start, controller, self.seed)
+            self.replace({'km': bounds['km'], 'price': bounds['price']}, histories)
+        return self
+
+    def partial_fit(self, x_km: list, y_price: list) -> LinearRegressor:
+
+        """
+        Updates the model with new data points, without the ones it was
+        fitted on. The exact solver merges the statistics of the new rows
+        into those of the model, so the result is the same as fitting on
+        all rows. Gradient descent resumes from the current coefficients
+        (warm start), with bounds widened by the new rows when needed.
+        An unfitted model is simply fitted.
+
+        Args:
+            x_km (list): List or array of new mileage values.
+            y_price (list): List or array of corresponding new price values.
+
+        Returns:
+            model (LinearRegressor): The model itself.
+        """
+
+        self.mileage('partial_fit')
+        x_km, y_price = self.arrays(x_km, y_price)
+        with self.lock:
+            if self.solver == 'exact' and self.statistics is None and self.fitted:
+                raise Exception('An exact model can only be updated from its statistics (see fit_statistics).')
+            if self.solver == 'exact': self.solve(ft_merge(self.statistics or {'rows': 0}, ft_moments(x_km, y_price)))
+            elif not self.fitted: self.descend(x_km, y_price, {'km': Scaler().fit(x_km), 'price': Scaler().fit(y_price)}, None)
+            else:
+                scalers: dict = {name: Scaler(*self.scalers[name].bounds).partial_fit(data) for name, data in (('km', x_km), ('price', y_price))}
+                self.descend(x_km, y_price, scalers, ft_unfold(self.coefficients, scalers))
+        return self
+
+    def resume(self, x_km: list, y_price: list, state: dict) -> LinearRegressor:
+
+        """
+        Resumes a gradient descent run from a checkpoint (see
+        checkpoint.ft_checkpoint_read), on the same data points it was
+        started on. The run goes on exactly as if it had never stopped,
+        so it ends with the same thetas, bit for bit.
+
+        Args:
+            x_km (list): List or array of mileage values.
+            y_price (list): List or array of corresponding price values.
+            state (dict): State of the run at the checkpoint.
+
+        Returns:
+            model (LinearRegressor): The model itself.
+        """
+
+        from checkpoint import ft_checkpoint_restore
+
+        self.mileage('resume')
+        x_km, y_price = self.arrays(x_km, y_price)
+        if state['rows'] != len(x_km): raise Exception(f"Checkpoint was taken on { state['rows'] } rows, not { len(x_km) }.")
+        with self.lock: self.descend(x_km, y_price, {'km': Scaler(*state['km']), 'price': Scaler(*state['price'])}, state['thetas'], ft_checkpoint_restore(state))
+        return self
+
+    def predict(self, km: list, groups: list = None) -> numpy.ndarray:
+
+        """
+        Predicts the price of one or many cars (see predict.ft_price).
+
+        Args:
+            km (list): Mileage, or list or array of mileages (values of the features for a model with features:
+                a list for a single car, or a matrix with one row per car).
+            groups (list): Group of the cars, or list or array of the group of each car, for a model per group (default: None).
+
+        Returns:
+            prices (numpy.ndarray): Predicted price or array of predicted prices.
+        """
+
+        from predict import ft_price
+
+        models: dict = self.models
+        coefficients: tuple = self.coefficients
+        if models is not None:
+            if groups is None: raise Exception(f"Model holds one model per '{ self.key }', groups must be given.")
+            if isinstance(groups, str): return self.route(groups).predict(km)
+            groups = pandas.Series(groups)
+            intercepts: numpy.ndarray = groups.map({group: model.coefficients[0] for group, model in models.items()}).to_numpy(dtype=numpy.float64)
+            if numpy.isnan(intercepts).any(): raise Exception(f"Unknown { self.key } '{ groups[numpy.isnan(intercepts)].iloc[0] }', no model was trained for it.")
+            slopes: numpy.ndarray = groups.map({group: model.coefficients[1] for group, model in models.items()}).to_numpy(dtype=numpy.float64)
+            return ft_price({'coefficients': (intercepts, slopes)}, numpy.asarray(km, dtype=numpy.float64))
+        if groups is not None: raise Exception('Groups are only available for a model with a key.')
+        if coefficients is None: raise Exception('Model is not fitted yet, call fit beforehand.')
+        if self.features is not None: return ft_price({'features': self.features, 'coefficients': coefficients}, km)
+        if isinstance(km, (int, float)): return ft_price({'coefficients': coefficients}, km)
+        return ft_price({'coefficients': coefficients}, numpy.asarray(km, dtype=numpy.float64))
+
+    def route(self, group: str) -> LinearRegressor:
+
+        """
+        Returns the model of a group, for a model per group.
+
+        Args:
+            group (str): Group of the model.
+
+        Returns:
+            model (LinearRegressor): Model of the group.
+        """
+
+        if self.models is None: raise Exception('Groups are only available for a model with a key.')
+        if group not in self.models: raise Exception(f"Unknown { self.key } '{ group }', no model was trained for it.")
+        return self.models[group]
+
+    def score(self, x_km: list, y_price: list) -> float:
+
+        """
+        Returns the coefficient of determination (R²) of the model on a
+        set of data points: 1 for perfect predictions, 0 for predictions
+        no better than the mean price.
+
+        Args:
+            x_km (list): List or array of mileage values.
+            y_price (list): List or array of corresponding price values.
+
+        Returns:
+            score (float): R² of the model on the data points.
+        """
+
+        self.mileage('score')
+        x_km, y_price = self.arrays(x_km, y_price, 1)
+        residuals: numpy.ndarray = y_price - self.predict(x_km)
+        deviations: numpy.ndarray = y_price - y_price.mean()
+        total: float = float(deviations.dot(deviations))
+        if total == 0: raise Exception('Score is undefined for constant prices.')
+        return 1 - float(residuals.dot(residuals)) / total
+
+    def save(self, path: str = PATH_THETAS) -> None:
+
+        """
+        Saves the model as a new generation of a thetas file (see train.ft_save),
+        with its statistics if it was fitted by the exact solver. Models
+        with features or per group are saved in their own formats (see
+        train.ft_save_features and train.ft_save_groups).
+
+        Args:
+            path (str): Path to the thetas csv file (default: 'thetas.csv').
+
+        Returns:
+            None
+        """
+
+        if not self.fitted: raise Exception('Model is not fitted yet, call fit beforehand.')
+        if self.models is not None: ft_save_groups({group: (model.thetas, model.scalers) for group, model in self.models.items()}, self.key, path, self.output)
+        elif self.features is not None: ft_save_features(self.thetas, self.scalers, self.features, path, self.output)
+        else: ft_save(self.thetas, self.scalers, path, self.output, self.statistics)
+
+    @classmethod
+    def load(cls, path: str = PATH_THETAS, required: bool = True, **settings) -> LinearRegressor:
+
+        """
+        Loads a model saved in a thetas file, of the mileage alone, with
+        features or per group, to predict with it or to update it with
+        partial_fit.
+
+        Args:
+            path (str): Path to the thetas csv file (default: 'thetas.csv').
+            required (bool): Fail if the file is not found, otherwise warn and return an unfitted model
+                predicting with the default thetas 0.0, every price being 0.0 (default: True).
+            settings (dict): Settings of the model (see __init__).
+
+        Returns:
+            model (LinearRegressor): The loaded model.
+        """
+
+        from predict import ft_thetas
+
+        model: LinearRegressor = cls(**settings)
+        if required and not os.path.isfile(path): raise Exception(f'Model { path } not found.')
+        loaded: dict = ft_thetas(path, model.output)
+        if loaded is None: model.coefficients = (0.0, 0.0)
+        elif 'groups' in loaded:
+            model.key, model.models = loaded['key'], {}
+            for group, routed in loaded['groups'].items():
+                model.models[group] = cls(**settings)
+                model.models[group].scalers, model.models[group].weights = {'km': routed['km'], 'price': routed['price']}, list(routed['thetas'])
+                model.models[group].coefficients = tuple(routed['coefficients'])
+        elif 'features' in loaded:
+            model.features, model.scalers, model.weights = loaded['features'], loaded['scalers'], list(loaded['thetas'])
+            model.coefficients = loaded['coefficients']
+        else:
+            model.scalers, model.weights = {'km': loaded['km'], 'price': loaded['price']}, list(loaded['thetas'])
+            model.coefficients = tuple(loaded['coefficients'])
+        return model
+
+    def mileage(self, method: str) -> None:
+
+        """
+        Checks that the model is a model of the mileage alone, the only
+        kind some methods are available for.
+
+        Args:
+            method (str): Name of the method.
+
+        Returns:
+            None
+        """
+
+        if self.features is not None or self.key is not None or self.models is not None:
+            raise Exception(f'Method { method } is only available for models of the mileage alone.')
+
+    def arrays(self, x_km: list, y_price: list, rows: int = 2) -> tuple:
+
+        """
+        Checks a set of data points and returns it as float arrays.
+
+        Args:
+            x_km (list): List or array of mileage values.
+            y_price (list): List or array of corresponding price values.
+            rows (int): Minimum number of data points (default: 2).
+
+        Returns:
+            data (tuple): Arrays of mileage and price values.
+        """
+
+        x_km = numpy.ascontiguousarray(x_km, dtype=numpy.float64).ravel()
+        y_price = numpy.ascontiguousarray(y_price, dtype=numpy.float64).ravel()
+        if len(x_km) != len(y_price): raise Exception('Mileages and prices must have the same length.')
+        if len(x_km) < rows: raise Exception('Not enought data to train program.')
+        if numpy.isnan(x_km).any() or numpy.isnan(y_price).any(): raise Exception('Data is corrupted, Nan values.')
+        return x_km, y_price
+
+    def descend(self, x_km: numpy.ndarray, y_price: numpy.ndarray, scalers: dict, start: list, run: tuple = None) -> None:
+
+        """
+        Runs gradient descent with the engine of the model, then
+        replaces its scalers and coefficients. Called with the lock held.
+
+        Args:
+            x_km (numpy.ndarray): Array of mileage values.
+            y_price (numpy.ndarray): Array of corresponding price values.
+            scalers (dict): Dictionary containing the scalers of km and price.
+            start (list): Initial theta0 and theta1 (None to start from zero).
+            run (tuple): Convergence controller and History of a resumed run (default: None, a new run).
+
+        Returns:
+            None
+        """
+
+        from parallel import ft_train_parallel
+
+        if scalers['km'].minimum == scalers['km'].maximum or scalers['price'].minimum == scalers['price'].maximum:
+            raise Exception('Constant column(s) cannot be normalized.')
+        controller, history = run or (Convergence(self.learning_rate, self.tolerance, self.iterations), History(self.history, self.step, self.size))
+        normalized: tuple = scalers['km'].transform(x_km), scalers['price'].transform(y_price)
+        if self.checkpoint is not None: self.checkpoint.context.update({'engine': self.engine, 'rows': len(x_km), 'km': scalers['km'].bounds, 'price': scalers['price'].bounds})
+        if self.engine == 'numpy': histories: dict = ft_train_vectorized(*normalized, self.output, controller, history, start, self.checkpoint)
+        elif self.engine == 'parallel': histories = ft_train_parallel(*normalized, self.output, controller, history, start, self.checkpoint, self.workers)
+        else: histories = ft_train(normalized[0].tolist(), normalized[1].tolist(), self.output, controller, history, start, self.checkpoint)
+        self.replace(scalers, histories)
+
+    def solve(self, statistics: dict) -> None:
+
+        """
+        Solves the least-squares fit exactly from sufficient statistics,
+        then replaces the statistics, scalers and coefficients of the
+        model. Called with the lock held.
+
+        Args:
+            statistics (dict): Sufficient statistics of the data.
+
+        Returns:
+            None
+        """
+
+        histories: dict = ft_solve(statistics, self.output)
+        self.statistics = statistics
+        self.replace({'km': Scaler(statistics['km_min'], statistics['km_max']), 'price': Scaler(statistics['price_min'], statistics['price_max'])}, histories)
+
+    def replace(self, scalers: dict, histories: dict) -> None:
+
+        """
+        Replaces the scalers, thetas and coefficients of the model by
+        those of a run. Called with the lock held.
+
+        Args:
+            scalers (dict): Dictionary containing the scalers of km and price.
+            histories (dict): History and report of the run.
+
+        Returns:
+            None
+        """
+
+        thetas: list = [histories['theta0'][-1], histories['theta1'][-1]]
+        self.scalers, self.histories, self.weights = scalers, histories, thetas
+        self.coefficients = ft_fold(thetas, scalers)
+
+    def regress(self, x: list, y_price: list) -> LinearRegressor:
+
+        """
+        Trains a model with features from scratch: each feature is scaled
+        on its own, then gradient descent runs on the Gram matrix of the
+        data, or the exact solver solves the normal equations
+        (see train.ft_train_matrix and train.ft_solve_matrix).
+
+        Args:
+            x (list): Matrix of feature values, one column per feature.
+            y_price (list): List or array of corresponding price values.
+
+        Returns:
+            model (LinearRegressor): The model itself.
+        """
+
+        x = numpy.asarray(x, dtype=numpy.float64)
+        y_price = numpy.ascontiguousarray(y_price, dtype=numpy.float64).ravel()
+        if x.ndim != 2 or x.shape[1] != len(self.features): raise Exception(f'Feature values must be a matrix with one column per feature ({ len(self.features) }).')
+        if len(x) != len(y_price): raise Exception('Feature values and prices must have the same length.')
+        if len(x) < 2: raise Exception('Not enought data to train program.')
+        if numpy.isnan(x).any() or numpy.isnan(y_price).any(): raise Exception('Data is corrupted, Nan values.')
+        minimums, maximums = x.min(axis=0), x.max(axis=0)
+        scalers: dict = {name: Scaler(float(minimum), float(maximum)) for name, minimum, maximum in zip(self.features, minimums, maximums)}
+        scalers['price'] = Scaler().fit(y_price)
+        constant: list = [name for name, scaler in scalers.items() if scaler.minimum == scaler.maximum]
+        if constant: raise Exception(f"Constant column(s) cannot be normalized: { ', '.join(constant) }.")
+        normalized: numpy.ndarray = x - minimums
+        normalized /= maximums - minimums
+        with self.lock:
+            if self.solver == 'exact': histories: dict = ft_solve_matrix(normalized, scalers['price'].transform(y_price), self.output)
+            else: histories = ft_train_matrix(normalized, scalers['price'].transform(y_price), self.output, Convergence(self.learning_rate, self.tolerance, self.iterations))
+            self.scalers, self.histories, self.weights = scalers, histories, list(histories['thetas'])
+            self.coefficients = ft_fold_features(self.weights, scalers, self.features)
+        return self
+
+    def partition(self, x_km: list, y_price: list, groups: list) -> LinearRegressor:
+
+        """
+        Trains one model per group from scratch, spreading the groups
+        across worker processes (see train.ft_train_groups): each group
+        gets its own scalers and convergence controller.
+
+        Args:
+            x_km (list): List or array of mileage values.
+            y_price (list): List or array of corresponding price values.
+            groups (list): List or array of the group of each data point.
+
+        Returns:
+            model (LinearRegressor): The model itself.
+        """
+
+        if groups is None: raise Exception(f"A model per '{ self.key }' needs the group of each data point.")
+        x_km, y_price = self.arrays(x_km, y_price)
+        groups = numpy.asarray(groups).ravel()
+        if len(groups) != len(x_km): raise Exception('Groups and mileages must have the same length.')
+        data: pandas.DataFrame = pandas.DataFrame({self.key: groups, 'km': x_km, 'price': y_price})
+        with self.lock:
+            results, reports = ft_train_groups(data, self.key, Convergence(self.learning_rate, self.tolerance, self.iterations), self.workers, self.output)
+            models: dict = {}
+            for (group, (thetas, scalers)), report in zip(results.items(), reports):
+                models[group] = LinearRegressor(self.engine, self.solver, self.learning_rate, self.tolerance, self.iterations)
+                models[group].scalers, models[group].histories, models[group].weights = scalers, report, list(thetas)
+                models[group].coefficients = ft_fold(thetas, scalers)
+            self.models = models
+        return self
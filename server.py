@@ -0,0 +1,209 @@
+# Imports
+# -------
+
+from __future__ import annotations
+import asyncio, json
+from predict import ft_predict
+from regressor import LinearRegressor
+from tools import *
+
+
+# Globals
+# -------
+
+HOST = '127.0.0.1'
+PORT = 4242
+RELOAD_INTERVAL = 0.5
+
+
+# Functions
+# ---------
+
+def ft_stamp(path: str) -> tuple:
+
+    """
+    Returns what identifies a version of the thetas file on disk,
+    so that changes can be detected without reading it.
+
+    Args:
+        path (str): Path to the thetas csv file.
+
+    Returns:
+        stamp (tuple): Inode, size and modification time of the file (None if not found).
+    """
+
+    try:
+        stat: os.stat_result = os.stat(path)
+        return stat.st_ino, stat.st_size, stat.st_mtime_ns
+    except OSError: return None
+
+# ----------
+
+def ft_answer(model: LinearRegressor, line: str) -> str:
+
+    """
+    Answers a single request of the line protocol:
+    - a plain mileage (e.g. '100000') is answered by a plain price,
+    - {"km": 100000} is answered by {"price": ...},
+    - {"km": [100000, 50000, ...]} is answered by {"prices": [...]} (batch).
+    With a model of many features, requests must be JSON objects holding
+    every feature, e.g. {"km": 100000, "age": 5} (or lists of values).
+    With a keyed model, JSON requests must name their group, e.g.
+    {"km": 100000, "group": "clio"}, and plain mileages are refused.
+    Errors are answered by 'error: ...' or {"error": ...} respectively.
+
+    Args:
+        model (LinearRegressor): Model used to predict (see LinearRegressor.load).
+        line (str): Request received from the client.
+
+    Returns:
+        answer (str): Answer to send back, without the trailing newline.
+    """
+
+    keyed: bool = model.models is not None
+    features: list = model.features
+
+    if features is not None:
+        try:
+            request = json.loads(line)
+            values = [request[name] for name in features]
+            if all(isinstance(value, list) for value in values):
+                values = numpy.asarray(values, dtype=numpy.float64).T
+                if not (values >= 0).all(): return json.dumps({'error': 'values cannot be negative'})
+                return json.dumps({'prices': model.predict(values).round(2).tolist()})
+            values = [float(value) for value in values]
+            if not all(value >= 0 for value in values): return json.dumps({'error': 'values cannot be negative'})
+            return json.dumps({'price': round(ft_predict(model, values, False), 2)})
+        except (ValueError, TypeError, KeyError, AttributeError): return json.dumps({'error': 'request must be {' + ', '.join(f'"{ name }": number' for name in features) + '}'})
+    if not line.startswith('{'):
+        if keyed: return 'error: model is keyed, send {"km": number, "group": name}'
+        try: km: float = float(line)
+        except ValueError: return 'error: mileage must be a number'
+        if not km >= 0: return 'error: mileage cannot be negative'
+        return str(round(ft_predict(model, km, False), 2))
+    try:
+        request: dict = json.loads(line)
+        km = request['km']
+        if keyed:
+            if str(request.get('group')) not in model.models: return json.dumps({'error': f"unknown { model.key } { json.dumps(request.get('group')) }"})
+            model = model.models[str(request['group'])]
+        if isinstance(km, list):
+            km = numpy.asarray(km, dtype=numpy.float64)
+            if not (km >= 0).all(): return json.dumps({'error': 'mileages cannot be negative'})
+            return json.dumps({'prices': model.predict(km).round(2).tolist()})
+        km = float(km)
+        if not km >= 0: return json.dumps({'error': 'mileage cannot be negative'})
+        return json.dumps({'price': round(ft_predict(model, km, False), 2)})
+    except (ValueError, TypeError, KeyError, AttributeError): return json.dumps({'error': 'request must be {"km": number} or {"km": [numbers]}'})
+
+# ----------
+
+async def ft_reload(state: dict, path: str, output: bool = True) -> None:
+
+    """
+    Watches the thetas file and swaps in the new model when it changes.
+    The model is replaced by a single assignment once fully loaded,
+    so requests being answered keep the model they started with and
+    a file caught half-written is simply retried at the next tick.
+
+    Args:
+        state (dict): Shared state of the server holding the current model and its stamp.
+        path (str): Path to the thetas csv file.
+        output (bool): Print output messages (default: True).
+
+    Returns:
+        None
+    """
+
+    while True:
+        await asyncio.sleep(RELOAD_INTERVAL)
+        stamp: tuple = ft_stamp(path)
+        if stamp is None or stamp == state['stamp']: continue
+        try:
+            state['model'] = LinearRegressor.load(path)
+            state['stamp'] = stamp
+            if output: print(message(f'Model reloaded from { path } √'))
+        except Exception as exc:
+            if output: print(error(f'[ WARNING ]: Model not reloaded, { exc }'))
+
+# ----------
+
+async def ft_serve(path: str = PATH_THETAS, host: str = HOST, port: int = PORT, socket: str = None, output: bool = True) -> None:
+
+    """
+    Runs the prediction server: the model is loaded once, then every
+    line received from a client is answered with ft_answer, until
+    the server is interrupted.
+
+    Args:
+        path (str): Path to the thetas csv file (default: 'thetas.csv').
+        host (str): Host to listen on (default: '127.0.0.1').
+        port (int): TCP port to listen on (default: 4242).
+        socket (str): Path of a Unix socket to listen on instead of TCP (default: None).
+        output (bool): Print output messages (default: True).
+
+    Returns:
+        None
+    """
+
+    state: dict = {'stamp': ft_stamp(path), 'model': LinearRegressor.load(path, False, output=output)}
+
+    async def ft_client(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while line := await reader.readline():
+                writer.write((ft_answer(state['model'], line.decode().strip()) + '\n').encode())
+                await writer.drain()
+        except ConnectionError: pass
+        finally: writer.close()
+
+    if socket is not None: server: asyncio.AbstractServer = await asyncio.start_unix_server(ft_client, socket)
+    else: server = await asyncio.start_server(ft_client, host, port)
+    if output: print(message(f'2. Listening on { socket if socket is not None else f"{ host }:{ port }" }... (Ctrl+C to stop)'))
+    async with server:
+        reload: asyncio.Task = asyncio.create_task(ft_reload(state, path, output))
+        try: await server.serve_forever()
+        finally: reload.cancel()
+
+
+# Main function
+# -------------
+
+def ft_main(args: list) -> None:
+
+    """
+        Main function.
+
+        Args:
+            args (list): List of arguments that can be either:
+                path (str): Optional argument to specify path to csv file (default: 'thetas.csv').
+                -host (str): Optional host to listen on (default: '127.0.0.1').
+                -port (int): Optional TCP port to listen on (default: 4242).
+                -socket (str): Optional Unix socket to listen on instead of TCP (default: None).
+
+        Returns:
+            None
+    """
+
+    host: str = ft_option(args, '-host', HOST)
+    port: int = ft_option(args, '-port', PORT, int)
+    socket: str = ft_option(args, '-socket')
+
+    if len(args) > 1:
+        raise Exception("Please provide path to CSV or/and options only, or no arguments at all to use default path 'thetas.csv'.")
+    asyncio.run(ft_serve(PATH_THETAS if len(args) == 0 else args[0], host, port, socket))
+
+
+# Main
+# ----
+
+if __name__ == '__main__':
+
+    try:
+        print(header(f'------------------------- PREDICTION SERVER -------------------------\n'))
+        ft_main(sys.argv[1:])
+        sys.exit(0)
+
+    except (KeyboardInterrupt, EOFError): print(error('\n[ WARNING ]: Server stopped by user.'))
+    except Exception as exc:
+        print(error(f'[ ERROR ]: { exc }'))
+        sys.exit(1)
@@ -0,0 +1,282 @@
+# Imports
+# -------
+
+from __future__ import annotations
+import glob, weakref, collections, concurrent.futures
+from tools import *
+
+
+# Globals
+# -------
+
+SHARD_SUFFIXES = ('.csv', '.csv.gz', '.csv.bz2', '.csv.xz')
+SHARD_ERRORS = 10
+SHARD_MEMORY = 0
+SHARD_COLUMNS = ('km', 'price')
+SHARD_REASONS = (None, 'missing {}', '{} is not a number', 'negative {}')
+
+
+# Functions
+# ---------
+
+def ft_sharded(sources: list) -> bool:
+
+    """
+    Tells whether training sources must be read as shards: several
+    paths, a directory, a glob pattern or a compressed csv file,
+    rather than the single plain csv file the program always read.
+
+    Args:
+        sources (list): Paths passed as arguments.
+
+    Returns:
+        sharded (bool): True if the sources must be read as shards.
+    """
+
+    if len(sources) != 1: return len(sources) > 1
+    return os.path.isdir(sources[0]) or glob.has_magic(sources[0]) or sources[0].endswith(SHARD_SUFFIXES[1:])
+
+# ----------
+
+def ft_shards(sources: list) -> list:
+
+    """
+    Lists the shard files of training sources, each source being a csv
+    file (plain, .gz, .bz2 or .xz), a directory (every csv file it holds)
+    or a glob pattern (e.g. 'DataSets/daily/*.csv.gz').
+
+    Args:
+        sources (list): Paths, directories or glob patterns.
+
+    Returns:
+        files (list): Sorted paths of the shard files, without duplicates.
+    """
+
+    files: list = []
+
+    for source in sources:
+        if os.path.isdir(source): found: list = sorted(os.path.join(source, name) for name in os.listdir(source) if name.endswith(SHARD_SUFFIXES))
+        elif glob.has_magic(source): found = sorted(path for path in glob.glob(source) if path.endswith(SHARD_SUFFIXES))
+        elif not source.endswith(SHARD_SUFFIXES): raise Exception(f"Data file '{ source }' is corrupted, wrong file extension (must be { ', '.join(SHARD_SUFFIXES) }).")
+        elif not os.path.isfile(source): raise Exception(f"Data file '{ source }' not found.")
+        else: found = [source]
+        if not found: raise Exception(f"No csv file found in '{ source }'.")
+        files += [path for path in found if path not in files]
+    return files
+
+# ----------
+
+def ft_read_shard(path: str) -> tuple:
+
+    """
+    Parses and validates a shard in a worker process of Shards.
+    Compression is inferred from the file extension. Invalid rows
+    (missing, non-numeric or negative values) are left out and reported
+    with their line number instead of failing the whole shard; a shard
+    that cannot be read or does not hold the 'km' and 'price' columns
+    is an error.
+
+    Args:
+        path (str): Path to the shard.
+
+    Returns:
+        shard (tuple): Arrays of the valid mileage and price values, and report of the shard.
+    """
+
+    try: data: pandas.DataFrame = pandas.read_csv(path)
+    except PermissionError: raise Exception(f"Data file '{ path }' is corrupted, permission denied.")
+    except FileNotFoundError: raise Exception(f"Data file '{ path }' not found.")
+    except (OSError, EOFError, ValueError) as exc: raise Exception(f"Data file '{ path }' is corrupted, cannot be read ({ exc }).")
+    if set(data.columns) != set(SHARD_COLUMNS): raise Exception(f"Data file '{ path }' is corrupted, columns must be { ' and '.join(SHARD_COLUMNS) }.")
+    columns: dict = {}
+    codes: dict = {}
+    for name in SHARD_COLUMNS:
+        values: numpy.ndarray = pandas.to_numeric(data[name], errors='coerce').to_numpy(dtype=numpy.float64)
+        code: numpy.ndarray = numpy.zeros(len(values), dtype=numpy.int8)
+        code[values < 0] = 3
+        code[numpy.isnan(values)] = 2
+        code[data[name].isna().to_numpy()] = 1
+        columns[name], codes[name] = values, code
+    valid: numpy.ndarray = (codes['km'] == 0) & (codes['price'] == 0)
+    invalid: numpy.ndarray = numpy.flatnonzero(~valid)
+    report: dict = {
+        'path': path,
+        'rows': int(valid.sum()),
+        'invalid': len(invalid),
+        'errors': [(int(row) + 2, next(SHARD_REASONS[codes[name][row]].format(name) for name in SHARD_COLUMNS if codes[name][row])) for row in invalid[:SHARD_ERRORS]],
+    }
+    return columns['km'][valid], columns['price'][valid], report
+
+
+# Classes
+# -------
+
+class Shards:
+
+    """
+    Training data spread over many csv files, read as a stream:
+    shards are parsed and validated by a pool of worker processes, a
+    few of them ahead of the one being consumed, and handed over one by
+    one, so that they are never gathered in a single DataFrame.
+    Can be passed wherever a path to a csv file is read in chunks
+    (see train.ft_chunks) and iterated many times, e.g. once per pass.
+    The pool is started on the first pass and kept for the next ones
+    (it is shut down by close, or once the Shards are garbage collected).
+    Parsed shards can be kept in memory up to a budget, so that later
+    passes only decompress and parse the shards that did not fit; there
+    is none by default, so that memory stays bounded by the shards
+    being parsed whatever the size of the data.
+    """
+
+    def __init__(self, files: list, workers: int = None, strict: bool = False, memory: int = SHARD_MEMORY) -> None:
+
+        """
+        Args:
+            files (list): Paths of the shard files (see ft_shards).
+            workers (int): Number of worker processes (default: number of CPUs).
+            strict (bool): Fail on the first invalid row instead of leaving it out (default: False).
+            memory (int): Bytes of parsed shards kept in memory for later passes, 0 to parse them on every pass (default: 0).
+        """
+
+        self.files: list = files
+        self.workers: int = min(workers or os.cpu_count() or 1, len(files))
+        self.strict: bool = strict
+        self.memory: int = memory
+        self.reports: dict = {}
+        self.parsed: dict = {}
+        self.kept: int = 0
+        self.pool: concurrent.futures.ProcessPoolExecutor = None
+        self.finalizer: weakref.finalize = None
+
+    def __str__(self) -> str:
+
+        """
+        Returns a description of the shards, for messages.
+        """
+
+        return f'{ len(self.files) } shard(s)'
+
+    def __enter__(self) -> Shards:
+
+        return self
+
+    def __exit__(self, *exc) -> bool:
+
+        self.close()
+        return False
+
+    def __iter__(self):
+
+        """
+        Reads the shards in order, with at most twice as many shards
+        parsed ahead as there are workers. Shards kept in memory by a
+        previous pass are handed over as they are (read-only).
+
+        Yields:
+            shard (tuple): Arrays of the valid mileage and price values of a shard.
+        """
+
+        files = iter(self.files)
+        pending: collections.deque = collections.deque()
+
+        try:
+            for path in files:
+                pending.append((path, self.submit(path)))
+                if len(pending) == self.workers * 2: break
+            while pending:
+                path, future = pending.popleft()
+                following: str = next(files, None)
+                if following is not None: pending.append((following, self.submit(following)))
+                if future is None:
+                    yield self.parsed[path]
+                    continue
+                x_km, y_price, report = future.result()
+                self.report(report)
+                if self.kept + x_km.nbytes + y_price.nbytes <= self.memory:
+                    x_km.flags.writeable = y_price.flags.writeable = False
+                    self.parsed[path] = x_km, y_price
+                    self.kept += x_km.nbytes + y_price.nbytes
+                yield x_km, y_price
+        finally:
+            for _, future in pending:
+                if future is not None: future.cancel()
+
+    def submit(self, path: str) -> concurrent.futures.Future:
+
+        """
+        Hands a shard over to the pool of workers, started on first use,
+        unless it is kept in memory.
+
+        Args:
+            path (str): Path to the shard.
+
+        Returns:
+            future (concurrent.futures.Future): Future of ft_read_shard (None if the shard is kept in memory).
+        """
+
+        if path in self.parsed: return None
+        if self.pool is None:
+            self.pool = concurrent.futures.ProcessPoolExecutor(max_workers=self.workers)
+            self.finalizer = weakref.finalize(self, self.pool.shutdown)
+        return self.pool.submit(ft_read_shard, path)
+
+    def close(self) -> None:
+
+        """
+        Shuts the pool of workers down and drops the shards kept in memory.
+
+        Returns:
+            None
+        """
+
+        if self.finalizer is not None: self.finalizer()
+        self.pool, self.finalizer = None, None
+        self.parsed, self.kept = {}, 0
+
+    def chunks(self, chunksize: int = CHUNK_SIZE):
+
+        """
+        Reads the shards as chunks of at most chunksize rows.
+
+        Args:
+            chunksize (int): Number of rows per chunk (default: 100000).
+
+        Yields:
+            chunk (tuple): Arrays of mileage and price values of the chunk.
+        """
+
+        for x_km, y_price in self:
+            for start in range(0, len(x_km), chunksize):
+                yield x_km[start:start + chunksize], y_price[start:start + chunksize]
+
+    def report(self, report: dict) -> None:
+
+        """
+        Records the report of a shard and outputs its invalid rows,
+        the first time it is read only.
+
+        Args:
+            report (dict): Report returned by ft_read_shard.
+
+        Returns:
+            None
+        """
+
+        if report['path'] in self.reports: return
+        self.reports[report['path']] = report
+        if report['invalid'] == 0: return
+        if self.strict: raise Exception(f"Data file '{ report['path'] }' is corrupted, line { report['errors'][0][0] }: { report['errors'][0][1] }.")
+        print(error(f"\n[ WARNING ]: { report['path'] }: { report['invalid'] } invalid row(s) left out"))
+        for line, reason in report['errors']:
+            print(error(f'   - line { line }: { reason }'))
+        if report['invalid'] > len(report['errors']): print(error(f"   - ... and { report['invalid'] - len(report['errors']) } more"))
+
+    def summary(self) -> str:
+
+        """
+        Returns a summary of the reports of the shards read so far.
+        """
+
+        rows: int = sum(report['rows'] for report in self.reports.values())
+        invalid: int = sum(report['invalid'] for report in self.reports.values())
+        return f'{ len(self.reports) } shard(s), { rows } row(s) loaded, { invalid } invalid row(s) left out'
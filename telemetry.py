@@ -0,0 +1,245 @@
+# Imports
+# -------
+
+from __future__ import annotations
+import time, json, resource
+from tools import *
+
+
+# Globals
+# -------
+
+METRICS_PROMETHEUS = ('.prom', '.txt')
+METRICS_PREFIX = 'ft'
+
+
+# Functions
+# ---------
+
+def ft_rss_reset() -> None:
+
+    """
+    Resets the peak resident memory of the process, so that the next
+    call to ft_rss_peak measures the peak of a single stage.
+    Only available on Linux, elsewhere the peak of the whole process is measured.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+
+    try:
+        with open('/proc/self/clear_refs', 'w') as file: file.write('5')
+    except OSError: pass
+
+# ----------
+
+def ft_rss_peak() -> float:
+
+    """
+    Returns the peak resident memory of the process since the last ft_rss_reset.
+
+    Args:
+        None
+
+    Returns:
+        peak (float): Peak resident memory (in MiB).
+    """
+
+    try:
+        with open('/proc/self/status') as file:
+            for line in file:
+                if line.startswith('VmHWM:'): return int(line.split()[1]) / 1024
+    except OSError: pass
+    peak: int = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1024 ** 2 if sys.platform == 'darwin' else peak / 1024
+
+
+# Classes
+# -------
+
+class Stage:
+
+    """
+    Measures one stage of a program (see Telemetry.stage): its duration,
+    number of rows and peak resident memory, recorded when it ends.
+    The number of rows can be set while the stage runs, once known.
+    """
+
+    def __init__(self, telemetry: Telemetry = None, name: str = None, rows: int = None) -> None:
+
+        """
+        Args:
+            telemetry (Telemetry): Telemetry recording the stage.
+            name (str): Name of the stage.
+            rows (int): Number of rows processed by the stage (default: None).
+        """
+
+        self.telemetry: Telemetry = telemetry
+        self.name: str = name
+        self.rows: int = rows
+        self.start: float = None
+
+    def __enter__(self) -> Stage:
+
+        ft_rss_reset()
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> bool:
+
+        duration: float = time.perf_counter() - self.start
+        self.telemetry.stages.append({'stage': self.name, 'duration': duration, 'rows': self.rows, 'peak_rss': ft_rss_peak()})
+        return False
+
+# ----------
+
+class NoStage(Stage):
+
+    """
+    Stage of a disabled telemetry: it measures nothing, so that
+    instrumented code costs a method call when telemetry is off.
+    """
+
+    def __enter__(self) -> Stage: return self
+
+    def __exit__(self, *exc) -> bool: return False
+
+# ----------
+
+class Telemetry:
+
+    """
+    Records the stages of a run of a program (cache, load, validate, normalize,
+    train, save, plot, predict, precision) and a few gauges (iterations,
+    iterations per second, final loss...), then writes them as JSON or
+    in the Prometheus text format, and optionally profiles the run with cProfile.
+    Telemetry is disabled until started: stages then record nothing.
+    """
+
+    def __init__(self) -> None:
+
+        self.enabled: bool = False
+        self.program: str = None
+        self.metrics: str = None
+        self.profile: str = None
+        self.profiler = None
+        self.stages: list = []
+        self.gauges: dict = {}
+        self.none: NoStage = NoStage()
+
+    def start(self, program: str, metrics: str = None, profile: str = None) -> None:
+
+        """
+        Enables telemetry for a run of a program.
+
+        Args:
+            program (str): Name of the program ('train' or 'predict').
+            metrics (str): Path of the metrics file, Prometheus text format for .prom and .txt files, JSON otherwise (default: None).
+            profile (str): Path of the cProfile dump, readable with pstats or snakeviz (default: None).
+
+        Returns:
+            None
+        """
+
+        self.enabled, self.program, self.metrics, self.profile = True, program, metrics, profile
+        if profile is not None:
+            import cProfile
+            self.profiler = cProfile.Profile()
+            self.profiler.enable()
+
+    def stage(self, name: str, rows: int = None) -> Stage:
+
+        """
+        Returns the context measuring a stage, e.g.: with telemetry.stage('load') as stage: ...
+
+        Args:
+            name (str): Name of the stage.
+            rows (int): Number of rows processed by the stage, if known beforehand (default: None).
+
+        Returns:
+            stage (Stage): Context measuring the stage.
+        """
+
+        return Stage(self, name, rows) if self.enabled else self.none
+
+    def gauge(self, name: str, value: float) -> None:
+
+        """
+        Records a value describing the run, e.g. the number of iterations.
+
+        Args:
+            name (str): Name of the gauge.
+            value (float): Value of the gauge.
+
+        Returns:
+            None
+        """
+
+        if self.enabled: self.gauges[name] = value
+
+    def prometheus(self) -> str:
+
+        """
+        Formats the stages and gauges in the Prometheus text format.
+        A stage run several times is reported once: its durations and
+        rows are summed, and the highest of its peak memories is kept.
+
+        Args:
+            None
+
+        Returns:
+            text (str): Metrics in the Prometheus text format.
+        """
+
+        lines: list = []
+        stages: dict = {}
+        metrics: tuple = (
+            ('stage_duration_seconds', 'Wall time of each stage.', 'duration', 1),
+            ('stage_rows', 'Number of rows processed by each stage.', 'rows', 1),
+            ('stage_peak_rss_bytes', 'Peak resident memory of the process during each stage.', 'peak_rss', 1024 ** 2),
+        )
+
+        for stage in self.stages:
+            if stage['stage'] not in stages: stages[stage['stage']] = dict(stage)
+            else:
+                merged: dict = stages[stage['stage']]
+                merged['duration'] += stage['duration']
+                merged['rows'] = None if merged['rows'] is None or stage['rows'] is None else merged['rows'] + stage['rows']
+                merged['peak_rss'] = max(merged['peak_rss'], stage['peak_rss'])
+        for name, description, field, scale in metrics:
+            lines += [f'# HELP { METRICS_PREFIX }_{ name } { description }', f'# TYPE { METRICS_PREFIX }_{ name } gauge']
+            lines += [f'{ METRICS_PREFIX }_{ name }{{program="{ self.program }",stage="{ stage["stage"] }"}} { stage[field] * scale!r}' for stage in stages.values() if stage[field] is not None]
+        for name, value in self.gauges.items():
+            lines += [f'# TYPE { METRICS_PREFIX }_{ self.program }_{ name } gauge', f'{ METRICS_PREFIX }_{ self.program }_{ name } { float(value)!r}']
+        return '\n'.join(lines) + '\n'
+
+    def finish(self) -> None:
+
+        """
+        Stops profiling and writes the metrics and profile files, if telemetry was started.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+
+        if not self.enabled: return
+        self.enabled = False
+        if self.profiler is not None:
+            self.profiler.disable()
+            self.profiler.dump_stats(self.profile)
+        if self.metrics is None: return
+        with open(self.metrics, 'w') as file:
+            if self.metrics.endswith(METRICS_PROMETHEUS): file.write(self.prometheus())
+            else: json.dump({'program': self.program, 'stages': self.stages, 'gauges': self.gauges}, file, indent=4)
+
+
+# Telemetry of the running program
+# --------------------------------
+
+telemetry = Telemetry()
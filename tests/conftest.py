@@ -0,0 +1,6 @@
+# Imports
+# -------
+
+import os, sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,79 @@
+# Imports
+# -------
+
+import io, re, pathlib, pytest
+from train import ft_save
+from predict import ft_main_batch
+from tools import *
+
+
+# Globals
+# -------
+
+THETAS = (0.9393188765236112, -1.0035756025267633)
+SCALERS = {'km': Scaler(22899.0, 240000.0), 'price': Scaler(3650.0, 8290.0)}
+
+
+# Fixtures
+# --------
+
+@pytest.fixture
+def thetas(tmp_path: pathlib.Path) -> str:
+
+    path: str = str(tmp_path / 'thetas.csv')
+    ft_save(THETAS, SCALERS, path, False)
+    return path
+
+
+# Functions
+# ---------
+
+def ft_expected(mileages: list) -> list:
+
+    intercept, slope = ft_fold(THETAS, SCALERS)
+    return [round(max(intercept + slope * km, 0.0), 2) for km in mileages]
+
+
+# Tests
+# -----
+
+@pytest.mark.parametrize('content', ['km\n240000\n139800\n0\n', '240000\n139800\n0\n'])
+def test_batch_from_stdin_with_or_without_header(thetas: str, tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch, content: str) -> None:
+
+    target: str = str(tmp_path / 'prices.csv')
+    monkeypatch.setattr(sys, 'stdin', io.TextIOWrapper(io.BufferedReader(io.BytesIO(content.encode()))))
+    ft_main_batch(thetas, '-', target)
+    frame: pandas.DataFrame = pandas.read_csv(target)
+
+    assert list(frame.columns) == ['km', 'price']
+    assert frame['km'].tolist() == [240000, 139800, 0]
+    assert frame['price'].tolist() == pytest.approx(ft_expected([240000, 139800, 0]), abs=1e-9)
+
+# ----------
+
+def test_batch_in_chunks_matches_single_chunk(thetas: str, tmp_path: pathlib.Path) -> None:
+
+    from predict import ft_batch
+    from regressor import LinearRegressor
+
+    source: str = str(tmp_path / 'mileages.csv')
+    pandas.DataFrame({'km': numpy.arange(0, 250000, 997)}).to_csv(source, index=False)
+    model: LinearRegressor = LinearRegressor.load(thetas)
+    chunked, whole = io.StringIO(), io.StringIO()
+
+    assert ft_batch(model, source, chunked, 7, False) == ft_batch(model, source, whole, 1000000, False) == len(range(0, 250000, 997))
+    assert chunked.getvalue() == whole.getvalue()
+
+# ----------
+
+@pytest.mark.parametrize('content, problem', [('km\n1000\n-5\n', 'negative value(s)'), ('km\n1000\nabc\n', 'wrong data type'), ('mileage\n1000\n', "missing 'km' column")])
+def test_batch_error_leaves_no_partial_file(thetas: str, tmp_path: pathlib.Path, content: str, problem: str) -> None:
+
+    source: str = str(tmp_path / 'mileages.csv')
+    target: str = str(tmp_path / 'prices.csv')
+    with open(source, 'w') as file: file.write(content)
+    with open(target, 'w') as file: file.write('previous\n')
+
+    with pytest.raises(Exception, match=re.escape(problem)): ft_main_batch(thetas, source, target)
+    with open(target) as file: assert file.read() == 'previous\n'
+    assert not os.path.exists(f'{ target }.tmp')
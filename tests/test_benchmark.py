@@ -0,0 +1,27 @@
+# Imports
+# -------
+
+import pytest
+from benchmark import ft_benchmark_pipeline, ft_compare, PIPELINE_STAGES
+from tools import *
+
+
+# Tests
+# -----
+
+def test_pipeline_measures_every_stage(capsys: pytest.CaptureFixture) -> None:
+
+    results: list = ft_benchmark_pipeline([1000])
+
+    assert [result['stage'] for result in results] == list(PIPELINE_STAGES)
+    assert all(result['rows'] == 1000 and result['time'] > 0 and result['peak_rss'] > 0 for result in results)
+
+# ----------
+
+def test_compare_flags_regressions_above_threshold(capsys: pytest.CaptureFixture) -> None:
+
+    before: dict = {'engines': [{'rows': 100, 'loop': 1.0, 'numpy': 0.1}], 'pipeline': [{'rows': 100, 'stage': 'load', 'time': 1.0, 'peak_rss': 50.0}]}
+    after: dict = {'engines': [{'rows': 100, 'baseline': 9.0, 'loop': 1.05, 'numpy': 0.2}], 'pipeline': [{'rows': 100, 'stage': 'load', 'time': 1.0, 'peak_rss': 50.5}]}
+    regressions: list = ft_compare(before, after, 0.1)
+
+    assert [(regression['benchmark'], regression['measure']) for regression in regressions] == [('engines', 'numpy')]
@@ -0,0 +1,88 @@
+# Imports
+# -------
+
+import shutil, pathlib, pytest
+from train import ft_dataset
+from cache import ft_cache_path, ft_cache_header, ft_cache_read, ft_cache_invalidate
+from tools import *
+
+
+# Globals
+# -------
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+# Fixtures
+# --------
+
+@pytest.fixture
+def data(tmp_path: pathlib.Path) -> str:
+
+    path: str = str(tmp_path / 'data.csv')
+    shutil.copyfile(os.path.join(ROOT, PATH_DATA), path)
+    ft_dataset(path, output=False)
+    return path
+
+
+# Functions
+# ---------
+
+def ft_touch(path: str, seconds: int = 60) -> None:
+
+    stat: os.stat_result = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + seconds * 10 ** 9))
+
+
+# Tests
+# -----
+
+def test_fresh_cache_is_memory_mapped(data: str) -> None:
+
+    x_km, y_price = ft_cache_read(data)
+    frame: pandas.DataFrame = pandas.read_csv(data)
+
+    assert isinstance(x_km, numpy.memmap) and isinstance(y_price, numpy.memmap)
+    assert x_km.tolist() == frame['km'].tolist() and y_price.tolist() == frame['price'].tolist()
+
+# ----------
+
+def test_size_change_invalidates_cache(data: str) -> None:
+
+    with open(data) as file: content: str = file.read()
+    with open(data, 'w') as file: file.write(content.rstrip('\n') + '\n10000,9000\n')
+
+    assert ft_cache_read(data) is None
+    assert ft_dataset(data, output=False)[0][-1] == 10000.0
+    assert ft_cache_read(data)[0][-1] == 10000.0
+
+# ----------
+
+def test_mtime_change_alone_keeps_cache(data: str) -> None:
+
+    ft_touch(data)
+
+    assert ft_cache_read(data) is not None
+    assert ft_cache_header(ft_cache_path(data))[0]['mtime_ns'] == os.stat(data).st_mtime_ns
+
+# ----------
+
+def test_content_change_of_same_size_invalidates_cache(data: str) -> None:
+
+    with open(data) as file: content: str = file.read()
+    with open(data, 'w') as file: file.write(content.replace('240000', '240001', 1))
+    ft_touch(data)
+
+    assert ft_cache_read(data) is None
+    assert ft_dataset(data, output=False)[0][0] == 240001.0
+
+# ----------
+
+def test_corrupted_or_invalidated_cache_is_not_used(data: str) -> None:
+
+    with open(ft_cache_path(data), 'r+b') as file: file.truncate(os.path.getsize(ft_cache_path(data)) - 8)
+
+    assert ft_cache_read(data) is None
+    assert ft_cache_invalidate(data) is True
+    assert ft_cache_invalidate(data) is False
+    assert ft_dataset(data, False, False)[0][0] == 240000.0 and not os.path.exists(ft_cache_path(data))
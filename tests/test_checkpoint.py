@@ -0,0 +1,59 @@
+# Imports
+# -------
+
+import numpy, pytest
+from checkpoint import Checkpoint, ft_checkpoint_read
+from regressor import LinearRegressor
+
+
+# Classes
+# -------
+
+class Interrupted(Exception): pass
+
+class Killer(Checkpoint):
+
+    """
+    Checkpoint stopping the run right after its first save, as if the
+    process had been killed then.
+    """
+
+    def save(self, *args) -> None:
+
+        super().save(*args)
+        raise Interrupted
+
+
+# Tests
+# -----
+
+@pytest.mark.parametrize('engine', ['numpy', 'loop'])
+def test_resume_is_bit_identical(tmp_path, engine: str) -> None:
+
+    generator: numpy.random.Generator = numpy.random.default_rng(7)
+    x_km: numpy.ndarray = generator.uniform(0, 250000, 2000).round()
+    y_price: numpy.ndarray = (8500 - 0.0214 * x_km + generator.normal(0, 650, len(x_km))).round()
+    settings: dict = {'engine': engine, 'tolerance': 0.0, 'iterations': 300, 'history': 'every'}
+    path: str = str(tmp_path / 'checkpoint.bin')
+
+    expected: LinearRegressor = LinearRegressor(**settings).fit(x_km, y_price)
+    with pytest.raises(Interrupted): LinearRegressor(**settings, checkpoint=Killer(path, 120, 0)).fit(x_km, y_price)
+    state: dict = ft_checkpoint_read(path)
+    assert state['iteration'] == 120
+    resumed: LinearRegressor = LinearRegressor(**settings).resume(x_km, y_price, state)
+
+    assert resumed.thetas == expected.thetas
+    assert resumed.coefficients == expected.coefficients
+    for key in ('theta0', 'theta1', 'loss'):
+        assert list(resumed.histories[key]) == list(expected.histories[key])
+    assert resumed.histories['iterations'] == expected.histories['iterations']
+
+# ----------
+
+def test_resume_refuses_other_rows(tmp_path) -> None:
+
+    x_km: numpy.ndarray = numpy.linspace(0, 250000, 100)
+    path: str = str(tmp_path / 'checkpoint.bin')
+
+    with pytest.raises(Interrupted): LinearRegressor(checkpoint=Killer(path, 10, 0)).fit(x_km, 8500 - 0.02 * x_km)
+    with pytest.raises(Exception, match='Checkpoint was taken on 100 rows'): LinearRegressor().resume(x_km[:50], 8500 - 0.02 * x_km[:50], ft_checkpoint_read(path))
@@ -0,0 +1,62 @@
+# Imports
+# -------
+
+import pytest
+from train import ft_train_vectorized, Convergence
+from tools import *
+
+
+# Tests
+# -----
+
+def test_worse_step_is_rejected_and_halves_learning_rate() -> None:
+
+    controller: Convergence = Convergence(0.5, 1e-14, 100)
+
+    assert controller.adjust(1.0, 2.0, [1.0, 1.0]) is False
+    assert controller.learning_rate == 0.25 and controller.iteration == 1 and controller.reason is None
+
+# ----------
+
+def test_better_step_is_accepted_and_grows_learning_rate() -> None:
+
+    controller: Convergence = Convergence(0.5, 1e-14, 100)
+
+    assert controller.adjust(1.0, 0.5, [1.0, 1.0]) is True
+    assert controller.learning_rate == pytest.approx(0.525, rel=1e-15) and controller.reason is None
+
+# ----------
+
+@pytest.mark.parametrize('loss, candidate, gradient, accepted, reason', [
+    (1.0, 0.5, [1e-9, 0.0], False, 'gradient norm below tolerance'),
+    (1.0, 1.0 - 1e-9, [1.0, 1.0], True, 'relative improvement below tolerance'),
+])
+def test_run_stops_below_tolerance(loss: float, candidate: float, gradient: list, accepted: bool, reason: str) -> None:
+
+    controller: Convergence = Convergence(0.5, 1e-6, 100)
+
+    assert controller.adjust(loss, candidate, gradient) is accepted
+    assert controller.reason == reason and not controller.running()
+
+# ----------
+
+def test_run_stops_after_maximum_iterations() -> None:
+
+    controller: Convergence = Convergence(0.5, 0.0, 3)
+    steps: int = 0
+
+    while controller.running():
+        controller.adjust(1.0 - steps * 0.1, 0.9 - steps * 0.1, [1.0, 1.0])
+        steps += 1
+    assert steps == 3 and controller.report()['reason'] == 'maximum iterations reached'
+
+# ----------
+
+def test_diverging_learning_rate_recovers() -> None:
+
+    x_km: numpy.ndarray = numpy.linspace(0.0, 1.0, 100)
+    y_price: numpy.ndarray = 1.0 - 0.8 * x_km
+    histories: dict = ft_train_vectorized(x_km, y_price, False, Convergence(50.0, 1e-14, 100000))
+
+    assert histories['reason'] != 'maximum iterations reached'
+    assert (histories['theta0'][-1], histories['theta1'][-1]) == pytest.approx((1.0, -0.8), abs=1e-6)
@@ -0,0 +1,42 @@
+# Imports
+# -------
+
+import pytest
+from train import ft_train, ft_train_vectorized, Convergence
+from benchmark import ft_dataset, ft_train_baseline
+from tools import *
+
+
+# Functions
+# ---------
+
+def ft_normalized(rows: int) -> tuple:
+
+    x_km, y_price = ft_dataset(rows)
+    return (x_km - x_km.min()) / (x_km.max() - x_km.min()), (y_price - y_price.min()) / (y_price.max() - y_price.min())
+
+
+# Tests
+# -----
+
+def test_loop_and_numpy_engines_agree() -> None:
+
+    x_km, y_price = ft_normalized(500)
+    loop: dict = ft_train(x_km.tolist(), y_price.tolist(), False)
+    vectorized: dict = ft_train_vectorized(x_km, y_price, False)
+
+    assert loop['iterations'] == vectorized['iterations']
+    for key in ('theta0', 'theta1'): assert loop[key][-1] == pytest.approx(vectorized[key][-1], abs=1e-6)
+
+# ----------
+
+def test_engines_reach_the_fit_of_the_baseline_loop() -> None:
+
+    x_km, y_price = ft_normalized(500)
+    exact: numpy.ndarray = numpy.polyfit(x_km, y_price, 1)
+    vectorized: dict = ft_train_vectorized(x_km, y_price, False, Convergence(LEARNING_RATE, TOLERANCE, MAX_ITERATIONS))
+    baseline: dict = ft_train_baseline(x_km.tolist(), y_price.tolist())
+
+    assert len(baseline['loss']) == ITERATIONS
+    assert vectorized['theta1'][-1] == pytest.approx(exact[0], abs=1e-6)
+    assert vectorized['loss'][-1] == pytest.approx(baseline['loss'][-1], rel=1e-9)
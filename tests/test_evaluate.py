@@ -0,0 +1,98 @@
+# Imports
+# -------
+
+import shutil, pathlib, pytest
+from evaluate import ft_assign, ft_check, ft_evaluate
+from tools import *
+
+
+# Globals
+# -------
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+# Fixtures
+# --------
+
+@pytest.fixture
+def data(tmp_path: pathlib.Path) -> str:
+
+    path: str = str(tmp_path / 'data.csv')
+    shutil.copyfile(os.path.join(ROOT, PATH_DATA), path)
+    return path
+
+
+# Tests
+# -----
+
+@pytest.mark.parametrize('rows, folds', [(24, 5), (24, 24), (1000, 7), (3, 2)])
+def test_folds_are_balanced(rows: int, folds: int) -> None:
+
+    sizes: numpy.ndarray = numpy.bincount(ft_assign(0, rows, folds), minlength=folds)
+
+    assert sizes.sum() == rows and sizes.max() - sizes.min() <= 1
+
+# ----------
+
+def test_assignment_does_not_depend_on_chunks() -> None:
+
+    whole: numpy.ndarray = ft_assign(0, 1000, 7, seed=3)
+    chunks: numpy.ndarray = numpy.concatenate([ft_assign(start, min(start + 13, 1000) - start, 7, seed=3) for start in range(0, 1000, 13)])
+
+    assert numpy.array_equal(whole, chunks)
+    assert not numpy.array_equal(whole, ft_assign(0, 1000, 7, seed=4))
+
+# ----------
+
+def test_holdout_holds_out_its_fraction() -> None:
+
+    labels: numpy.ndarray = ft_assign(0, 100000, holdout=0.2)
+
+    assert set(labels.tolist()) == {0, -1}
+    assert (labels == 0).mean() == pytest.approx(0.2, abs=0.01)
+
+# ----------
+
+def test_fold_metrics_match_a_direct_computation(data: str) -> None:
+
+    evaluation: dict = ft_evaluate(data, 4, solver='exact')
+    frame: pandas.DataFrame = pandas.read_csv(data)
+    labels: numpy.ndarray = ft_assign(0, len(frame), 4)
+
+    for result in evaluation['splits']:
+        training, validation = frame[labels != result['split']], frame[labels == result['split']]
+        slope, intercept = numpy.polyfit(training['km'], training['price'], 1)
+        residuals: numpy.ndarray = validation['price'].to_numpy() - (intercept + slope * validation['km'].to_numpy())
+        assert (result['training_rows'], result['validation_rows']) == (len(training), len(validation))
+        assert result['mae'] == pytest.approx(numpy.abs(residuals).mean(), rel=1e-9)
+        assert result['rmse'] == pytest.approx(numpy.sqrt((residuals ** 2).mean()), rel=1e-9)
+        assert result['max_error'] == pytest.approx(numpy.abs(residuals).max(), rel=1e-9)
+    assert evaluation['summary']['mae']['splits'] == 4
+
+# ----------
+
+def test_gradient_and_exact_folds_agree(data: str) -> None:
+
+    gradient: dict = ft_evaluate(data, 3, solver='gradient', workers=1)
+    exact: dict = ft_evaluate(data, 3, solver='exact')
+
+    for first, second in zip(gradient['splits'], exact['splits']):
+        assert first['rmse'] == pytest.approx(second['rmse'], rel=1e-6)
+
+# ----------
+
+def test_undefined_r2_is_left_out_of_the_mean(data: str) -> None:
+
+    evaluation: dict = ft_evaluate(data, 24, solver='exact')
+
+    assert all(result['validation_rows'] == 1 and result['r2'] is None for result in evaluation['splits'])
+    assert evaluation['summary']['r2'] is None and evaluation['summary']['mae']['splits'] == 24
+
+# ----------
+
+def test_split_sizes_are_checked(data: str) -> None:
+
+    with pytest.raises(Exception, match=r'is empty \(24 rows for 30 split\(s\)\)'): ft_evaluate(data, 30, solver='exact')
+    with pytest.raises(Exception, match='is empty'): ft_check(10, {0: 5, 1: 0})
+    with pytest.raises(Exception, match='Split 0 has not enought training data'): ft_check(3, {0: 2})
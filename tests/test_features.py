@@ -0,0 +1,62 @@
+# Imports
+# -------
+
+import pathlib, pytest
+from regressor import LinearRegressor
+from predict import ft_thetas, ft_price
+from tools import *
+
+
+# Globals
+# -------
+
+FEATURES = ['km', 'age', 'power']
+INTERCEPT = 150.0
+SLOPES = [2.0, -1.0, 0.5]
+
+
+# Fixtures
+# --------
+
+@pytest.fixture(scope='module')
+def data() -> tuple:
+
+    x: numpy.ndarray = numpy.random.default_rng(0).uniform(0.0, 100.0, (300, len(FEATURES)))
+    return x, INTERCEPT + x @ numpy.array(SLOPES)
+
+
+# Tests
+# -----
+
+@pytest.mark.parametrize('solver, tolerance', [('exact', 1e-9), ('gradient', 1e-4)])
+def test_features_fit_like_least_squares(data: tuple, solver: str, tolerance: float) -> None:
+
+    model: LinearRegressor = LinearRegressor(solver=solver, features=FEATURES).fit(*data)
+    intercept, slopes = model.coefficients
+
+    assert intercept == pytest.approx(INTERCEPT, rel=tolerance)
+    assert slopes == pytest.approx(SLOPES, rel=tolerance)
+
+# ----------
+
+def test_nearly_collinear_features_are_solved(data: tuple) -> None:
+
+    x, y = data
+    nearly: numpy.ndarray = numpy.column_stack((x, x[:, 0] * 2.0 + numpy.random.default_rng(1).normal(0.0, 1e-6, len(x))))
+    model: LinearRegressor = LinearRegressor(solver='exact', features=FEATURES + ['double']).fit(nearly, y)
+
+    assert model.predict(nearly) == pytest.approx(y, rel=1e-6)
+    with pytest.raises(Exception, match='collinear'): LinearRegressor(solver='exact', features=FEATURES + ['double']).fit(numpy.column_stack((x, x[:, 0] * 2.0)), y)
+
+# ----------
+
+def test_features_file_round_trip(data: tuple, tmp_path: pathlib.Path) -> None:
+
+    path: str = str(tmp_path / 'thetas.csv')
+    model: LinearRegressor = LinearRegressor(solver='exact', features=FEATURES).fit(*data)
+    model.save(path)
+    loaded: dict = ft_thetas(path, False)
+
+    assert loaded['features'] == FEATURES
+    assert ft_price(loaded, [10.0, 20.0, 30.0]) == pytest.approx(INTERCEPT + 20.0 - 20.0 + 15.0, rel=1e-9)
+    assert ft_price(loaded, data[0][:5]) == pytest.approx(data[1][:5], rel=1e-9)
@@ -0,0 +1,83 @@
+# Imports
+# -------
+
+import pathlib, pytest
+from regressor import LinearRegressor
+from predict import ft_route
+from tools import *
+
+
+# Globals
+# -------
+
+LINES = {'clio': (9000.0, -0.02), 'zoe': (12000.0, -0.03), 'twingo': (6000.0, -0.01)}
+
+
+# Fixtures
+# --------
+
+@pytest.fixture(scope='module')
+def data() -> tuple:
+
+    generator: numpy.random.Generator = numpy.random.default_rng(0)
+    groups: numpy.ndarray = numpy.repeat(list(LINES), 200)
+    generator.shuffle(groups)
+    x_km: numpy.ndarray = generator.uniform(10000.0, 200000.0, len(groups))
+    y_price: numpy.ndarray = numpy.array([LINES[group][0] + LINES[group][1] * km for group, km in zip(groups, x_km)])
+    return x_km, y_price, groups
+
+# ----------
+
+@pytest.fixture(scope='module')
+def model(data: tuple) -> LinearRegressor:
+
+    return LinearRegressor(key='model', workers=2).fit(*data)
+
+
+# Tests
+# -----
+
+def test_each_group_gets_its_own_line(model: LinearRegressor) -> None:
+
+    assert sorted(model.models) == sorted(LINES)
+    for group, line in LINES.items(): assert model.route(group).coefficients == pytest.approx(line, rel=1e-6)
+
+# ----------
+
+def test_rows_are_routed_to_the_model_of_their_group(model: LinearRegressor) -> None:
+
+    x_km: list = [50000.0, 50000.0, 150000.0]
+    groups: list = ['zoe', 'clio', 'twingo']
+    expected: list = [max(LINES[group][0] + LINES[group][1] * km, 0.0) for group, km in zip(groups, x_km)]
+
+    assert model.predict(x_km, groups) == pytest.approx(expected, rel=1e-6)
+    assert model.predict(50000.0, 'zoe') == pytest.approx(expected[0], rel=1e-6)
+
+# ----------
+
+def test_group_models_match_models_trained_alone(model: LinearRegressor, data: tuple) -> None:
+
+    x_km, y_price, groups = data
+
+    for group in LINES:
+        alone: LinearRegressor = LinearRegressor().fit(x_km[groups == group], y_price[groups == group])
+        assert model.route(group).coefficients == alone.coefficients
+
+# ----------
+
+def test_unknown_or_missing_group_is_refused(model: LinearRegressor) -> None:
+
+    with pytest.raises(Exception, match="Unknown model 'megane'"): model.predict([1000.0, 1000.0], ['clio', 'megane'])
+    with pytest.raises(Exception, match="Unknown model 'megane'"): model.route('megane')
+    with pytest.raises(Exception, match='groups must be given'): model.predict(1000.0)
+
+# ----------
+
+def test_keyed_file_round_trip(model: LinearRegressor, tmp_path: pathlib.Path) -> None:
+
+    path: str = str(tmp_path / 'thetas.csv')
+    model.save(path)
+    loaded: LinearRegressor = LinearRegressor.load(path)
+
+    assert loaded.key == 'model'
+    for group in LINES: assert ft_route(loaded, group).coefficients == pytest.approx(model.route(group).coefficients, rel=1e-15)
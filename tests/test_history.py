@@ -0,0 +1,58 @@
+# Imports
+# -------
+
+import pytest
+from train import ft_train_vectorized, History, Convergence
+from tools import *
+
+
+# Functions
+# ---------
+
+def ft_run(history: History, iterations: int) -> dict:
+
+    for iteration in range(1, iterations + 1):
+        if history.wants(iteration): history.record(iteration, float(iteration), -float(iteration), 1.0 / iteration)
+    return history.histories(iterations, float(iterations), -float(iterations), 1.0 / iterations)
+
+
+# Tests
+# -----
+
+@pytest.mark.parametrize('iterations', [3, 5, 6, 17])
+def test_ring_keeps_the_last_iterations_in_order(iterations: int) -> None:
+
+    histories: dict = ft_run(History('ring', 1, 5), iterations)
+    expected: list = list(range(max(1, iterations - 4), iterations + 1))
+
+    assert list(histories['iteration']) == expected
+    assert list(histories['theta0']) == [float(iteration) for iteration in expected]
+    assert list(histories['loss']) == [1.0 / iteration for iteration in expected]
+
+# ----------
+
+def test_ring_with_step_ends_with_the_final_state() -> None:
+
+    histories: dict = ft_run(History('ring', 3, 4), 20)
+
+    assert list(histories['iteration']) == [12, 15, 18, 20]
+    assert histories['theta0'][-1] == 20.0
+
+# ----------
+
+def test_every_with_step_and_off_modes() -> None:
+
+    assert list(ft_run(History('every', 4), 10)['iteration']) == [4, 8, 10]
+    assert list(ft_run(History('every', 5), 10)['iteration']) == [5, 10]
+    assert {key: list(values) for key, values in ft_run(History('off'), 10).items()} == {'iteration': [10], 'theta0': [10.0], 'theta1': [-10.0], 'loss': [0.1]}
+
+# ----------
+
+def test_history_mode_does_not_change_the_fit() -> None:
+
+    x_km: numpy.ndarray = numpy.linspace(0.0, 1.0, 50)
+    y_price: numpy.ndarray = 1.0 - 0.8 * x_km
+    runs: list = [ft_train_vectorized(x_km, y_price, False, Convergence(), History(*settings)) for settings in (('every',), ('off',), ('ring', 7, 10))]
+
+    assert len({(run['theta0'][-1], run['theta1'][-1], run['iterations']) for run in runs}) == 1
+    assert len(runs[2]['iteration']) == 10 and runs[2]['iteration'][-1] == runs[0]['iteration'][-1]
@@ -0,0 +1,73 @@
+# Imports
+# -------
+
+import re, pathlib, pytest
+from train import ft_save
+from predict import ft_thetas, ft_price
+from tools import *
+
+
+# Globals
+# -------
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+THETAS = (0.9393188765236112, -1.0035756025267633)
+
+
+# Tests
+# -----
+
+def test_fold_predicts_like_normalized_model() -> None:
+
+    scalers: dict = {'km': Scaler(22899.0, 240000.0), 'price': Scaler(3650.0, 8290.0)}
+    intercept, slope = ft_fold(THETAS, scalers)
+
+    for km in (22899.0, 100000.0, 240000.0):
+        normalized: float = THETAS[0] + THETAS[1] * float(scalers['km'].transform(km))
+        assert intercept + slope * km == pytest.approx(float(scalers['price'].inverse_transform(normalized)), rel=1e-12)
+
+# ----------
+
+def test_model_predicts_without_data_file(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> None:
+
+    scalers: dict = {'km': Scaler(22899.0, 240000.0), 'price': Scaler(3650.0, 8290.0)}
+    monkeypatch.chdir(tmp_path)
+    ft_save(THETAS, scalers, 'thetas.csv', False)
+    model: dict = ft_thetas('thetas.csv', False)
+
+    assert model['version'] == MODEL_VERSION
+    assert model['thetas'] == THETAS
+    assert model['coefficients'] == pytest.approx(ft_fold(THETAS, scalers), rel=1e-15)
+    assert ft_price(model, 100000.0) == pytest.approx(model['coefficients'][0] + model['coefficients'][1] * 100000.0)
+
+# ----------
+
+def test_legacy_thetas_fetch_bounds_from_data(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> None:
+
+    path: str = str(tmp_path / 'thetas.csv')
+    with open(path, 'w') as file: file.write(f'theta0,theta1\n{ THETAS[0] },{ THETAS[1] }\n')
+    monkeypatch.chdir(ROOT)
+    model: dict = ft_thetas(path, False)
+    frame: pandas.DataFrame = pandas.read_csv(PATH_DATA)
+    km_min, km_max, price_min, price_max = frame['km'].min(), frame['km'].max(), frame['price'].min(), frame['price'].max()
+
+    assert model['version'] == 0
+    assert model['km'].bounds == (km_min, km_max) and model['price'].bounds == (price_min, price_max)
+    for km in (50000.0, 150000.0):
+        normalized: float = THETAS[1] * (km - km_min) / (km_max - km_min) + THETAS[0]
+        assert ft_price(model, km) == pytest.approx(normalized * (price_max - price_min) + price_min, rel=1e-12)
+
+# ----------
+
+@pytest.mark.parametrize('content, problem', [
+    (f'version,theta0,theta1,km_min,km_max,price_min,price_max,intercept,slope\n{ MODEL_VERSION + 1 },0,0,0,1,0,1,0,0\n', 'unsupported version'),
+    ('version,theta0,theta1,km_min,km_max,price_min,price_max,intercept,slope\n1,0,0,0,1,0,1,0,\n', 'Nan values'),
+    (','.join(MODEL) + ',extra\n1,0,0,0,1,0,1,0,0,0\n', 'unecessary column(s)'),
+    ('theta0\n0\n', 'missing column(s)'),
+])
+def test_corrupted_thetas_are_refused(tmp_path: pathlib.Path, content: str, problem: str) -> None:
+
+    path: str = str(tmp_path / 'thetas.csv')
+    with open(path, 'w') as file: file.write(content)
+
+    with pytest.raises(Exception, match=re.escape(problem)): ft_thetas(path, False)
@@ -0,0 +1,44 @@
+# Imports
+# -------
+
+import numpy, pytest
+from parallel import ft_train_parallel, PARALLEL_BLOCK
+from train import ft_train_vectorized, History, Convergence
+
+
+# Tests
+# -----
+
+@pytest.fixture(scope='module')
+def data() -> tuple:
+
+    generator: numpy.random.Generator = numpy.random.default_rng(3)
+    x_km: numpy.ndarray = generator.uniform(0, 1, PARALLEL_BLOCK * 3 + 1234)
+    return x_km, (1 - 0.8 * x_km + generator.normal(0, 0.05, len(x_km))).clip(0, 1)
+
+# ----------
+
+def ft_run(data: tuple, workers: int) -> dict:
+
+    return ft_train_parallel(*data, False, Convergence(0.5, 1e-12, 200), History('every'), None, None, workers)
+
+# ----------
+
+def test_results_match_across_worker_counts(data: tuple) -> None:
+
+    expected: dict = ft_run(data, 1)
+
+    for workers in (2, 3, 5):
+        histories: dict = ft_run(data, workers)
+        for key in ('theta0', 'theta1', 'loss'):
+            assert list(histories[key]) == list(expected[key])
+        assert histories['iterations'] == expected['iterations']
+
+# ----------
+
+def test_results_match_numpy_engine(data: tuple) -> None:
+
+    parallel: dict = ft_run(data, 2)
+    vectorized: dict = ft_train_vectorized(*data, False, Convergence(0.5, 1e-12, 200), History('off'))
+
+    assert (parallel['theta0'][-1], parallel['theta1'][-1]) == pytest.approx((vectorized['theta0'][-1], vectorized['theta1'][-1]), rel=1e-6)
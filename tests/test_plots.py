@@ -0,0 +1,45 @@
+# Imports
+# -------
+
+import pathlib, pytest
+from train import ft_decimate, ft_plot, ft_train_vectorized
+from tools import *
+
+
+# Tests
+# -----
+
+def test_short_curves_are_kept_whole() -> None:
+
+    x, y = ft_decimate(range(10), range(10), 5)
+
+    assert x.tolist() == list(range(10)) and y.tolist() == list(range(10))
+
+# ----------
+
+def test_decimation_keeps_ends_and_extrema() -> None:
+
+    values: numpy.ndarray = numpy.sin(numpy.linspace(0.0, 20.0, 100001))
+    values[54321] = 5.0
+    values[12345] = -5.0
+    x, y = ft_decimate(range(len(values)), values, 100)
+
+    assert len(y) <= 2 * 100 + 2
+    assert x[0] == 0 and x[-1] == len(values) - 1
+    assert numpy.all(numpy.diff(x) > 0)
+    assert {54321.0, 12345.0} <= set(x.tolist())
+    assert y.max() == 5.0 and y.min() == -5.0
+
+# ----------
+
+@pytest.mark.parametrize('mode', ['auto', 'scatter', 'density', 'sample'])
+def test_plots_render_without_display(tmp_path: pathlib.Path, mode: str) -> None:
+
+    x_km: numpy.ndarray = numpy.random.default_rng(0).uniform(20000.0, 250000.0, 20000)
+    y_price: numpy.ndarray = 9000.0 - 0.02 * x_km
+    scalers: dict = {'km': Scaler().fit(x_km), 'price': Scaler().fit(y_price)}
+    histories: dict = ft_train_vectorized(scalers['km'].transform(x_km), scalers['price'].transform(y_price), False)
+    target: str = str(tmp_path / f'{ mode }.png')
+    ft_plot(x_km, y_price, [histories['theta0'][-1], histories['theta1'][-1]], histories, False, target, mode)
+
+    assert os.path.getsize(target) > 0
@@ -0,0 +1,115 @@
+# Imports
+# -------
+
+import shutil, threading, pathlib, pytest
+from registry import ft_publish, ft_rollback, ft_current, ft_generations, ft_generation_path, ft_companion_path
+from train import ft_load_statistics
+from tools import *
+
+
+# Functions
+# ---------
+
+def ft_read(path: str) -> str:
+
+    with open(path) as file: return file.read()
+
+
+# Tests
+# -----
+
+def test_publish_and_rollback_restore_model_and_statistics(tmp_path: pathlib.Path) -> None:
+
+    path: str = str(tmp_path / 'thetas.csv')
+    statistics: str = str(tmp_path / 'statistics.csv')
+
+    assert ft_publish(path, [['theta0'], ['1']], companions={'statistics.csv': [['rows'], ['10']]}) == 1
+    assert ft_publish(path, [['theta0'], ['2']], companions={'statistics.csv': [['rows'], ['20']]}) == 2
+    assert ft_current(path) == 2
+    assert ft_read(path) == 'theta0\n2\n' and ft_read(statistics) == 'rows,generation\n20,2\n'
+    assert ft_rollback(path) == 1
+    assert ft_current(path) == 1
+    assert ft_read(path) == 'theta0\n1\n' and ft_read(statistics) == 'rows,generation\n10,1\n'
+    assert ft_rollback(path, 2) == 2
+    assert ft_read(path) == 'theta0\n2\n' and ft_read(statistics) == 'rows,generation\n20,2\n'
+
+# ----------
+
+def test_publish_without_statistics_removes_stale_ones(tmp_path: pathlib.Path) -> None:
+
+    path: str = str(tmp_path / 'thetas.csv')
+
+    ft_publish(path, [['theta0'], ['1']], companions={'statistics.csv': [['rows'], ['10']]})
+    ft_publish(path, [['theta0'], ['2']])
+    assert not os.path.exists(tmp_path / 'statistics.csv')
+    assert not os.path.exists(ft_companion_path(path, 2, 'statistics.csv'))
+    ft_rollback(path)
+    assert ft_read(tmp_path / 'statistics.csv') == 'rows,generation\n10,1\n'
+    ft_rollback(path, 2)
+    assert not os.path.exists(tmp_path / 'statistics.csv')
+
+# ----------
+
+def test_statistics_of_another_generation_are_refused(tmp_path: pathlib.Path) -> None:
+
+    path: str = str(tmp_path / 'thetas.csv')
+    statistics: str = str(tmp_path / 'statistics.csv')
+    rows: list = [STATISTICS, [4, 1.0, 2.0, 3.0, 4.0, 5.0, 0.0, 2.0, 1.0, 3.0]]
+
+    ft_publish(path, [['theta0'], ['1']], companions={'statistics.csv': rows})
+    ft_publish(path, [['theta0'], ['2']], companions={'statistics.csv': rows})
+    assert ft_load_statistics(statistics, path)['rows'] == 4
+    shutil.copyfile(ft_companion_path(path, 1, 'statistics.csv'), statistics)
+    with pytest.raises(Exception, match=r'belongs to generation 1 .* not to the current one \(2\)'): ft_load_statistics(statistics, path)
+    with open(statistics, 'w') as file: file.write(f"{ ','.join(STATISTICS) }\n4,1,2,3,4,5,0,2,1,3\n")
+    assert ft_load_statistics(statistics, path)['rows'] == 4
+
+# ----------
+
+def test_publish_keeps_current_generation(tmp_path: pathlib.Path) -> None:
+
+    path: str = str(tmp_path / 'thetas.csv')
+
+    for value in range(1, 4): ft_publish(path, [['theta0'], [str(value)]])
+    ft_rollback(path, 1)
+    ft_publish(path, [['theta0'], ['4']], keep=1)
+    assert ft_current(path) == 4
+    assert ft_generations(path) == [4]
+    ft_rollback(path, 4)
+    with pytest.raises(Exception, match='No generation'): ft_rollback(path)
+
+# ----------
+
+def test_rollback_to_unknown_generation(tmp_path: pathlib.Path) -> None:
+
+    path: str = str(tmp_path / 'thetas.csv')
+
+    ft_publish(path, [['theta0'], ['1']])
+    with pytest.raises(Exception, match='Generation 5 .* not found'): ft_rollback(path, 5)
+
+# ----------
+
+def test_concurrent_publishers_in_threads(tmp_path: pathlib.Path) -> None:
+
+    path: str = str(tmp_path / 'thetas.csv')
+    errors: list = []
+    published: dict = {}
+
+    def ft_publisher(thread: int) -> None:
+
+        try:
+            for value in range(50):
+                rows: list = [['thread', 'value']] + [[thread, value]] * 100
+                published[ft_publish(path, rows, keep=1000, companions={'statistics.csv': [['thread'], [thread]]})] = f'{ thread },{ value }'
+        except Exception as exc: errors.append(exc)
+
+    threads: list = [threading.Thread(target=ft_publisher, args=(thread,)) for thread in range(4)]
+    for thread in threads: thread.start()
+    for thread in threads: thread.join()
+
+    assert errors == []
+    assert sorted(published) == ft_generations(path) == list(range(1, 201))
+    for generation, value in published.items():
+        assert ft_read(ft_generation_path(path, generation)) == 'thread,value\n' + f'{ value }\n' * 100
+    assert ft_current(path) == 200 and ft_read(path) == ft_read(ft_generation_path(path, 200))
+    assert [file for file in os.listdir(tmp_path / 'models') if file.endswith('.tmp')] == []
@@ -0,0 +1,79 @@
+# Imports
+# -------
+
+import pickle, pathlib, concurrent.futures, pytest
+from regressor import LinearRegressor
+from tools import *
+
+
+# Fixtures
+# --------
+
+@pytest.fixture(scope='module')
+def data() -> tuple:
+
+    generator: numpy.random.Generator = numpy.random.default_rng(5)
+    x_km: numpy.ndarray = generator.uniform(20000.0, 250000.0, 500)
+    return x_km, 9000.0 - 0.02 * x_km + generator.normal(0.0, 200.0, len(x_km))
+
+
+# Tests
+# -----
+
+def test_models_trained_in_threads_do_not_share_state(data: tuple) -> None:
+
+    settings: list = [{'tolerance': 1e-14}, {'tolerance': 1e-3}, {'iterations': 5}, {'engine': 'loop', 'iterations': 50}, {'solver': 'exact'}]
+    alone: list = [LinearRegressor(**setting).fit(*data).coefficients for setting in settings]
+
+    with concurrent.futures.ThreadPoolExecutor(len(settings)) as pool:
+        threaded: list = list(pool.map(lambda setting: LinearRegressor(**setting).fit(*data).coefficients, settings * 3))
+    assert threaded == alone * 3
+
+# ----------
+
+def test_fit_predict_score_save_and_load(data: tuple, tmp_path: pathlib.Path) -> None:
+
+    path: str = str(tmp_path / 'thetas.csv')
+    model: LinearRegressor = LinearRegressor(solver='exact').fit(*data)
+    slope, intercept = numpy.polyfit(*data, 1)
+    model.save(path)
+    loaded: LinearRegressor = LinearRegressor.load(path)
+
+    assert model.coefficients == pytest.approx((intercept, slope), rel=1e-9)
+    assert model.predict(100000) == pytest.approx(intercept + slope * 100000, rel=1e-9)
+    assert 0.9 < model.score(*data) <= 1.0
+    assert loaded.coefficients == pytest.approx(model.coefficients, rel=1e-15)
+    assert numpy.array_equal(loaded.predict(data[0]), model.predict(data[0]))
+
+# ----------
+
+def test_unfitted_or_missing_model(tmp_path: pathlib.Path) -> None:
+
+    with pytest.raises(Exception, match='not fitted'): LinearRegressor().predict(1000.0)
+    missing: LinearRegressor = LinearRegressor.load(str(tmp_path / 'missing.csv'), False)
+    assert not missing.fitted and missing.predict(1000.0) == 0.0
+    with pytest.raises(Exception): LinearRegressor.load(str(tmp_path / 'missing.csv'))
+
+# ----------
+
+def test_model_survives_pickling(data: tuple) -> None:
+
+    model: LinearRegressor = LinearRegressor().fit(*data)
+    copy: LinearRegressor = pickle.loads(pickle.dumps(model))
+
+    assert copy.coefficients == model.coefficients and copy.lock is not model.lock
+    assert copy.partial_fit(*data).fitted
+
+# ----------
+
+@pytest.mark.parametrize('settings, problem', [
+    ({'engine': 'gpu'}, "Unknown engine 'gpu'"),
+    ({'solver': 'svd'}, "Unknown solver 'svd'"),
+    ({'history': 'all'}, "Unknown history mode 'all'"),
+    ({'iterations': 0}, 'maximum number of iterations must be positive'),
+    ({'features': ['km', 'age'], 'engine': 'loop'}, 'only trained with the numpy engine'),
+    ({'key': 'model', 'solver': 'exact'}, 'only trained by gradient descent'),
+])
+def test_invalid_settings_are_refused(settings: dict, problem: str) -> None:
+
+    with pytest.raises(Exception, match=problem): LinearRegressor(**settings)
@@ -0,0 +1,45 @@
+# Imports
+# -------
+
+import pytest
+from tools import *
+
+
+# Globals
+# -------
+
+DATA = [240000.0, 139800.0, 150500.0, 185530.0, 176000.0, 114800.0, 166800.0, 89000.0, 144500.0, 84000.0, 22899.0]
+
+
+# Tests
+# -----
+
+def test_scaler_matches_the_original_helpers() -> None:
+
+    minimum, maximum = min(DATA), max(DATA)
+    scaler: Scaler = Scaler().fit(DATA)
+
+    assert scaler.bounds == (minimum, maximum)
+    assert ft_normalize_list(DATA) == pytest.approx([(value - minimum) / (maximum - minimum) for value in DATA], rel=1e-15)
+    assert ft_normalize_value(DATA, 100000.0) == pytest.approx((100000.0 - minimum) / (maximum - minimum), rel=1e-15)
+    assert ft_denormalize_value(DATA, 0.5) == pytest.approx(0.5 * (maximum - minimum) + minimum, rel=1e-15)
+
+# ----------
+
+@pytest.mark.parametrize('value', [22899.0, 100000.0, 240000.0, [1.0, 2.0], numpy.array([3.0, 4.0])])
+def test_inverse_transform_undoes_transform(value) -> None:
+
+    scaler: Scaler = Scaler().fit(DATA)
+
+    assert scaler.inverse_transform(scaler.transform(value)) == pytest.approx(value, rel=1e-12)
+
+# ----------
+
+def test_partial_fit_in_chunks_matches_fit() -> None:
+
+    scaler: Scaler = Scaler()
+    for start in range(0, len(DATA), 3): scaler.partial_fit(DATA[start:start + 3])
+    scaler.partial_fit([])
+
+    assert scaler.bounds == Scaler().fit(DATA).bounds
+    assert Scaler().fit(DATA).fit([1.0, 2.0]).bounds == (1.0, 2.0)
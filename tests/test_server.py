@@ -0,0 +1,85 @@
+# Imports
+# -------
+
+import json, pathlib, pytest
+from train import ft_save, ft_save_groups
+from regressor import LinearRegressor
+from server import ft_answer
+from tools import *
+
+
+# Globals
+# -------
+
+THETAS = (0.9393188765236112, -1.0035756025267633)
+SCALERS = {'km': Scaler(22899.0, 240000.0), 'price': Scaler(3650.0, 8290.0)}
+
+
+# Fixtures
+# --------
+
+@pytest.fixture
+def model(tmp_path: pathlib.Path) -> LinearRegressor:
+
+    path: str = str(tmp_path / 'thetas.csv')
+    ft_save(THETAS, SCALERS, path, False)
+    return LinearRegressor.load(path)
+
+# ----------
+
+@pytest.fixture
+def keyed(tmp_path: pathlib.Path) -> LinearRegressor:
+
+    path: str = str(tmp_path / 'keyed.csv')
+    ft_save_groups({'clio': (THETAS, SCALERS), 'zoe': ((0.5, -0.5), SCALERS)}, 'model', path, False)
+    return LinearRegressor.load(path)
+
+
+# Functions
+# ---------
+
+def ft_expected(km: float, thetas: tuple = THETAS) -> float:
+
+    intercept, slope = ft_fold(thetas, SCALERS)
+    return round(max(intercept + slope * km, 0.0), 2)
+
+
+# Tests
+# -----
+
+def test_plain_mileage_gets_plain_price(model: LinearRegressor) -> None:
+
+    assert float(ft_answer(model, '100000')) == ft_expected(100000)
+    assert float(ft_answer(model, ' 100000.5 ')) == ft_expected(100000.5)
+
+# ----------
+
+def test_json_requests_get_json_prices(model: LinearRegressor) -> None:
+
+    assert json.loads(ft_answer(model, '{"km": 100000}')) == {'price': ft_expected(100000)}
+    assert json.loads(ft_answer(model, '{"km": [100000, 50000]}')) == {'prices': [ft_expected(100000), ft_expected(50000)]}
+
+# ----------
+
+@pytest.mark.parametrize('line, answer', [
+    ('abc', 'error: mileage must be a number'),
+    ('-1', 'error: mileage cannot be negative'),
+    ('nan', 'error: mileage cannot be negative'),
+    ('{"km": -1}', '{"error": "mileage cannot be negative"}'),
+    ('{"km": [1, -1]}', '{"error": "mileages cannot be negative"}'),
+    ('{"mileage": 1}', '{"error": "request must be {\\"km\\": number} or {\\"km\\": [numbers]}"}'),
+    ('{"km": "abc"}', '{"error": "request must be {\\"km\\": number} or {\\"km\\": [numbers]}"}'),
+    ('{not json', '{"error": "request must be {\\"km\\": number} or {\\"km\\": [numbers]}"}'),
+])
+def test_invalid_requests_get_errors(model: LinearRegressor, line: str, answer: str) -> None:
+
+    assert ft_answer(model, line) == answer
+
+# ----------
+
+def test_keyed_model_routes_requests_by_group(keyed: LinearRegressor) -> None:
+
+    assert json.loads(ft_answer(keyed, '{"km": 100000, "group": "clio"}')) == {'price': ft_expected(100000)}
+    assert json.loads(ft_answer(keyed, '{"km": [100000], "group": "zoe"}')) == {'prices': [ft_expected(100000, (0.5, -0.5))]}
+    assert json.loads(ft_answer(keyed, '{"km": 100000, "group": "twingo"}')) == {'error': 'unknown model "twingo"'}
+    assert ft_answer(keyed, '100000').startswith('error: model is keyed')
@@ -0,0 +1,63 @@
+# Imports
+# -------
+
+import gzip, pathlib, pytest
+from shards import Shards, ft_shards
+from tools import *
+
+
+# Functions
+# ---------
+
+def ft_write(directory: pathlib.Path, count: int, invalid: bool = False) -> list:
+
+    generator: numpy.random.Generator = numpy.random.default_rng(11)
+
+    for index in range(count):
+        with gzip.open(directory / f'part{ index }.csv.gz', 'wt') as file:
+            file.write('km,price\n' + ''.join(f'{ km },{ 9000 - km // 40 }\n' for km in generator.integers(0, 250000, 1000)) + ('-5,100\n' if invalid else ''))
+    return ft_shards([str(directory)])
+
+
+# Tests
+# -----
+
+def test_passes_reuse_pool_and_parsed_shards(tmp_path: pathlib.Path) -> None:
+
+    with Shards(ft_write(tmp_path, 4), 2, memory=1 << 30) as shards:
+        first: list = [(x_km.copy(), y_price.copy()) for x_km, y_price in shards]
+        pool = shards.pool
+        second: list = list(shards)
+        assert shards.pool is pool
+        assert len(shards.parsed) == 4
+        for (x_first, y_first), (x_second, y_second) in zip(first, second):
+            assert numpy.array_equal(x_first, x_second) and numpy.array_equal(y_first, y_second)
+    assert shards.pool is None and shards.parsed == {}
+
+# ----------
+
+def test_no_shard_is_kept_by_default(tmp_path: pathlib.Path) -> None:
+
+    with Shards(ft_write(tmp_path, 4), 2) as shards:
+        first: list = [x_km.copy() for x_km, _ in shards]
+        assert shards.parsed == {} and shards.kept == 0
+        assert all(numpy.array_equal(x_first, x_second) for x_first, (x_second, _) in zip(first, shards))
+
+# ----------
+
+def test_memory_budget_bounds_parsed_shards(tmp_path: pathlib.Path) -> None:
+
+    with Shards(ft_write(tmp_path, 4), 2, memory=20000) as shards:
+        rows: list = [len(x_km) for x_km, _ in shards]
+        assert len(shards.parsed) == 1 and shards.kept <= 20000
+        assert [len(x_km) for x_km, _ in shards] == rows
+
+# ----------
+
+def test_invalid_rows_are_left_out_or_stop_strict_runs(tmp_path: pathlib.Path) -> None:
+
+    files: list = ft_write(tmp_path, 2, True)
+
+    with Shards(files, 2) as shards: assert [len(x_km) for x_km, _ in shards] == [1000, 1000]
+    with Shards(files, 2, True) as shards:
+        with pytest.raises(Exception, match='negative'): list(shards)
@@ -0,0 +1,39 @@
+# Imports
+# -------
+
+import subprocess, pathlib, pytest
+from tools import *
+
+
+# Globals
+# -------
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY = ('numpy', 'pandas', 'matplotlib')
+
+
+# Tests
+# -----
+
+@pytest.mark.parametrize('module', ['predict', 'train', 'server'])
+def test_import_loads_no_heavy_module(module: str) -> None:
+
+    code: str = f'import sys, { module }; print(",".join(name for name in { HEAVY !r} if name in sys.modules))'
+    result: subprocess.CompletedProcess = subprocess.run([sys.executable, '-B', '-c', code], cwd=ROOT, capture_output=True, text=True, check=True)
+
+    assert result.stdout.strip() == ''
+
+# ----------
+
+def test_single_prediction_loads_no_heavy_module(tmp_path: pathlib.Path) -> None:
+
+    from train import ft_save
+
+    path: str = str(tmp_path / 'thetas.csv')
+    scalers: dict = {'km': Scaler(22899.0, 240000.0), 'price': Scaler(3650.0, 8290.0)}
+    ft_save((0.9393188765236112, -1.0035756025267633), scalers, path, False)
+    code: str = f'import sys, predict; print(predict.ft_price(predict.ft_thetas({ path !r}, False), 100000.0)); print(",".join(name for name in { HEAVY !r} if name in sys.modules))'
+    result: subprocess.CompletedProcess = subprocess.run([sys.executable, '-B', '-c', code], cwd=ROOT, capture_output=True, text=True, check=True)
+    intercept, slope = ft_fold((0.9393188765236112, -1.0035756025267633), scalers)
+
+    assert result.stdout.split('\n')[:2] == [str(intercept + slope * 100000.0), '']
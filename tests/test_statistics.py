@@ -0,0 +1,54 @@
+# Imports
+# -------
+
+import numpy, pytest
+from train import ft_moments, ft_merge, ft_solve
+from tools import Scaler, ft_fold
+
+
+# Tests
+# -----
+
+@pytest.fixture
+def data() -> tuple:
+
+    generator: numpy.random.Generator = numpy.random.default_rng(42)
+    x_km: numpy.ndarray = generator.uniform(0, 250000, 10000).round()
+    return x_km, (8500 - 0.0214 * x_km + generator.normal(0, 650, len(x_km))).round()
+
+# ----------
+
+def test_solve_matches_direct_least_squares(data: tuple) -> None:
+
+    x_km, y_price = data
+    statistics: dict = ft_moments(x_km, y_price)
+    histories: dict = ft_solve(statistics, False)
+    scalers: dict = {'km': Scaler(statistics['km_min'], statistics['km_max']), 'price': Scaler(statistics['price_min'], statistics['price_max'])}
+    slope, intercept = numpy.linalg.lstsq(numpy.column_stack((x_km, numpy.ones(len(x_km)))), y_price, rcond=None)[0]
+
+    assert ft_fold((histories['theta0'][-1], histories['theta1'][-1]), scalers) == pytest.approx((intercept, slope), rel=1e-9)
+
+# ----------
+
+@pytest.mark.parametrize('splits', [[1], [2, 5000], [1, 2, 3, 9000], list(range(500, 10000, 500))])
+def test_merge_matches_moments_of_all_rows(data: tuple, splits: list) -> None:
+
+    x_km, y_price = data
+    merged: dict = {'rows': 0}
+
+    for start, stop in zip([0] + splits, splits + [len(x_km)]):
+        merged = ft_merge(merged, ft_moments(x_km[start:stop], y_price[start:stop]))
+    whole: dict = ft_moments(x_km, y_price)
+    assert merged['rows'] == whole['rows']
+    assert {key: merged[key] for key in whole if key != 'rows'} == pytest.approx({key: whole[key] for key in whole if key != 'rows'}, rel=1e-9)
+
+# ----------
+
+def test_merge_of_halves_solves_like_all_rows(data: tuple) -> None:
+
+    x_km, y_price = data
+    merged: dict = ft_solve(ft_merge(ft_moments(x_km[:3000], y_price[:3000]), ft_moments(x_km[3000:], y_price[3000:])), False)
+    whole: dict = ft_solve(ft_moments(x_km, y_price), False)
+
+    for key in ('theta0', 'theta1', 'loss'):
+        assert merged[key] == pytest.approx(whole[key], rel=1e-9)
@@ -0,0 +1,49 @@
+# Imports
+# -------
+
+import pytest
+from benchmark import ft_generate
+from regressor import LinearRegressor
+from tools import *
+
+
+# Fixtures
+# --------
+
+@pytest.fixture(scope='module')
+def data(tmp_path_factory: pytest.TempPathFactory) -> str:
+
+    path: str = str(tmp_path_factory.mktemp('streaming') / 'data.csv')
+    ft_generate(path, 20000)
+    return path
+
+
+# Tests
+# -----
+
+def test_stream_fits_like_least_squares(data: str) -> None:
+
+    frame: pandas.DataFrame = pandas.read_csv(data)
+    slope, intercept = numpy.polyfit(frame['km'], frame['price'], 1)
+    model: LinearRegressor = LinearRegressor(chunksize=3000, batchsize=256).fit_stream(data)
+
+    assert model.coefficients == pytest.approx((intercept, slope), rel=1e-2)
+    assert model.histories['reason'] is not None
+
+# ----------
+
+def test_stream_does_not_depend_on_chunk_size(data: str) -> None:
+
+    small: LinearRegressor = LinearRegressor(chunksize=3000, batchsize=256).fit_stream(data)
+    large: LinearRegressor = LinearRegressor(chunksize=7000, batchsize=256).fit_stream(data)
+
+    assert small.coefficients == large.coefficients
+
+# ----------
+
+def test_shuffled_stream_is_reproducible(data: str) -> None:
+
+    first: LinearRegressor = LinearRegressor(chunksize=3000, batchsize=256, shuffle=5000, seed=7).fit_stream(data)
+    second: LinearRegressor = LinearRegressor(chunksize=3000, batchsize=256, shuffle=5000, seed=7).fit_stream(data)
+
+    assert first.coefficients == second.coefficients
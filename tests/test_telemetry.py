@@ -0,0 +1,52 @@
+# Imports
+# -------
+
+import json, pathlib, pytest
+from telemetry import Telemetry, NoStage, METRICS_PREFIX
+from tools import *
+
+
+# Tests
+# -----
+
+def test_disabled_telemetry_records_nothing() -> None:
+
+    telemetry: Telemetry = Telemetry()
+    with telemetry.stage('load', 10) as stage: stage.rows = 20
+    telemetry.gauge('iterations', 5)
+    telemetry.finish()
+
+    assert isinstance(telemetry.stage('load'), NoStage)
+    assert telemetry.stages == [] and telemetry.gauges == {}
+
+# ----------
+
+def test_json_metrics_hold_every_stage_and_gauge(tmp_path: pathlib.Path) -> None:
+
+    path: str = str(tmp_path / 'metrics.json')
+    telemetry: Telemetry = Telemetry()
+    telemetry.start('train', path)
+    with telemetry.stage('load') as stage: stage.rows = 24
+    with telemetry.stage('train', 24): pass
+    telemetry.gauge('iterations', 42)
+    telemetry.finish()
+    with open(path) as file: metrics: dict = json.load(file)
+
+    assert metrics['program'] == 'train' and metrics['gauges'] == {'iterations': 42}
+    assert [(stage['stage'], stage['rows']) for stage in metrics['stages']] == [('load', 24), ('train', 24)]
+    assert all(stage['duration'] >= 0 and stage['peak_rss'] > 0 for stage in metrics['stages'])
+
+# ----------
+
+def test_prometheus_metrics_merge_repeated_stages(tmp_path: pathlib.Path) -> None:
+
+    path: str = str(tmp_path / 'metrics.prom')
+    telemetry: Telemetry = Telemetry()
+    telemetry.start('predict', path)
+    for rows in (10, 15):
+        with telemetry.stage('predict', rows): pass
+    telemetry.finish()
+    with open(path) as file: lines: list = file.read().splitlines()
+
+    assert [line for line in lines if line.startswith(f'{ METRICS_PREFIX }_stage_rows')] == [f'{ METRICS_PREFIX }_stage_rows{{program="predict",stage="predict"}} 25']
+    assert sum(line.startswith(f'{ METRICS_PREFIX }_stage_duration_seconds') for line in lines) == 1
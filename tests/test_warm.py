@@ -0,0 +1,81 @@
+# Imports
+# -------
+
+import pathlib, pytest
+from regressor import LinearRegressor
+from train import ft_warm
+from tools import *
+
+
+# Globals
+# -------
+
+THETAS = (0.9393188765236112, -1.0035756025267633)
+SCALERS = {'km': Scaler(22899.0, 240000.0), 'price': Scaler(3650.0, 8290.0)}
+
+
+# Fixtures
+# --------
+
+@pytest.fixture(scope='module')
+def data() -> tuple:
+
+    generator: numpy.random.Generator = numpy.random.default_rng(0)
+    x_km: numpy.ndarray = generator.uniform(20000.0, 250000.0, 400)
+    return x_km, 9000.0 - 0.02 * x_km + generator.normal(0.0, 300.0, len(x_km))
+
+
+# Tests
+# -----
+
+@pytest.mark.parametrize('thetas', [(0.0, 0.0), THETAS, (-3.5, 12.25)])
+@pytest.mark.parametrize('bounds', [((22899.0, 240000.0), (3650.0, 8290.0)), ((0.0, 1.0), (0.0, 1.0)), ((-50.0, 1e9), (1e-3, 2e-3))])
+def test_fold_unfold_round_trip(thetas: tuple, bounds: tuple) -> None:
+
+    scalers: dict = {'km': Scaler(*bounds[0]), 'price': Scaler(*bounds[1])}
+    assert ft_unfold(ft_fold(thetas, scalers), scalers) == pytest.approx(list(thetas), rel=1e-12, abs=1e-12)
+
+# ----------
+
+def test_unfold_keeps_prices_when_bounds_widen() -> None:
+
+    wider: dict = {'km': Scaler(0.0, 400000.0), 'price': Scaler(1000.0, 9000.0)}
+    coefficients: tuple = ft_fold(THETAS, SCALERS)
+
+    assert ft_fold(ft_unfold(coefficients, wider), wider) == pytest.approx(coefficients, rel=1e-12)
+
+# ----------
+
+def test_warm_start_resumes_from_the_previous_prices(data: tuple) -> None:
+
+    x_km, y_price = data
+    model: LinearRegressor = LinearRegressor().fit(x_km[:200], y_price[:200])
+    previous: tuple = model.coefficients
+    new_km: numpy.ndarray = x_km[200:] * 2.0
+    model.learning_rate, model.iterations = 0.0, 1
+    model.partial_fit(new_km, y_price[200:])
+
+    assert model.scalers['km'].maximum == new_km.max()
+    assert model.coefficients == pytest.approx(previous, rel=1e-9)
+
+# ----------
+
+def test_warm_start_converges_to_the_fit_of_the_new_rows(data: tuple) -> None:
+
+    x_km, y_price = data
+    warm: LinearRegressor = LinearRegressor().fit(x_km[:200], y_price[:200]).partial_fit(x_km[200:], y_price[200:])
+    slope, intercept = numpy.polyfit(x_km[200:], y_price[200:], 1)
+
+    assert warm.coefficients == pytest.approx((intercept, slope), rel=1e-6)
+
+# ----------
+
+def test_warm_start_needs_a_model_of_the_mileage(tmp_path: pathlib.Path, data: tuple) -> None:
+
+    path: str = str(tmp_path / 'thetas.csv')
+
+    with pytest.raises(Exception, match='not found'): ft_warm({}, path)
+    LinearRegressor().fit(*data).save(path)
+    assert ft_warm({}, path).coefficients == pytest.approx(LinearRegressor.load(path).coefficients)
+    LinearRegressor(key='model').fit(*data, ['a'] * len(data[0])).save(path)
+    with pytest.raises(Exception, match='only available for models of the mileage alone'): ft_warm({}, path)
@@ -1,18 +1,83 @@
 # Imports
 # -------
-import sys, pandas, math, os, csv
-import matplotlib.pyplot as pyplot
+from __future__ import annotations
+import sys, math, os, csv, importlib
 from sty import fg
 
 
+# Lazy imports
+# ------------
+
+class LazyModule:
+
+    """
+    Stand-in for a heavy module (pandas, numpy, matplotlib.pyplot):
+    the module is only imported the first time one of its attributes
+    is used, so code paths that never use it do not pay for its import
+    (e.g. predicting a single price never loads pandas nor matplotlib).
+    """
+
+    def __init__(self, name: str) -> None:
+
+        """
+        Args:
+            name (str): Name of the module to import.
+        """
+
+        self.__name: str = name
+        self.__module = None
+
+    def __getattr__(self, attribute: str):
+
+        """
+        Imports the module if needed and returns one of its attributes.
+        """
+
+        if self.__module is None: self.__module = importlib.import_module(self.__name)
+        return getattr(self.__module, attribute)
+
+# ----------
+
+numpy = LazyModule('numpy')
+pandas = LazyModule('pandas')
+pyplot = LazyModule('matplotlib.pyplot')
+
+
 # Globals
 # -------
 
 BONUS = False
+ENGINE = 'numpy'
+ENGINES = ('loop', 'numpy', 'parallel')
+SOLVER = 'gradient'
+SOLVERS = ('gradient', 'exact')
+CACHE = 'auto'
+CACHES = ('auto', 'off', 'rebuild', 'invalidate')
+HISTORY = 'every'
+HISTORIES = ('off', 'every', 'ring')
+HISTORY_STEP = 1
+HISTORY_SIZE = 1000
 ITERATIONS = 500
 LEARNING_RATE = 0.5
+MAX_ITERATIONS = 100000
+TOLERANCE = 1e-14
+CHUNK_SIZE = 100000
+BATCH_SIZE = 1024
+EPOCHS = 5
+SEED = 42
 PATH_DATA = './DataSets/data.csv'
 PATH_THETAS = './DataSets/thetas.csv'
+PATH_STATISTICS = './DataSets/statistics.csv'
+MODEL_VERSION = 1
+MODEL = ('version', 'theta0', 'theta1', 'km_min', 'km_max', 'price_min', 'price_max', 'intercept', 'slope')
+FEATURES_MODEL = ('version', 'feature', 'theta', 'minimum', 'maximum', 'coefficient')
+CONDITION = 1e8
+PLOT = 'auto'
+PLOTS = ('auto', 'scatter', 'density', 'sample')
+PLOT_POINTS = 10000
+PLOT_BINS = 200
+PLOT_CURVE = 2000
+STATISTICS = ('rows', 'km_mean', 'price_mean', 'km_m2', 'price_m2', 'comoment', 'km_min', 'km_max', 'price_min', 'price_max')
 
 
 # Colored output
@@ -65,9 +130,140 @@ def message(message: str) -> str:
     return f'{ fg(248, 173, 157) }{ message }{ fg.rs }'
 
 
+# Arguments
+# ---------
+
+def ft_option(args: list, name: str, default: str = None, kind: type = str) -> str:
+
+    """
+    Extracts an option and its value from a list of arguments.
+    Both the option and its value are removed from the list.
+
+    Args:
+        args (list): List of arguments.
+        name (str): Name of the option (e.g. '-engine').
+        default (str): Value returned if the option is absent (default: None).
+        kind (type): Type the value is converted to (default: str).
+
+    Returns:
+        value (str): Value of the option.
+    """
+
+    if name not in args: return default
+    index: int = args.index(name)
+    if index + 1 >= len(args): raise Exception(f"Option '{ name }' requires a value.")
+    value: str = args[index + 1]
+    del args[index:index + 2]
+    try: return kind(value)
+    except ValueError: raise Exception(f"Option '{ name }' has an invalid value '{ value }'.")
+
+
 # Normalization / Denormalization
 # -------------------------------
 
+class Scaler:
+
+    """
+    Min-max scaler: scales values to a range of [0, 1] with the minimum
+    and maximum of the data it was fitted on.
+    Minimum and maximum are computed once (or kept up to date chunk by
+    chunk with partial_fit), so transforming costs O(1) per value,
+    for scalars as well as for whole lists or arrays.
+    """
+
+    def __init__(self, minimum: float = math.inf, maximum: float = -math.inf) -> None:
+
+        """
+        Args:
+            minimum (float): Minimum of the data (default: not fitted).
+            maximum (float): Maximum of the data (default: not fitted).
+        """
+
+        self.minimum: float = float(minimum)
+        self.maximum: float = float(maximum)
+
+    def __repr__(self) -> str:
+
+        """
+        Returns the representation of the scaler.
+        """
+
+        return f'Scaler(minimum={ self.minimum }, maximum={ self.maximum })'
+
+    @property
+    def bounds(self) -> tuple:
+
+        """
+        Returns the minimum and maximum of the scaler.
+        """
+
+        return self.minimum, self.maximum
+
+    def partial_fit(self, data: list) -> 'Scaler':
+
+        """
+        Updates the minimum and maximum with a new set of data.
+
+        Args:
+            data (list): List or array of data.
+
+        Returns:
+            scaler (Scaler): The scaler itself.
+        """
+
+        data = numpy.asarray(data, dtype=numpy.float64)
+        if data.size > 0:
+            self.minimum = min(self.minimum, float(data.min()))
+            self.maximum = max(self.maximum, float(data.max()))
+        return self
+
+    def fit(self, data: list) -> 'Scaler':
+
+        """
+        Computes the minimum and maximum of a set of data.
+
+        Args:
+            data (list): List or array of data.
+
+        Returns:
+            scaler (Scaler): The scaler itself.
+        """
+
+        self.minimum, self.maximum = math.inf, -math.inf
+        return self.partial_fit(data)
+
+    def transform(self, data: list) -> numpy.ndarray:
+
+        """
+        Normalizes a value or a set of data (between 0 and 1 for fitted data).
+
+        Args:
+            data (list): Value, list or array of data to normalize.
+
+        Returns:
+            normalized (numpy.ndarray): Normalized value or array of normalized data.
+        """
+
+        if not isinstance(data, (int, float)): data = numpy.asarray(data, dtype=numpy.float64)
+        return (data - self.minimum) / (self.maximum - self.minimum)
+
+    def inverse_transform(self, data: list) -> numpy.ndarray:
+
+        """
+        Denormalizes a value or a set of data back to their original range.
+
+        Args:
+            data (list): Value, list or array of data to denormalize.
+
+        Returns:
+            denormalized (numpy.ndarray): Denormalized value or array of denormalized data.
+        """
+
+        if not isinstance(data, (int, float)): data = numpy.asarray(data, dtype=numpy.float64)
+        return data * (self.maximum - self.minimum) + self.minimum
+
+# ----------
+
 def ft_normalize_list(data: list) -> list:
 
     """
@@ -80,7 +276,8 @@ def ft_normalize_list(data: list) -> list:
     Returns:
         normalized_list (list): List of normalized data.
     """
-    return [(value - min(data)) / (max(data) - min(data)) for value in data]
+
+    return Scaler().fit(data).transform(data).tolist()
 
 # ----------
 
@@ -89,6 +286,8 @@ def ft_normalize_value(data: list, value: float) -> list:
     """
     Normalizes a value (between 0 and 1) from a set of data stored in a list.
     Normalizing a set of data means to scale the values to a range of [0, 1].
+    The set of data is scanned on each call, fit a Scaler once instead
+    to normalize many values.
 
     Args:
         data (list): List of data to normalize.
@@ -98,7 +297,7 @@ def ft_normalize_value(data: list, value: float) -> list:
         normalized_value (flaot): Normalized value.
     """
 
-    return ((value - min(data)) / (max(data) - min(data)))
+    return Scaler().fit(data).transform(value)
 
 # ----------
 
@@ -108,6 +307,8 @@ def ft_denormalize_value(data: list, value: float) -> list:
     """
     Denormalizes a value from a set of data stored in a list.
     Denormalizing a set of data means to scale the values to their original range.
+    The set of data is scanned on each call, fit a Scaler once instead
+    to denormalize many values.
 
     Args:
         data (list): List of data to denormalize.
@@ -117,4 +318,71 @@ def ft_denormalize_value(data: list, value: float) -> list:
         denormalized_value (flaot): Denormalized value.
     """
 
-    return ((value * (max(data) - min(data))) + min(data))
\ No newline at end of file
+    return Scaler().fit(data).inverse_transform(value)
+
+# ----------
+
+def ft_fold(thetas: list, scalers: dict) -> tuple:
+
+    """
+    Folds the scaling of the data into theta0 and theta1, so that
+    prices can be predicted directly from raw mileages:
+    price = intercept + slope * km.
+
+    Args:
+        thetas (list): List containing theta0 and theta1 (normalized space).
+        scalers (dict): Dictionary containing the scalers of km and price.
+
+    Returns:
+        coefficients (tuple): Intercept and slope in raw km -> price space.
+    """
+
+    km, price = scalers['km'], scalers['price']
+    slope: float = thetas[1] * (price.maximum - price.minimum) / (km.maximum - km.minimum)
+    intercept: float = price.inverse_transform(thetas[0]) - slope * km.minimum
+    return intercept, slope
+
+# ----------
+
+def ft_unfold(coefficients: tuple, scalers: dict) -> list:
+
+    """
+    Expresses coefficients of raw km -> price space as theta0 and theta1
+    in the normalized space of the given scalers (inverse of ft_fold).
+    This is how a model keeps predicting the same prices when the
+    bounds of the data change, e.g. when new rows widen them.
+
+    Args:
+        coefficients (tuple): Intercept and slope in raw km -> price space.
+        scalers (dict): Dictionary containing the scalers of km and price.
+
+    Returns:
+        thetas (list): List containing theta0 and theta1 (normalized space).
+    """
+
+    km, price = scalers['km'], scalers['price']
+    intercept, slope = coefficients
+    return [price.transform(intercept + slope * km.minimum), slope * (km.maximum - km.minimum) / (price.maximum - price.minimum)]
+
+# ----------
+
+def ft_fold_features(thetas: list, scalers: dict, features: list) -> tuple:
+
+    """
+    Folds the scaling of the data into the thetas of a model with
+    many features, so that prices can be predicted directly from raw
+    values: price = intercept + sum(slope * feature).
+
+    Args:
+        thetas (list): List containing theta0 and one theta per feature (normalized space).
+        scalers (dict): Dictionary containing the scalers of each feature and of price.
+        features (list): Names of the features, in the order of the thetas.
+
+    Returns:
+        coefficients (tuple): Intercept and list of slopes in raw space.
+    """
+
+    price: Scaler = scalers['price']
+    slopes: list = [theta * (price.maximum - price.minimum) / (scalers[name].maximum - scalers[name].minimum) for theta, name in zip(thetas[1:], features)]
+    intercept: float = price.inverse_transform(thetas[0]) - sum(slope * scalers[name].minimum for slope, name in zip(slopes, features))
+    return intercept, slopes
@@ -1,6 +1,12 @@
 # Imports
 # -------
 
+from __future__ import annotations
+import time, array, concurrent.futures
+from cache import ft_cache_read, ft_cache_write, ft_cache_invalidate, ft_key
+from telemetry import telemetry
+from registry import ft_publish
+from shards import Shards, ft_sharded, ft_shards, SHARD_MEMORY
 from tools import *
 
 
@@ -32,14 +38,17 @@ def ft_load(path: str = PATH_DATA, output: bool = True) -> pandas.DataFrame:
     try:
 
         if output: print(message(f'1. Loading data from { path }...'), end='\r')
-        data: pandas.DataFrame = pandas.read_csv(path)
-        if len(data.columns) > 2: raise Exception(f"Data file '{ path }' is corrupted, unecessary column(s).")
-        elif len(data.columns) < 2: raise Exception(f"Data file '{ path }' is corrupted, missing column(s).")
-        elif 'price' not in data or 'km' not in data: raise Exception(f"Data file '{ path }' is corrupted, wrong column(s).")
-        elif len(data['price']) < 2 or len(data['km']) < 2: raise Exception(f"Data file '{ path }' is corrupted, not enought data to train program.")
-        elif any(math.isnan(data) for data in data['price'].tolist()) or any(math.isnan(data) for data in data['km'].tolist()): raise Exception(f"Data file '{ path }' is corrupted, Nan values.")
-        elif any(int(price) < 0 for price in data['price'].tolist()) or any(int(price) < 0 for price in data['km'].tolist()) : raise Exception(f"Data file '{ path }' is corrupted, negative value(s).")
-        elif path.endswith('.csv') == False: raise Exception(f"Data file '{ path }' is corrupted, wrong file extension (must be .csv).")
+        with telemetry.stage('load') as stage:
+            data: pandas.DataFrame = pandas.read_csv(path)
+            stage.rows = len(data)
+        with telemetry.stage('validate', len(data)):
+            if len(data.columns) > 2: raise Exception(f"Data file '{ path }' is corrupted, unecessary column(s).")
+            elif len(data.columns) < 2: raise Exception(f"Data file '{ path }' is corrupted, missing column(s).")
+            elif 'price' not in data or 'km' not in data: raise Exception(f"Data file '{ path }' is corrupted, wrong column(s).")
+            elif len(data['price']) < 2 or len(data['km']) < 2: raise Exception(f"Data file '{ path }' is corrupted, not enought data to train program.")
+            elif any(math.isnan(data) for data in data['price'].tolist()) or any(math.isnan(data) for data in data['km'].tolist()): raise Exception(f"Data file '{ path }' is corrupted, Nan values.")
+            elif any(int(price) < 0 for price in data['price'].tolist()) or any(int(price) < 0 for price in data['km'].tolist()) : raise Exception(f"Data file '{ path }' is corrupted, negative value(s).")
+            elif path.endswith('.csv') == False: raise Exception(f"Data file '{ path }' is corrupted, wrong file extension (must be .csv).")
         if output: print(message(f'1. Loading data from { path }... Done √'))
         return data
 
@@ -50,177 +59,1338 @@ def ft_load(path: str = PATH_DATA, output: bool = True) -> pandas.DataFrame:
 
 # ----------
 
-def ft_save(thetas: list, path: str = PATH_THETAS, output: bool = True) -> None:
+def ft_load_groups(path: str, key: str, output: bool = True) -> pandas.DataFrame:
 
     """
-    Saves the final values of theta0 and theta1 in a csv file.
-    If the file already exists, delete it and create a new one.
+    Load data partitioned by a key column from csv file.
+    Check if data is corrupted, this includes:
+    - Missing or unecessary column(s) (must be the key column, 'km' and 'price')
+    - Not enought data to train program
+    - Nan or negative value(s)
+    - Wrong data type (must be int or float)
+    - Permission denied
+    - File not found
+    - Is a directory
+
+    Args:
+        path (str): Path to csv file.
+        key (str): Name of the column holding the group of each row.
+        output (bool): Print output messages (default: True).
+
+    Returns:
+        data (pandas.DataFrame): Data loaded from csv file.
+    """
+
+    try:
+
+        if output: print(message(f'1. Loading data from { path }...'), end='\r')
+        if path.endswith('.csv') == False: raise Exception(f"Data file '{ path }' is corrupted, wrong file extension (must be .csv).")
+        data: pandas.DataFrame = pandas.read_csv(path, dtype={key: str}, keep_default_na=False, na_values={'km': [''], 'price': ['']})
+        if key not in data: raise Exception(f"Data file '{ path }' is corrupted, missing key column '{ key }'.")
+        elif len(data.columns) > 3: raise Exception(f"Data file '{ path }' is corrupted, unecessary column(s).")
+        elif len(data.columns) < 3 or 'price' not in data or 'km' not in data: raise Exception(f"Data file '{ path }' is corrupted, missing column(s).")
+        elif len(data) < 2: raise Exception(f"Data file '{ path }' is corrupted, not enought data to train program.")
+        elif data['km'].dtype.kind not in 'iuf' or data['price'].dtype.kind not in 'iuf': raise TypeError
+        elif data['km'].isna().any() or data['price'].isna().any(): raise Exception(f"Data file '{ path }' is corrupted, Nan values.")
+        elif (data['km'] < 0).any() or (data['price'] < 0).any(): raise Exception(f"Data file '{ path }' is corrupted, negative value(s).")
+        if output: print(message(f'1. Loading data from { path }... Done √'))
+        return data
+
+    except TypeError: raise Exception(f"Data file '{ path }' is corrupted, wrong data type (must be int or float).")
+    except PermissionError: raise Exception(f"Data file '{ path }' is corrupted, permission denied.")
+    except FileNotFoundError: raise Exception(f"Data file '{ path }' not found, please download it from the 42 intranet.")
+    except IsADirectoryError: raise Exception(f"Data file is corrupted, '{ path }' is a directory.")
+
+# ----------
+
+def ft_load_features(path: str, features: list, output: bool = True) -> tuple:
+
+    """
+    Load the 'price' column and any number of feature columns from csv file.
+    Check if data is corrupted, this includes:
+    - Missing column(s) ('price' and every requested feature)
+    - Not enought data to train program
+    - Nan or negative value(s)
+    - Wrong data type (must be int or float)
+    - Permission denied
+    - File not found
+    - Is a directory
+
+    Args:
+        path (str): Path to csv file.
+        features (list): Names of the feature columns, or ['all'] for every column but 'price'.
+        output (bool): Print output messages (default: True).
+
+    Returns:
+        data (tuple): Names of the features, matrix of feature values (one column per feature) and array of price values.
+    """
+
+    try:
+
+        if output: print(message(f'1. Loading data from { path }...'), end='\r')
+        if path.endswith('.csv') == False: raise Exception(f"Data file '{ path }' is corrupted, wrong file extension (must be .csv).")
+        with telemetry.stage('load') as stage:
+            data: pandas.DataFrame = pandas.read_csv(path)
+            stage.rows = len(data)
+        with telemetry.stage('validate', len(data)):
+            names: list = [column for column in data.columns if column != 'price'] if features == ['all'] else features
+            missing: list = [name for name in names + ['price'] if name not in data]
+            if missing: raise Exception(f"Data file '{ path }' is corrupted, missing column(s): { ', '.join(missing) }.")
+            elif len(names) == 0: raise Exception(f"Data file '{ path }' is corrupted, no feature column.")
+            elif len(data) < 2: raise Exception(f"Data file '{ path }' is corrupted, not enought data to train program.")
+            elif any(data[name].dtype.kind not in 'iuf' for name in names + ['price']): raise TypeError
+            values: numpy.ndarray = data[names + ['price']].to_numpy(dtype=numpy.float64)
+            if numpy.isnan(values).any(): raise Exception(f"Data file '{ path }' is corrupted, Nan values.")
+            elif (values < 0).any(): raise Exception(f"Data file '{ path }' is corrupted, negative value(s).")
+        if output: print(message(f'1. Loading data from { path }... Done √ ({ len(names) } features)'))
+        return names, numpy.ascontiguousarray(values[:, :-1]), values[:, -1].copy()
+
+    except TypeError: raise Exception(f"Data file '{ path }' is corrupted, wrong data type (must be int or float).")
+    except PermissionError: raise Exception(f"Data file '{ path }' is corrupted, permission denied.")
+    except FileNotFoundError: raise Exception(f"Data file '{ path }' not found, please download it from the 42 intranet.")
+    except IsADirectoryError: raise Exception(f"Data file is corrupted, '{ path }' is a directory.")
+
+# ----------
+
+def ft_dataset(path: str = PATH_DATA, cache: bool = True, output: bool = True) -> tuple:
+
+    """
+    Load mileages and prices from csv file as float arrays.
+    If the binary cache of the csv file is fresh, it is memory mapped
+    instead, skipping both parsing and validation. Otherwise data is
+    loaded and checked by ft_load, and the cache is (re)written.
+    Shards are read by their worker processes and only their arrays
+    are concatenated; they have no binary cache.
+
+    Args:
+        path (str): Path to csv file, or Shards (default: 'data.csv').
+        cache (bool): Use and update the binary cache (default: True).
+        output (bool): Print output messages (default: True).
+
+    Returns:
+        data (tuple): Arrays of mileage and price values.
+    """
+
+    if isinstance(path, Shards):
+        if output: print(message(f'1. Loading data from { path }...'), end='\r')
+        with telemetry.stage('load') as stage:
+            shards: list = list(path)
+            x_km, y_price = numpy.concatenate([shard[0] for shard in shards]), numpy.concatenate([shard[1] for shard in shards])
+            stage.rows = len(x_km)
+        if len(x_km) < 2: raise Exception(f"Data file '{ path }' is corrupted, not enought data to train program.")
+        if output: print(message(f'1. Loading data from { path }... Done √ ({ path.summary() })'))
+        return x_km, y_price
+    if cache:
+        with telemetry.stage('cache') as stage:
+            data: tuple = ft_cache_read(path)
+            stage.rows = None if data is None else len(data[0])
+        if data is not None:
+            if output: print(message(f'1. Loading data from { path } (cache)... Done √'))
+            return data
+    frame: pandas.DataFrame = ft_load(path, output)
+    x_km: numpy.ndarray = frame['km'].to_numpy(dtype=numpy.float64)
+    y_price: numpy.ndarray = frame['price'].to_numpy(dtype=numpy.float64)
+    if cache:
+        try: ft_cache_write(path, x_km, y_price, ft_key(path))
+        except OSError: pass
+    return x_km, y_price
+
+# ----------
+
+def ft_chunks(path: str = PATH_DATA, chunksize: int = CHUNK_SIZE):
+
+    """
+    Reads data from csv file in chunks of fixed size, so that only one
+    chunk is held in memory at a time.
+    Each chunk is checked for the same corruptions as in ft_load
+    (except for the amount of data, which is only known at the end).
+    Shards are read one after the other, as parsed by their workers.
+
+    Args:
+        path (str): Path to csv file, or Shards (default: 'data.csv').
+        chunksize (int): Number of rows per chunk (default: 100000).
+
+    Yields:
+        chunk (tuple): Arrays of mileage and price values of the chunk.
+    """
+
+    if isinstance(path, Shards):
+        yield from path.chunks(chunksize)
+        return
+    try:
+
+        if path.endswith('.csv') == False: raise Exception(f"Data file '{ path }' is corrupted, wrong file extension (must be .csv).")
+        for data in pandas.read_csv(path, chunksize=chunksize):
+            if len(data.columns) > 2: raise Exception(f"Data file '{ path }' is corrupted, unecessary column(s).")
+            elif len(data.columns) < 2: raise Exception(f"Data file '{ path }' is corrupted, missing column(s).")
+            elif 'price' not in data or 'km' not in data: raise Exception(f"Data file '{ path }' is corrupted, wrong column(s).")
+            x_km: numpy.ndarray = data['km'].to_numpy()
+            y_price: numpy.ndarray = data['price'].to_numpy()
+            if x_km.dtype.kind not in 'iuf' or y_price.dtype.kind not in 'iuf': raise TypeError
+            elif numpy.isnan(x_km).any() or numpy.isnan(y_price).any(): raise Exception(f"Data file '{ path }' is corrupted, Nan values.")
+            elif (x_km < 0).any() or (y_price < 0).any(): raise Exception(f"Data file '{ path }' is corrupted, negative value(s).")
+            yield x_km.astype(numpy.float64), y_price.astype(numpy.float64)
+
+    except TypeError: raise Exception(f"Data file '{ path }' is corrupted, wrong data type (must be int or float).")
+    except PermissionError: raise Exception(f"Data file '{ path }' is corrupted, permission denied.")
+    except FileNotFoundError: raise Exception(f"Data file '{ path }' not found, please download it from the 42 intranet.")
+    except IsADirectoryError: raise Exception(f"Data file is corrupted, '{ path }' is a directory.")
+
+# ----------
+
+def ft_bounds(path: str = PATH_DATA, chunksize: int = CHUNK_SIZE, output: bool = True) -> dict:
+
+    """
+    First pass of the streaming mode: reads data from csv file in chunks
+    and fits a scaler on each column with a running minimum and maximum,
+    which are the same values ft_normalize_list scales the data with.
+
+    Args:
+        path (str): Path to csv file (default: 'data.csv').
+        chunksize (int): Number of rows per chunk (default: 100000).
+        output (bool): Print output messages (default: True).
+
+    Returns:
+        bounds (dict): Dictionary containing the row count and the scalers of km and price.
+    """
+
+    bounds: dict = {'rows': 0, 'km': Scaler(), 'price': Scaler()}
+
+    if output: print(message(f'1. Scanning data from { path }...'), end='\r')
+    for x_km, y_price in ft_chunks(path, chunksize):
+        bounds['rows'] += len(x_km)
+        bounds['km'].partial_fit(x_km)
+        bounds['price'].partial_fit(y_price)
+    if bounds['rows'] < 2: raise Exception(f"Data file '{ path }' is corrupted, not enought data to train program.")
+    if bounds['km'].minimum == bounds['km'].maximum or bounds['price'].minimum == bounds['price'].maximum:
+        raise Exception(f"Data file '{ path }' is corrupted, constant column(s) cannot be normalized.")
+    if output: print(message(f'1. Scanning data from { path }... Done √'))
+    return bounds
+
+# ----------
+
+def ft_batches(path: str, bounds: dict, chunksize: int = CHUNK_SIZE, batchsize: int = BATCH_SIZE, shuffle: int = 0, generator: numpy.random.Generator = None):
+
+    """
+    Second pass of the streaming mode: reads data from csv file in chunks,
+    normalizes it with the scalers fitted by the first pass and splits it in mini-batches.
+    If shuffle is set, rows go through a buffer of that many rows which
+    is shuffled before being split, so memory stays bounded by
+    chunksize + max(shuffle, batchsize) rows whatever the size of the file.
+
+    Args:
+        path (str): Path to csv file.
+        bounds (dict): Bounds returned by ft_bounds.
+        chunksize (int): Number of rows per chunk (default: 100000).
+        batchsize (int): Number of rows per mini-batch (default: 1024).
+        shuffle (int): Size of the shuffle buffer, 0 to disable shuffling (default: 0).
+        generator (numpy.random.Generator): Random generator used to shuffle (default: None).
+
+    Yields:
+        batch (tuple): Arrays of normalized mileage and price values of the mini-batch.
+    """
+
+    buffer_km: numpy.ndarray = numpy.empty(0)
+    buffer_price: numpy.ndarray = numpy.empty(0)
+
+    for x_km, y_price in ft_chunks(path, chunksize):
+        buffer_km = numpy.concatenate((buffer_km, bounds['km'].transform(x_km)))
+        buffer_price = numpy.concatenate((buffer_price, bounds['price'].transform(y_price)))
+        if len(buffer_km) < max(shuffle, batchsize): continue
+        if shuffle:
+            order: numpy.ndarray = generator.permutation(len(buffer_km))
+            buffer_km, buffer_price = buffer_km[order], buffer_price[order]
+        full: int = len(buffer_km) - len(buffer_km) % batchsize
+        for start in range(0, full, batchsize):
+            yield buffer_km[start:start + batchsize], buffer_price[start:start + batchsize]
+        buffer_km, buffer_price = buffer_km[full:], buffer_price[full:]
+    if shuffle:
+        order: numpy.ndarray = generator.permutation(len(buffer_km))
+        buffer_km, buffer_price = buffer_km[order], buffer_price[order]
+    for start in range(0, len(buffer_km), batchsize):
+        yield buffer_km[start:start + batchsize], buffer_price[start:start + batchsize]
+
+# ----------
+
+def ft_merge(first: dict, second: dict) -> dict:
+
+    """
+    Merges the sufficient statistics of two sets of data points
+    (pairwise update of Chan et al., the parallel form of Welford's algorithm).
+    Means and sums of squared deviations are merged instead of raw sums,
+    so precision does not degrade with the number of rows.
+
+    Args:
+        first (dict): Statistics of the first set of data points.
+        second (dict): Statistics of the second set of data points.
+
+    Returns:
+        statistics (dict): Statistics of both sets of data points.
+    """
+
+    rows: int = first['rows'] + second['rows']
+
+    if first['rows'] == 0: return dict(second)
+    if second['rows'] == 0: return dict(first)
+    delta_km: float = second['km_mean'] - first['km_mean']
+    delta_price: float = second['price_mean'] - first['price_mean']
+    weight: float = first['rows'] * second['rows'] / rows
+    return {
+        'rows': rows,
+        'km_mean': first['km_mean'] + delta_km * second['rows'] / rows,
+        'price_mean': first['price_mean'] + delta_price * second['rows'] / rows,
+        'km_m2': first['km_m2'] + second['km_m2'] + delta_km * delta_km * weight,
+        'price_m2': first['price_m2'] + second['price_m2'] + delta_price * delta_price * weight,
+        'comoment': first['comoment'] + second['comoment'] + delta_km * delta_price * weight,
+        'km_min': min(first['km_min'], second['km_min']),
+        'km_max': max(first['km_max'], second['km_max']),
+        'price_min': min(first['price_min'], second['price_min']),
+        'price_max': max(first['price_max'], second['price_max']),
+    }
+
+# ----------
+
+def ft_moments(x_km: numpy.ndarray, y_price: numpy.ndarray) -> dict:
+
+    """
+    Computes the sufficient statistics of a single set of data points,
+    to be merged with others by ft_merge.
+
+    Args:
+        x_km (numpy.ndarray): Array of mileage values (not empty).
+        y_price (numpy.ndarray): Array of corresponding price values.
+
+    Returns:
+        statistics (dict): Statistics of the data points.
+    """
+
+    deviation_km: numpy.ndarray = x_km - x_km.mean()
+    deviation_price: numpy.ndarray = y_price - y_price.mean()
+    return {
+        'rows': len(x_km),
+        'km_mean': float(x_km.mean()),
+        'price_mean': float(y_price.mean()),
+        'km_m2': float(deviation_km.dot(deviation_km)),
+        'price_m2': float(deviation_price.dot(deviation_price)),
+        'comoment': float(deviation_km.dot(deviation_price)),
+        'km_min': float(x_km.min()),
+        'km_max': float(x_km.max()),
+        'price_min': float(y_price.min()),
+        'price_max': float(y_price.max()),
+    }
+
+# ----------
+
+def ft_accumulate(path: str = PATH_DATA, chunksize: int = CHUNK_SIZE, statistics: dict = None, output: bool = True) -> dict:
+
+    """
+    Accumulates in a single streaming pass over a csv file the sufficient
+    statistics of a single-feature least-squares fit: row count, means,
+    sums of squared deviations, co-moment and bounds of km and price.
+    If statistics of previous data are given, new rows are folded into them.
+
+    Args:
+        path (str): Path to csv file (default: 'data.csv').
+        chunksize (int): Number of rows per chunk (default: 100000).
+        statistics (dict): Statistics to fold the new rows into (default: None).
+        output (bool): Print output messages (default: True).
+
+    Returns:
+        statistics (dict): Accumulated statistics.
+    """
+
+    if statistics is None:
+        statistics = dict.fromkeys(STATISTICS, 0.0)
+        statistics.update({'rows': 0, 'km_min': math.inf, 'km_max': -math.inf, 'price_min': math.inf, 'price_max': -math.inf})
+
+    if output: print(message(f'1. Accumulating statistics from { path }...'), end='\r')
+    for x_km, y_price in ft_chunks(path, chunksize):
+        if len(x_km) == 0: continue
+        statistics = ft_merge(statistics, ft_moments(x_km, y_price))
+    if output: print(message(f'1. Accumulating statistics from { path }... Done √'))
+    return statistics
+
+# ----------
+
+def ft_solve(statistics: dict, output: bool = True) -> dict:
+
+    """
+    Solves the least-squares fit exactly from its sufficient statistics,
+    then expresses theta0 and theta1 in the normalized space used by
+    gradient descent (see ft_normalize_list), so both solvers are interchangeable.
+
+    Args:
+        statistics (dict): Statistics returned by ft_accumulate.
+        output (bool): Print output messages (default: True).
+
+    Returns:
+        histories (dict): Dictionary containing theta0, theta1 and loss of the optimum.
+    """
+
+    km_range: float = statistics['km_max'] - statistics['km_min']
+    price_range: float = statistics['price_max'] - statistics['price_min']
+
+    if output: print(message('2. Solving least squares...'), end='\r')
+    if statistics['rows'] < 2: raise Exception('Not enought data to train program.')
+    if km_range == 0 or price_range == 0: raise Exception('Constant column(s) cannot be normalized.')
+    slope: float = statistics['comoment'] / statistics['km_m2']
+    intercept: float = statistics['price_mean'] - slope * statistics['km_mean']
+    loss: float = max(statistics['price_m2'] - slope * statistics['comoment'], 0.0) / statistics['rows']
+    if output: print(message('2. Solving least squares... Done √'))
+    return {
+        'theta0': [(intercept + slope * statistics['km_min'] - statistics['price_min']) / price_range],
+        'theta1': [slope * km_range / price_range],
+        'loss': [loss / price_range ** 2],
+    }
+
+# ----------
+
+def ft_gram(x: numpy.ndarray, y: numpy.ndarray) -> dict:
+
+    """
+    Computes, in a single pass over the data, the sufficient statistics
+    of a least-squares fit with many features: the Gram matrix of the
+    design matrix [1, x] and its product with the prices, both divided
+    by the number of rows, and the mean of the squared prices.
+    The loss and gradient of any thetas follow from them in O(N^2),
+    whatever the number of rows.
+
+    Args:
+        x (numpy.ndarray): Matrix of (normalized) feature values, one column per feature.
+        y (numpy.ndarray): Array of (normalized) price values.
+
+    Returns:
+        statistics (dict): Dictionary containing the Gram matrix, the moment vector and the mean squared price.
+    """
+
+    rows, features = x.shape
+    gram: numpy.ndarray = numpy.empty((features + 1, features + 1))
+    moment: numpy.ndarray = numpy.empty(features + 1)
+
+    gram[0, 0] = 1.0
+    gram[0, 1:] = gram[1:, 0] = x.mean(axis=0)
+    gram[1:, 1:] = x.T @ x / rows
+    moment[0] = y.mean()
+    moment[1:] = x.T @ y / rows
+    return {'gram': gram, 'moment': moment, 'square': float(y @ y) / rows}
+
+# ----------
+
+def ft_quadratic(thetas: numpy.ndarray, statistics: dict) -> tuple:
+
+    """
+    Computes the loss (mean squared error) and its gradient for the
+    given thetas from the statistics returned by ft_gram, the gradient
+    following the same convention as ft_evaluate.
+
+    Args:
+        thetas (numpy.ndarray): Array containing theta0 and one theta per feature.
+        statistics (dict): Statistics returned by ft_gram.
+
+    Returns:
+        evaluation (tuple): Loss of the model and its gradient (array).
+    """
+
+    product: numpy.ndarray = statistics['gram'] @ thetas
+    loss: float = float(thetas @ product) - 2 * float(thetas @ statistics['moment']) + statistics['square']
+    return max(loss, 0.0), product - statistics['moment']
+
+# ----------
+
+def ft_train_matrix(x: numpy.ndarray, y: numpy.ndarray, output: bool = True, controller: Convergence = None) -> dict:
+
+    """
+    Trains a linear regression model with many features by batch
+    gradient descent. The data is only read once, by ft_gram, then
+    every iteration costs O(N^2) for N features, so the number of rows
+    does not weigh on the iterations.
+
+    Args:
+        x (numpy.ndarray): Matrix of normalized feature values, one column per feature.
+        y (numpy.ndarray): Array of normalized price values.
+        output (bool): Print output messages (default: True).
+        controller (Convergence): Convergence controller of the run (default: new one with default settings).
+
+    Returns:
+        histories (dict): Dictionary containing the final thetas and loss, and the report of the run.
+    """
+
+    controller = controller or Convergence()
+
+    if output: print(message('2. Training model...'), end='\r')
+    statistics: dict = ft_gram(x, y)
+    thetas: numpy.ndarray = numpy.zeros(x.shape[1] + 1)
+    loss, gradient = ft_quadratic(thetas, statistics)
+    while controller.running():
+        candidate: numpy.ndarray = thetas - gradient * controller.learning_rate
+        candidate_loss, candidate_gradient = ft_quadratic(candidate, statistics)
+        if controller.adjust(loss, candidate_loss, gradient): thetas, loss, gradient = candidate, candidate_loss, candidate_gradient
+    if output: print(message('2. Training model... Done √'))
+    return {'thetas': thetas.tolist(), 'loss': [loss], **controller.report()}
+
+# ----------
+
+def ft_solve_matrix(x: numpy.ndarray, y: numpy.ndarray, output: bool = True) -> dict:
+
+    """
+    Solves the least-squares fit with many features exactly.
+    The normal equations are solved from the Gram matrix (Cholesky),
+    unless it is ill-conditioned (e.g. nearly collinear features),
+    in which case the design matrix is factorized with QR instead,
+    which is slower but numerically stable.
+
+    Args:
+        x (numpy.ndarray): Matrix of normalized feature values, one column per feature.
+        y (numpy.ndarray): Array of normalized price values.
+        output (bool): Print output messages (default: True).
+
+    Returns:
+        histories (dict): Dictionary containing the thetas and loss of the optimum.
+    """
+
+    if output: print(message('2. Solving least squares...'), end='\r')
+    statistics: dict = ft_gram(x, y)
+    if numpy.linalg.cond(statistics['gram']) < CONDITION:
+        lower: numpy.ndarray = numpy.linalg.cholesky(statistics['gram'])
+        thetas: numpy.ndarray = numpy.linalg.solve(lower.T, numpy.linalg.solve(lower, statistics['moment']))
+    else:
+        q, r = numpy.linalg.qr(numpy.column_stack((numpy.ones(len(y)), x)))
+        if numpy.abs(numpy.diag(r)).min() < numpy.abs(numpy.diag(r)).max() * numpy.finfo(numpy.float64).eps * len(y): raise Exception('Feature columns are collinear, the least-squares fit has no unique solution.')
+        thetas = numpy.linalg.solve(r, q.T @ y)
+    if output: print(message('2. Solving least squares... Done √'))
+    return {'thetas': thetas.tolist(), 'loss': [ft_quadratic(thetas, statistics)[0]]}
+
+# ----------
+
+def ft_save_features(thetas: list, scalers: dict, features: list, path: str = PATH_THETAS, output: bool = True) -> None:
+
+    """
+    Saves a model with many features in a csv file, one row per
+    coefficient (see FEATURES_MODEL): the first row is the intercept,
+    with theta0 and the bounds of price, then each feature with its
+    theta, its bounds and its slope folded into raw space.
+    The model is published as a new generation of the registry (see
+    registry.ft_publish): the file is replaced atomically, never deleted.
+
+    Args:
+        thetas (list): List containing theta0 and one theta per feature.
+        scalers (dict): Dictionary containing the scalers of each feature and of price.
+        features (list): Names of the features, in the order of the thetas.
+        path (str): Path to csv file (default: 'thetas.csv').
+        output (bool): Print output messages (default: True).
+
+    Returns:
+        None
+    """
+
+    intercept, slopes = ft_fold_features(thetas, scalers, features)
+
+    if output: print(message('3. Saving thetas in thetas.csv...'), end='\r')
+    generation: int = ft_publish(path, [FEATURES_MODEL, [MODEL_VERSION, 'price', thetas[0], *scalers['price'].bounds, intercept]] + [
+        [MODEL_VERSION, name, theta, *scalers[name].bounds, slope] for name, theta, slope in zip(features, thetas[1:], slopes)
+    ])
+    if output: print(message(f'3. Saving thetas in thetas.csv... Done √ (generation { generation })'))
+
+# ----------
+
+def ft_save(thetas: list, scalers: dict, path: str = PATH_THETAS, output: bool = True, statistics: dict = None) -> None:
+
+    """
+    Saves the model in a csv file: format version, final values of theta0
+    and theta1, bounds of the scalers used to normalize the data and
+    coefficients folded into raw km -> price space, so that predicting
+    needs nothing else.
+    The model is published as a new generation of the registry (see
+    registry.ft_publish): the file is replaced atomically, never deleted.
+    The sufficient statistics of the exact solver are published with it
+    in statistics.csv, so that new rows can later be folded in without
+    reading the old ones, and a rollback restores them with the model.
 
     Args:
         thetas (list): List of theta0 and theta1.
+        scalers (dict): Dictionary containing the scalers of km and price.
         path (str): Path to csv file (default: 'thetas.csv').
         output (bool): Print output messages (default: True).
+        statistics (dict): Statistics returned by ft_accumulate (default: None, the model is published without statistics).
     
     Returns:
         None
     """
 
+    companions: dict = None
+
+    if statistics is not None: companions = {os.path.basename(PATH_STATISTICS): [STATISTICS, [statistics[key] for key in STATISTICS]]}
     if output: print(message('3. Saving thetas in thetas.csv...'), end='\r')
-    if os.path.exists(path):
-        os.remove(path)
-    with open(path, 'w') as file:
-        writer = csv.writer(file)
-        writer.writerow(['theta0', 'theta1'])
-        writer.writerow([thetas[0], thetas[1]])
-    if output: print(message('3. Saving thetas in thetas.csv... Done √'))
+    generation: int = ft_publish(path, [MODEL, ft_model_row(thetas, scalers)], companions=companions)
+    if output: print(message(f'3. Saving thetas in thetas.csv... Done √ (generation { generation })'))
     
 # ----------
 
-def ft_loss(thetas: list, x_km: list, y_price: list) -> float:
+def ft_model_row(thetas: list, scalers: dict) -> list:
 
     """
-    Computes the loss function of the linear regression model,
-    this to say the loss between the predicted prices and the
-    actual prices for a given set of mileages and prices.
-    The loss function is the mean squared error of the model.
+    Returns the values of a model as written in a thetas file (see MODEL).
 
     Args:
-        thetas (list): List containing theta0 and theta1.
-        x_km (list): List of mileage values (independent variable).
-        y_price (list): List of corresponding price values (dependent variable).
-    
+        thetas (list): List of theta0 and theta1.
+        scalers (dict): Dictionary containing the scalers of km and price.
+
     Returns:
-        loss (float): Loss function of the model.
+        row (list): Values of the model.
     """
 
-    loss: float = 0.0
+    return [MODEL_VERSION, thetas[0], thetas[1], *scalers['km'].bounds, *scalers['price'].bounds, *ft_fold(thetas, scalers)]
+
+# ----------
+
+def ft_save_groups(models: dict, key: str, path: str = PATH_THETAS, output: bool = True) -> None:
 
-    for mileage, price in zip(x_km, y_price):
-        loss += (price - (thetas[1] * mileage + thetas[0])) ** 2
-    return (loss / len(x_km))
+    """
+    Saves one model per group in a single keyed csv file:
+    the first column holds the group (and is named after the key column),
+    the other ones are the same as in a thetas file of a single model.
+    The model is published as a new generation of the registry (see
+    registry.ft_publish): the file is replaced atomically, never deleted.
+
+    Args:
+        models (dict): Dictionary mapping each group to its thetas and scalers.
+        key (str): Name of the key column.
+        path (str): Path to csv file (default: 'thetas.csv').
+        output (bool): Print output messages (default: True).
+
+    Returns:
+        None
+    """
+
+    if output: print(message('3. Saving thetas in thetas.csv...'), end='\r')
+    generation: int = ft_publish(path, [[key, *MODEL]] + [[group, *ft_model_row(thetas, scalers)] for group, (thetas, scalers) in models.items()])
+    if output: print(message(f'3. Saving thetas in thetas.csv... Done √ (generation { generation })'))
+
+# ----------
+
+def ft_warm(settings: dict, path: str = PATH_THETAS) -> LinearRegressor:
+
+    """
+    Loads the model to retrain from (warm start): its coefficients are
+    carried over to the bounds of the new data by ft_unfold, so that
+    training resumes where the previous run ended (see
+    LinearRegressor.partial_fit and LinearRegressor.fit_stream).
+
+    Args:
+        settings (dict): Settings of the model (see LinearRegressor).
+        path (str): Path to the thetas csv file (default: 'thetas.csv').
+
+    Returns:
+        model (LinearRegressor): Model loaded from csv file.
+    """
+
+    from regressor import LinearRegressor
+
+    if not os.path.isfile(path): raise Exception(f'Warm start (-warm) needs a model to start from, { path } not found.')
+    model: LinearRegressor = LinearRegressor.load(path, **settings)
+    if model.models is not None or model.features is not None: raise Exception('Warm start (-warm) is only available for models of the mileage alone.')
+    return model
+
+# ----------
+
+def ft_load_statistics(path: str = PATH_STATISTICS, model: str = PATH_THETAS) -> dict:
+
+    """
+    Loads the sufficient statistics of the exact solver from a csv file.
+    They must belong to the current generation of the model (see
+    registry.ft_stamp): statistics of another one, e.g. read while a
+    model is being published, are refused.
+
+    Args:
+        path (str): Path to csv file (default: 'statistics.csv').
+        model (str): Path to the thetas csv file they belong to (default: 'thetas.csv').
+
+    Returns:
+        statistics (dict): Statistics saved by ft_save.
+    """
+
+    from registry import ft_companion_generation, ft_current
+
+    try:
+
+        with open(path, 'r') as file:
+            rows, generation = ft_companion_generation(list(csv.reader(file)))
+        current: int = ft_current(model)
+        if generation is not None and generation != current: raise Exception(f"Statistics file '{ path }' belongs to generation { generation } of { model }, not to the current one ({ current }), retry or train with -solver exact.")
+        if len(rows) != 2 or tuple(rows[0]) != STATISTICS: raise Exception(f"Statistics file '{ path }' is corrupted, wrong format.")
+        statistics: dict = {key: float(value) for key, value in zip(STATISTICS, rows[1])}
+        statistics['rows'] = int(statistics['rows'])
+        return statistics
+
+    except ValueError: raise Exception(f"Statistics file '{ path }' is corrupted, wrong data type (must be int or float).")
+    except PermissionError: raise Exception(f"Statistics file '{ path }' is corrupted, permission denied.")
+    except FileNotFoundError: raise Exception(f"Statistics file '{ path }' not found, train with -solver exact beforehand.")
+    except IsADirectoryError: raise Exception(f"Statistics file is corrupted, '{ path }' is a directory.")
 
 # ----------
 
-def ft_adjust(x_km: list, y_price: list, thetas: list, tmp: list, loss: list) -> list:
+def ft_evaluate(thetas: list, x_km: list, y_price: list) -> tuple:
 
     """
-    Adjusts the learning rate based on the loss function. 
-    If the loss function increases, the learning rate is divided by 2.
-    If the loss function decreases, the learning rate is multiplied by 1.05.
+    Computes both the loss (mean squared error) and its gradient
+    for the given thetas, in a single pass over the data points.
 
     Args:
+        thetas (list): List containing theta0 and theta1.
         x_km (list): List of mileage values (independent variable).
         y_price (list): List of corresponding price values (dependent variable).
-        thetas (list): List of theta0 and theta1.
-        tmp (list): List of temporary theta0 and theta1.
-        loss (list): List of loss function values.
 
     Returns:
-        thetas (list): List of theta0 and theta1.
+        evaluation (tuple): Loss of the model and its gradient (list of 2 values).
+    """
+
+    loss: float = 0.0
+    tmp: list = [0.0, 0.0]
+
+    for km, price in zip(x_km, y_price):
+        error: float = thetas[1] * km + thetas[0] - price
+        loss += error ** 2
+        tmp[0] += error
+        tmp[1] += error * km
+    return loss / len(x_km), [tmp[0] / len(x_km), tmp[1] / len(x_km)]
+
+# ----------
+
+class History:
+
     """
+    Records the history of theta0, theta1 and loss of a training run
+    in compact typed arrays, according to one of these modes:
+    - 'off': nothing is recorded but the final state,
+    - 'every': every step-th iteration is recorded,
+    - 'ring': every step-th iteration is recorded in a ring buffer
+      holding only the last size ones.
+    Whatever the mode, the final state of the run is always the last
+    entry, so histories['theta0'][-1] always holds the trained theta0.
+    """
+
+    def __init__(self, mode: str = HISTORY, step: int = HISTORY_STEP, size: int = HISTORY_SIZE) -> None:
+
+        """
+        Args:
+            mode (str): Recording mode, 'off', 'every' or 'ring' (default: 'every').
+            step (int): Interval between recorded iterations (default: 1).
+            size (int): Number of entries of the ring buffer (default: 1000).
+        """
+
+        self.mode: str = mode
+        self.step: int = step
+        self.size: int = 1 if mode == 'off' else size if mode == 'ring' else None
+        self.count: int = 0
+        self.arrays: dict = {'iteration': array.array('q'), 'theta0': array.array('d'), 'theta1': array.array('d'), 'loss': array.array('d')}
+        if self.size is not None:
+            for key in self.arrays: self.arrays[key].extend([0] * self.size)
+
+    def wants(self, iteration: int) -> bool:
+
+        """
+        Tells whether an iteration is to be recorded.
+
+        Args:
+            iteration (int): Iteration of the run.
+
+        Returns:
+            wanted (bool): True if the iteration is to be recorded.
+        """
 
-    global LEARNING_RATE
+        return self.mode != 'off' and iteration % self.step == 0
 
-    if len(loss) > 1:
-        if loss[-1] >= loss[-2]:
-            thetas[0] += tmp[0] / len(x_km) * LEARNING_RATE
-            thetas[1] += tmp[1] / len(y_price) * LEARNING_RATE
-            LEARNING_RATE *= 0.5
+    def record(self, iteration: int, theta0: float, theta1: float, loss: float) -> None:
+
+        """
+        Records the state of the run at one iteration.
+
+        Args:
+            iteration (int): Iteration of the run.
+            theta0 (float): Theta0 at this iteration.
+            theta1 (float): Theta1 at this iteration.
+            loss (float): Loss at this iteration.
+
+        Returns:
+            None
+        """
+
+        if self.size is None:
+            for key, value in zip(self.arrays, (iteration, theta0, theta1, loss)): self.arrays[key].append(value)
         else:
-            LEARNING_RATE *= 1.05
-    return thetas
+            for key, value in zip(self.arrays, (iteration, theta0, theta1, loss)): self.arrays[key][self.count % self.size] = value
+        self.count += 1
+
+    def histories(self, iteration: int, theta0: float, theta1: float, loss: float) -> dict:
+
+        """
+        Records the final state of the run (unless it already was)
+        and returns the recorded entries in chronological order.
+
+        Args:
+            iteration (int): Last iteration of the run.
+            theta0 (float): Final theta0.
+            theta1 (float): Final theta1.
+            loss (float): Final loss.
+
+        Returns:
+            histories (dict): Dictionary containing the arrays of recorded iterations, theta0, theta1 and loss.
+        """
+
+        last: int = (self.count - 1) % self.size if self.size is not None else self.count - 1
+        if self.count == 0 or self.arrays['iteration'][last] != iteration: self.record(iteration, theta0, theta1, loss)
+        if self.size is None: return dict(self.arrays)
+        start: int = self.count % self.size if self.count > self.size else 0
+        return {key: values[start:min(self.count, self.size)] + values[:start] for key, values in self.arrays.items()}
+
+# ----------
+
+class Convergence:
+
+    """
+    Convergence controller of a gradient descent run, holding its own
+    learning rate so that runs never affect each other.
+    The learning rate is adapted with the bold driver rule: a step that
+    increases the loss is rejected (backtracking) and the learning rate
+    is divided by 2, a step that decreases it is accepted and the
+    learning rate is multiplied by 1.05.
+    The run stops as soon as the relative improvement of the loss or
+    the norm of the gradient falls below the tolerance, or when the
+    maximum number of iterations is reached.
+    """
+
+    def __init__(self, learning_rate: float = LEARNING_RATE, tolerance: float = TOLERANCE, iterations: int = MAX_ITERATIONS) -> None:
+
+        """
+        Args:
+            learning_rate (float): Initial learning rate (default: 0.5).
+            tolerance (float): Tolerance on the relative improvement and the gradient norm (default: 1e-14).
+            iterations (int): Maximum number of iterations (default: 100000).
+        """
+
+        self.learning_rate: float = learning_rate
+        self.tolerance: float = tolerance
+        self.iterations: int = iterations
+        self.iteration: int = 0
+        self.reason: str = None
+        self.start: float = None
+        self.time: float = 0.0
+
+    def running(self) -> bool:
+
+        """
+        Tells whether the run must go on, and measures its wall time
+        from the first call until it stops.
+
+        Returns:
+            running (bool): False once the run has converged or reached the maximum number of iterations.
+        """
+
+        if self.start is None: self.start = time.perf_counter()
+        if self.reason is None and self.iteration >= self.iterations: self.reason = 'maximum iterations reached'
+        if self.reason is not None and self.time == 0.0: self.time = time.perf_counter() - self.start
+        return self.reason is None
+
+    def adjust(self, loss: float, candidate: float, gradient: list) -> bool:
+
+        """
+        Decides whether a step is accepted and adapts the learning rate.
+
+        Args:
+            loss (float): Loss before the step.
+            candidate (float): Loss after the step.
+            gradient (list): Gradient the step was computed from.
+
+        Returns:
+            accepted (bool): True if the step is accepted.
+        """
+
+        self.iteration += 1
+        if math.hypot(*gradient) < self.tolerance:
+            self.reason = 'gradient norm below tolerance'
+            return False
+        if candidate > loss:
+            self.learning_rate *= 0.5
+            return False
+        self.learning_rate *= 1.05
+        if loss - candidate <= self.tolerance * loss: self.reason = 'relative improvement below tolerance'
+        return True
+
+    def report(self) -> dict:
+
+        """
+        Returns the report of the run.
+
+        Returns:
+            report (dict): Dictionary containing the iterations used, the wall time and the stop reason.
+        """
+
+        return {'iterations': self.iteration, 'time': self.time, 'reason': self.reason}
 
 # ----------
 
-def ft_train(x_km: list, y_price: list, output: bool = True) -> dict:
+def ft_train(x_km: list, y_price: list, output: bool = True, controller: Convergence = None, history: History = None, start: list = None, checkpoint: Checkpoint = None) -> dict:
     
     """
     Trains a linear regression model using the provided data points by iterative
-    gradient descent to update theta0 and theta1 based on the training data.
+    gradient descent to update theta0 and theta1 based on the training data,
+    until the convergence controller stops the run.
+    Each candidate step is evaluated (loss and gradient) in a single pass
+    over the data, and its gradient is reused when the step is accepted.
     
     Args:
         x_km (list): List of mileage values (independent variable).
         y_price (list): List of corresponding price values (dependent variable).
         output (bool): Print output messages (default: True).
+        controller (Convergence): Convergence controller of the run (default: new one with default settings).
+        history (History): Recorder of the history of the run (default: new one recording every iteration).
+        start (list): Initial theta0 and theta1, e.g. of a model to retrain (default: [0.0, 0.0]).
+        checkpoint (Checkpoint): Periodic checkpoint of the run (default: None).
     
     Returns:
-        histories (dict): Dictionary containing the history of theta0, theta1 and loss.
+        histories (dict): Dictionary containing the history of theta0, theta1 and loss, and the report of the run.
     """
 
-    thetas: list = [0.0, 0.0]
-    loss: list = []
-    histories: dict = {'theta0': [], 'theta1': [], 'loss': []}
+    thetas: list = list(start or [0.0, 0.0])
+    controller = controller or Convergence()
+    history = history or History()
+    loss, gradient = ft_evaluate(thetas, x_km, y_price)
 
     if output: print(message('2. Training model...'), end='\r')
-    for _ in range(ITERATIONS):
-        tmp: list = [0.0, 0.0]
-        prediction: float = 0.0
-        for km, price in zip(x_km, y_price):
-            prediction = thetas[1] * km + thetas[0]
-            tmp[0] += prediction - price
-            tmp[1] += (prediction - price) * km
-        thetas[0] -= tmp[0] / len(x_km) * LEARNING_RATE
-        thetas[1] -= tmp[1] / len(y_price) * LEARNING_RATE
-        histories['theta0'].append(thetas[0])
-        histories['theta1'].append(thetas[1])
-        histories['loss'].append(ft_loss(thetas, x_km, y_price))
-        thetas = ft_adjust(x_km, y_price, thetas, tmp, loss)
+    while controller.running():
+        candidate: list = [thetas[0] - gradient[0] * controller.learning_rate, thetas[1] - gradient[1] * controller.learning_rate]
+        candidate_loss, candidate_gradient = ft_evaluate(candidate, x_km, y_price)
+        if controller.adjust(loss, candidate_loss, gradient): thetas, loss, gradient = candidate, candidate_loss, candidate_gradient
+        if history.wants(controller.iteration): history.record(controller.iteration, thetas[0], thetas[1], loss)
+        if checkpoint is not None and controller.reason is None and checkpoint.due(controller.iteration): checkpoint.save(thetas, loss, controller, history)
+    histories: dict = history.histories(controller.iteration, thetas[0], thetas[1], loss)
+    histories.update(controller.report())
     if output: print(message('2. Training model... Done √'))
     return histories
 
 # ----------
 
-def ft_plot(x_km: list, y_price: list, thetas: list, histories: dict, output: bool = True) -> None:
+def ft_residuals(thetas: list, x_km: numpy.ndarray, y_price: numpy.ndarray, out: numpy.ndarray) -> numpy.ndarray:
+
+    """
+    Computes the residuals (predicted price - actual price) of the model
+    for every data point, writing them into a preallocated array.
+
+    Args:
+        thetas (list): List containing theta0 and theta1.
+        x_km (numpy.ndarray): Array of mileage values (independent variable).
+        y_price (numpy.ndarray): Array of corresponding price values (dependent variable).
+        out (numpy.ndarray): Array receiving the residuals.
+
+    Returns:
+        residuals (numpy.ndarray): Array of residuals (same object as out).
+    """
+
+    numpy.multiply(x_km, thetas[1], out=out)
+    numpy.subtract(out, y_price, out=out)
+    out += thetas[0]
+    return out
+
+# ----------
+
+def ft_train_vectorized(x_km: list, y_price: list, output: bool = True, controller: Convergence = None, history: History = None, start: list = None, checkpoint: Checkpoint = None) -> dict:
+
+    """
+    Trains a linear regression model by batch gradient descent, exactly
+    like ft_train, but on contiguous float arrays with vectorized operations.
+    The residuals of each candidate step are computed once and reused both
+    for its loss and, when the step is accepted, for the next gradient.
+    Rounding differences between both engines may shift the iteration
+    at which the run stops by a few steps, so resulting thetas match
+    ft_train within the accuracy of the tolerance (about 1e-7 by default).
+
+    Args:
+        x_km (list): List of mileage values (independent variable).
+        y_price (list): List of corresponding price values (dependent variable).
+        output (bool): Print output messages (default: True).
+        controller (Convergence): Convergence controller of the run (default: new one with default settings).
+        history (History): Recorder of the history of the run (default: new one recording every iteration).
+        start (list): Initial theta0 and theta1, e.g. of a model to retrain (default: [0.0, 0.0]).
+        checkpoint (Checkpoint): Periodic checkpoint of the run (default: None).
+
+    Returns:
+        histories (dict): Dictionary containing the history of theta0, theta1 and loss, and the report of the run.
+    """
+
+    thetas: list = list(start or [0.0, 0.0])
+    controller = controller or Convergence()
+    history = history or History()
+    x: numpy.ndarray = numpy.ascontiguousarray(x_km, dtype=numpy.float64)
+    y: numpy.ndarray = numpy.ascontiguousarray(y_price, dtype=numpy.float64)
+    residuals: numpy.ndarray = ft_residuals(thetas, x, y, numpy.empty_like(x))
+    candidate_residuals: numpy.ndarray = numpy.empty_like(x)
+    loss: float = float(residuals.dot(residuals)) / len(x)
+
+    if output: print(message('2. Training model...'), end='\r')
+    while controller.running():
+        gradient: list = [float(residuals.sum()) / len(x), float(residuals.dot(x)) / len(x)]
+        candidate: list = [thetas[0] - gradient[0] * controller.learning_rate, thetas[1] - gradient[1] * controller.learning_rate]
+        ft_residuals(candidate, x, y, candidate_residuals)
+        candidate_loss: float = float(candidate_residuals.dot(candidate_residuals)) / len(x)
+        if controller.adjust(loss, candidate_loss, gradient):
+            thetas, loss = candidate, candidate_loss
+            residuals, candidate_residuals = candidate_residuals, residuals
+        if history.wants(controller.iteration): history.record(controller.iteration, thetas[0], thetas[1], loss)
+        if checkpoint is not None and controller.reason is None and checkpoint.due(controller.iteration): checkpoint.save(thetas, loss, controller, history)
+    histories: dict = history.histories(controller.iteration, thetas[0], thetas[1], loss)
+    histories.update(controller.report())
+    if output: print(message('2. Training model... Done √'))
+    return histories
+
+# ----------
+
+def ft_epochs(rows: int, batchsize: int = BATCH_SIZE) -> int:
+
+    """
+    Returns the default maximum number of epochs of the streaming mode:
+    EPOCHS, or more on small files so that the model gets as many
+    mini-batch updates as ITERATIONS.
+
+    Args:
+        rows (int): Number of rows of the data.
+        batchsize (int): Number of rows per mini-batch (default: 1024).
+
+    Returns:
+        epochs (int): Maximum number of epochs.
+    """
+
+    return max(EPOCHS, math.ceil(ITERATIONS / math.ceil(rows / batchsize)))
+
+# ----------
+
+def ft_train_stream(path: str, bounds: dict, chunksize: int = CHUNK_SIZE, batchsize: int = BATCH_SIZE, shuffle: int = 0, output: bool = True, history: History = None, start: list = None, controller: Convergence = None, seed: int = SEED) -> dict:
+
+    """
+    Trains a linear regression model by mini-batch gradient descent
+    while streaming the csv file, so memory is bounded by the chunk
+    size rather than by the number of rows.
+    The convergence controller works by epoch (one pass over the file):
+    an epoch whose loss, the mean squared error of its mini-batches,
+    is higher than that of the previous epoch is rolled back and the
+    learning rate is halved, otherwise it is kept and the learning rate
+    grows; the run stops when the relative improvement of the loss or
+    the mean gradient of an epoch falls below the tolerance, or after
+    the maximum number of epochs. The first epoch is always kept.
+    Histories hold one entry per epoch.
+
+    Args:
+        path (str): Path to csv file.
+        bounds (dict): Bounds returned by ft_bounds.
+        chunksize (int): Number of rows per chunk (default: 100000).
+        batchsize (int): Number of rows per mini-batch (default: 1024).
+        shuffle (int): Size of the shuffle buffer, 0 to disable shuffling (default: 0).
+        output (bool): Print output messages (default: True).
+        history (History): Recorder of the history of the run, by epoch (default: new one recording every epoch).
+        start (list): Initial theta0 and theta1, e.g. of a model to retrain (default: [0.0, 0.0]).
+        controller (Convergence): Convergence controller of the run, by epoch (default: new one with at most ft_epochs epochs).
+        seed (int): Seed of the shuffle buffer (default: 42).
+
+    Returns:
+        histories (dict): Dictionary containing the history of theta0, theta1 and loss, and the report of the run.
+    """
+
+    thetas: list = list(start or [0.0, 0.0])
+    history = history or History()
+    controller = controller or Convergence(LEARNING_RATE, TOLERANCE, ft_epochs(bounds['rows'], batchsize))
+    generator: numpy.random.Generator = numpy.random.default_rng(seed)
+    loss: float = sys.float_info.max
+
+    if output: print(message('2. Training model (streaming)...'), end='\r')
+    while controller.running():
+        candidate: list = list(thetas)
+        sums: list = [0.0, 0.0, 0.0]
+        for x_km, y_price in ft_batches(path, bounds, chunksize, batchsize, shuffle, generator):
+            residuals: numpy.ndarray = candidate[1] * x_km + candidate[0] - y_price
+            gradient: list = [float(residuals.sum()), float(residuals.dot(x_km))]
+            sums[0] += float(residuals.dot(residuals))
+            sums[1] += gradient[0]
+            sums[2] += gradient[1]
+            candidate[0] -= gradient[0] / len(x_km) * controller.learning_rate
+            candidate[1] -= gradient[1] / len(x_km) * controller.learning_rate
+        if controller.adjust(loss, sums[0] / bounds['rows'], [sums[1] / bounds['rows'], sums[2] / bounds['rows']]): thetas, loss = candidate, sums[0] / bounds['rows']
+        if history.wants(controller.iteration): history.record(controller.iteration, thetas[0], thetas[1], loss)
+    histories: dict = history.histories(controller.iteration, thetas[0], thetas[1], loss)
+    histories.update(controller.report())
+    if output: print(message('2. Training model (streaming)... Done √'))
+    return histories
+
+# ----------
+
+def ft_train_group(task: tuple) -> tuple:
+
+    """
+    Trains the model of a single group, in a worker process of ft_train_groups.
+    Each group gets its own scalers and its own convergence controller.
+
+    Args:
+        task (tuple): Group, arrays of mileage and price values, and settings (learning rate, tolerance, maximum iterations) of the controller.
+
+    Returns:
+        result (tuple): Group, thetas, scalers and report of the run.
+    """
+
+    group, x_km, y_price, settings = task
+    scalers: dict = {'km': Scaler().fit(x_km), 'price': Scaler().fit(y_price)}
+
+    if len(x_km) < 2: raise Exception(f"Group '{ group }' is corrupted, not enought data to train program.")
+    if scalers['km'].minimum == scalers['km'].maximum or scalers['price'].minimum == scalers['price'].maximum:
+        raise Exception(f"Group '{ group }' is corrupted, constant column(s) cannot be normalized.")
+    histories: dict = ft_train_vectorized(scalers['km'].transform(x_km), scalers['price'].transform(y_price), False, Convergence(*settings), History('off'))
+    return group, (histories['theta0'][-1], histories['theta1'][-1]), scalers, {key: histories[key] for key in ('iterations', 'time', 'reason')}
+
+# ----------
+
+def ft_train_groups(data: pandas.DataFrame, key: str, controller: Convergence, workers: int = None, output: bool = True) -> tuple:
+
+    """
+    Partitions data by its key column and trains an independent model
+    per group, spreading the groups across a pool of worker processes.
+
+    Args:
+        data (pandas.DataFrame): Data loaded by ft_load_groups.
+        key (str): Name of the key column.
+        controller (Convergence): Controller whose settings are used for every group.
+        workers (int): Number of worker processes (default: number of CPUs).
+        output (bool): Print output messages (default: True).
+
+    Returns:
+        results (tuple): Dictionary mapping each group to its thetas and scalers, and list of the reports of the runs.
+    """
+
+    settings: tuple = (controller.learning_rate, controller.tolerance, controller.iterations)
+    tasks: list = [(group, rows['km'].to_numpy(dtype=numpy.float64), rows['price'].to_numpy(dtype=numpy.float64), settings) for group, rows in data.groupby(key, sort=True)]
+    workers = workers or os.cpu_count() or 1
+    models: dict = {}
+    reports: list = []
+
+    if output: print(message(f'2. Training { len(tasks) } models across { workers } processes...'), end='\r')
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+        for group, thetas, scalers, report in pool.map(ft_train_group, tasks, chunksize=max(1, len(tasks) // (workers * 4))):
+            models[group] = (thetas, scalers)
+            reports.append(report)
+    if output: print(message(f'2. Training { len(tasks) } models across { workers } processes... Done √'))
+    return models, reports
+
+# ----------
+
+def ft_decimate(iterations: list, values: list, buckets: int = PLOT_CURVE) -> tuple:
+
+    """
+    Downsamples a curve for plotting while preserving its shape: points
+    are grouped in buckets of consecutive iterations and only the
+    minimum and the maximum of each bucket are kept, so spikes and
+    plateaus stay visible whatever the number of points.
+
+    Args:
+        iterations (list): Iterations of the curve (x axis).
+        values (list): Values of the curve (y axis).
+        buckets (int): Number of buckets, the curve keeps at most twice as many points (default: 2000).
+
+    Returns:
+        curve (tuple): Arrays of the iterations and values kept.
+    """
+
+    x: numpy.ndarray = numpy.asarray(iterations, dtype=numpy.float64)
+    y: numpy.ndarray = numpy.asarray(values, dtype=numpy.float64)
+
+    if len(y) <= 2 * buckets: return x, y
+    size: int = math.ceil(len(y) / buckets)
+    padded: numpy.ndarray = numpy.pad(y, (0, buckets * size - len(y)), mode='edge').reshape(buckets, size)
+    offsets: numpy.ndarray = numpy.arange(buckets) * size
+    kept: numpy.ndarray = numpy.unique(numpy.minimum(numpy.concatenate((offsets + padded.argmin(axis=1), offsets + padded.argmax(axis=1), [0, len(y) - 1])), len(y) - 1))
+    return x[kept], y[kept]
+
+# ----------
+
+def ft_density(x_km: numpy.ndarray, y_price: numpy.ndarray, km: Scaler, price: Scaler, bins: int = PLOT_BINS) -> numpy.ndarray:
+
+    """
+    Counts the data points falling in each cell of a grid (2D histogram)
+    spanning the bounds of the data. Points are counted by chunks, so
+    memory stays bounded whatever the number of rows.
+
+    Args:
+        x_km (numpy.ndarray): Array of mileage values.
+        y_price (numpy.ndarray): Array of corresponding price values.
+        km (Scaler): Scaler of the mileages (bounds of the grid).
+        price (Scaler): Scaler of the prices (bounds of the grid).
+        bins (int): Number of cells along each axis (default: 200).
+
+    Returns:
+        counts (numpy.ndarray): Number of points per cell, one row per price cell.
+    """
+
+    counts: numpy.ndarray = numpy.zeros(bins * bins, dtype=numpy.int64)
+
+    for start in range(0, len(x_km), CHUNK_SIZE):
+        column: numpy.ndarray = numpy.minimum((km.transform(x_km[start:start + CHUNK_SIZE]) * bins).astype(numpy.int64), bins - 1)
+        row: numpy.ndarray = numpy.minimum((price.transform(y_price[start:start + CHUNK_SIZE]) * bins).astype(numpy.int64), bins - 1)
+        counts += numpy.bincount(row * bins + column, minlength=bins * bins)
+    return counts.reshape(bins, bins)
+
+# ----------
+
+def ft_plot(x_km: list, y_price: list, thetas: list, histories: dict, output: bool = True, target: str = None, mode: str = PLOT) -> None:
 
     """
     Plots the data points and the linear regression model.
+    Data points are drawn according to the mode:
+    - 'scatter': every point,
+    - 'density': a 2D histogram of the points (log scale), whose cost does not depend on the number of rows,
+    - 'sample': a uniform random sample of PLOT_POINTS points,
+    - 'auto': every point up to PLOT_POINTS points, a 2D histogram above.
+    History curves are downsampled by ft_decimate.
+    With a target file, plots are rendered without any display (PNG or SVG
+    according to the extension) instead of being shown in a window.
 
     Args:
         x_km (list): List of mileage values (independent variable).
         y_price (list): List of corresponding price values (dependent variable).
         thetas (list): List containing theta0 and theta1.
-        histories (dict): Dictionary containing the history of theta0, theta1 and loss.
+        histories (dict): Dictionary containing the history of theta0, theta1 and loss, as sampled (see History).
         output (bool): Print output messages (default: True).
+        target (str): Path to the PNG or SVG file to render, None to show a window (default: None).
+        mode (str): Drawing mode of the data points (default: 'auto').
     
     Returns:
         None
     """
 
     y_plot: list = []
-    x_plot: list = [float(min(x_km)), float(max(x_km))]
+    iterations = histories.get('iteration', range(len(histories['loss'])))
+    x_km = numpy.asarray(x_km, dtype=numpy.float64)
+    y_price = numpy.asarray(y_price, dtype=numpy.float64)
+    km: Scaler = Scaler().fit(x_km)
+    price: Scaler = Scaler().fit(y_price)
+    x_plot: list = [km.minimum, km.maximum]
+    color: tuple = (240 / 255, 128 / 255, 128 / 255)
 
     if output: print(message('\n4. Plotting data points and linear regression model...'), end='\r')
+    if target is not None: importlib.import_module('matplotlib').use('Agg')
+    if mode == 'auto': mode = 'scatter' if len(x_km) <= PLOT_POINTS else 'density'
     for elem in x_plot:
-        elem = thetas[1] * ft_normalize_value(x_km, elem) + thetas[0]
-        y_plot.append(ft_denormalize_value(y_price, elem))
+        elem = thetas[1] * km.transform(elem) + thetas[0]
+        y_plot.append(price.inverse_transform(elem))
     fig, axes = pyplot.subplots(nrows=2, ncols=2, figsize=(10, 8))
     fig.canvas.manager.set_window_title("MBOY'S LINEAR REGRESSION") 
-    axes[0, 0].plot(x_km, y_price, color=(240 / 255, 128 / 255, 128 / 255), marker='o', linestyle='None')
+    if mode == 'density':
+        counts: numpy.ndarray = ft_density(x_km, y_price, km, price).astype(numpy.float64)
+        counts[counts == 0] = numpy.nan
+        axes[0, 0].imshow(counts, origin='lower', aspect='auto', extent=(km.minimum, km.maximum, price.minimum, price.maximum), cmap='RdPu', norm='log', interpolation='nearest')
+    else:
+        if mode == 'sample' and len(x_km) > PLOT_POINTS:
+            kept: numpy.ndarray = numpy.sort(numpy.random.default_rng(SEED).choice(len(x_km), PLOT_POINTS, replace=False))
+            x_km, y_price = x_km[kept], y_price[kept]
+        axes[0, 0].plot(x_km, y_price, color=color, marker='o' if len(x_km) <= PLOT_POINTS else ',', linestyle='None')
     axes[0, 0].plot(x_plot, y_plot, color=(248 / 255, 173 / 255, 157 / 255))
     axes[0, 0].set_xlabel('Kilometers', fontdict={'family': 'arial', 'size': 10})
     axes[0, 0].set_ylabel('Prices', fontdict={'family': 'arial', 'size': 10})
     axes[0, 0].set_title('Linear regression model', fontdict={'family': 'arial', 'size': 12})
-    axes[0, 1].plot(range(ITERATIONS), histories['loss'], color=(240 / 255, 128 / 255, 128 / 255))
+    axes[0, 1].plot(*ft_decimate(iterations, histories['loss']), color=color)
     axes[0, 1].set_xlabel('Iterations', fontdict={'family': 'arial', 'size': 10})
     axes[0, 1].set_ylabel('Loss', fontdict={'family': 'arial', 'size': 10})
     axes[0, 1].set_title('Loss Evolution', fontdict={'family': 'arial', 'size': 12})
-    axes[1, 0].plot(range(ITERATIONS), histories['theta0'], color=(240 / 255, 128 / 255, 128 / 255))
+    axes[1, 0].plot(*ft_decimate(iterations, histories['theta0']), color=color)
     axes[1, 0].set_xlabel('Iterations', fontdict={'family': 'arial', 'size': 10})
     axes[1, 0].set_ylabel('Theta0', fontdict={'family': 'arial', 'size': 10})
     axes[1, 0].set_title('Theta0 Evolution', fontdict={'family': 'arial', 'size': 12})
-    axes[1, 1].plot(range(ITERATIONS), histories['theta1'], color=(240 / 255, 128 / 255, 128 / 255))
+    axes[1, 1].plot(*ft_decimate(iterations, histories['theta1']), color=color)
     axes[1, 1].set_xlabel('Iterations', fontdict={'family': 'arial', 'size': 10})
     axes[1, 1].set_ylabel('Theta1', fontdict={'family': 'arial', 'size': 10})
     axes[1, 1].set_title('Theta1 Evolution', fontdict={'family': 'arial', 'size': 12})
     pyplot.subplots_adjust(wspace=0.5, hspace=0.5)
     fig.tight_layout(pad=3.0)
-    if output: print(message('4. Plotting data points and linear regression model... Done √'))
-    pyplot.show()
+    if target is not None:
+        fig.savefig(target)
+        pyplot.close(fig)
+    if output: print(message(f'4. Plotting data points and linear regression model... Done √{ f" ({ target })" if target is not None else "" }'))
+    if target is None: pyplot.show()
 
 
 # Main function
 # -------------
 
+def ft_report(regressor: LinearRegressor) -> None:
+
+    """
+        Prints the final thetas of the model trained by the main function
+        and records its final loss and iterations.
+
+        Args:
+            regressor (LinearRegressor): Trained model, of the mileage alone or with features.
+    """
+
+    histories: dict = regressor.histories
+    names: list = ['Theta0', 'Theta1'] if regressor.features is None else ['intercept', *regressor.features]
+
+    telemetry.gauge('final_loss', histories['loss'][-1])
+    if 'iterations' in histories:
+        telemetry.gauge('iterations', histories['iterations'])
+        telemetry.gauge('iterations_per_second', histories['iterations'] / histories['time'] if histories['time'] > 0 else 0.0)
+    print(message('\nFinal thetas value :'))
+    for name, theta in zip(names, regressor.thetas):
+        print(message(f'   - { name }: { theta }'))
+    if 'iterations' in histories:
+        print(message(f"   - Iterations: { histories['iterations'] } in { histories['time']:.4f} s ({ histories['reason'] })"))
+
+# ----------
+
+def ft_main_features(path: str, features: list, settings: dict) -> None:
+
+    """
+        Multivariate mode of the main function: the price is modeled
+        from any number of feature columns, each scaled on its own.
+
+        Args:
+            path (str): Path to csv file with a 'price' column and the feature columns.
+            features (list): Names of the feature columns, or ['all'] for every column but 'price'.
+            settings (dict): Settings of the model (see LinearRegressor).
+    """
+
+    from regressor import LinearRegressor
+
+    names, x, y = ft_load_features(path, features)
+    regressor: LinearRegressor = LinearRegressor(**settings, features=names)
+    with telemetry.stage('train', len(y)): regressor.fit(x, y)
+    with telemetry.stage('save'): regressor.save()
+    ft_report(regressor)
+
+# ----------
+
+def ft_main_groups(path: str, key: str, settings: dict) -> None:
+
+    """
+        Grouped mode of the main function: one model is trained per
+        value of the key column and all of them are saved in a single keyed thetas file.
+
+        Args:
+            path (str): Path to csv file with the key column, 'km' and 'price'.
+            key (str): Name of the key column.
+            settings (dict): Settings of the model of every group (see LinearRegressor).
+    """
+
+    from regressor import LinearRegressor
+
+    with telemetry.stage('load') as stage:
+        data: pandas.DataFrame = ft_load_groups(path, key)
+        stage.rows = len(data)
+    regressor: LinearRegressor = LinearRegressor(**settings, key=key)
+    with telemetry.stage('train', len(data)): regressor.fit(data['km'], data['price'], data[key])
+    with telemetry.stage('save'): regressor.save()
+    reports: list = [model.histories for model in regressor.models.values()]
+    telemetry.gauge('models', len(reports))
+    telemetry.gauge('iterations', sum(report['iterations'] for report in reports))
+    print(message(f'\nTrained { len(reports) } models (one per { key }) :'))
+    print(message(f"   - Iterations: { sum(report['iterations'] for report in reports) } in total, { max(report['iterations'] for report in reports) } at most"))
+    print(message(f"   - Not converged: { sum(report['reason'] == 'maximum iterations reached' for report in reports) }"))
+
+# ----------
+
 def ft_main(args: list) -> None:
 
     """
@@ -228,36 +1398,211 @@ def ft_main(args: list) -> None:
 
         Args:
             args (list): List of arguments that can be either:
-                path (str): Optional argument to specify path to csv file (default: 'data.csv').
+                path (str): Optional argument to specify path to csv file (default: 'data.csv'), or many csv files, directories or glob patterns of shards, plain or compressed (.csv.gz, .csv.bz2, .csv.xz).
                 -bonus (bool): Optional argument to enable bonus mode (default: False).
+                -engine (str): Optional training engine, 'loop', 'numpy' or 'parallel', across worker processes (default: 'numpy').
+                -stream (bool): Optional argument to train by streaming the csv file in chunks (default: False).
+                -chunk (int): Optional number of rows per chunk in streaming mode (default: 100000).
+                -batch (int): Optional number of rows per mini-batch in streaming mode (default: 1024).
+                -shuffle (int): Optional shuffle buffer size in streaming mode, 0 to disable (default: 0).
+                -solver (str): Optional solver, 'gradient' or 'exact' (default: 'gradient').
+                -fold (bool): Optional argument to fold the csv file into the saved statistics of the exact solver (default: False).
+                -tolerance (float): Optional tolerance on the relative improvement of the loss and the gradient norm (default: 1e-14).
+                -iterations (int): Optional maximum number of gradient descent iterations, or of epochs in streaming mode (default: 100000, or 5 epochs and more on small files in streaming mode).
+                -render (str): Optional PNG or SVG file the -bonus plots are rendered to, without any display (default: None, plots are shown in a window).
+                -plot (str): Optional drawing mode of the data points in the -bonus plots, 'auto', 'scatter', 'density' or 'sample' (default: 'auto').
+                -history (str): Optional history recording mode, 'off', 'every' or 'ring' (default: 'every' with -bonus, 'off' otherwise).
+                -step (int): Optional interval between recorded iterations (default: 1).
+                -ring (int): Optional number of iterations kept by the 'ring' history mode (default: 1000).
+                -warm (bool): Optional argument to retrain the current model (thetas.csv) on the csv file only, e.g. new rows, instead of starting from scratch (default: False).
+                -full (str): Optional csv file of the rows the model was trained on, added to the new rows in warm start (default: None).
+                -checkpoint (str): Optional file the run is checkpointed to, deleted once the model is saved (default: 'checkpoint.bin' when -every, -seconds or -resume is given).
+                -every (int): Optional number of iterations between checkpoints, 0 to disable (default: 10000).
+                -seconds (float): Optional number of seconds between checkpoints, 0 to disable (default: 60).
+                -resume (bool): Optional argument to resume the run of the checkpoint, on the same data (with the same -full file in warm start), as if it had never stopped (default: False).
+                -features (str): Optional comma-separated feature columns to model the price from, or 'all' for every column but 'price' (default: None, 'km' only).
+                -group (str): Optional key column to train one model per group, across processes (default: None).
+                -workers (int): Optional number of worker processes in grouped mode, reading shards or training with the parallel engine (default: number of CPUs).
+                -strict (bool): Optional argument to fail on the first invalid row of the shards instead of leaving it out (default: False).
+                -shard-memory (int): Optional MiB of parsed shards kept in memory for the later passes over the data, e.g. the epochs of -stream (default: 0, shards are parsed again on every pass).
+                -cache (str): Optional binary cache mode: 'auto', 'off', or the commands 'rebuild' and 'invalidate' (default: 'auto').
+                -metrics (str): Optional file receiving the duration, rows and peak memory of each stage, in the Prometheus text format for .prom files, JSON otherwise (default: None).
+                -profile (str): Optional file receiving a cProfile dump of the run (default: None).
         
         Returns:
             None
     """
     
-    global BONUS
-    x_km: list = None
-    y_price: list = None
-    thetas: tuple = None
-    histories: dict = None
-    data: pandas.DataFrame = None
+    from regressor import LinearRegressor
+    from checkpoint import Checkpoint, ft_checkpoint_read, ft_fingerprint, CHECKPOINT_EVERY, CHECKPOINT_SECONDS, PATH_CHECKPOINT
 
+    bonus: bool = BONUS
+    engine: str = None
+    stream: bool = False
+    chunksize: int = None
+    batchsize: int = None
+    shuffle: int = None
+    solver: str = None
+    fold: bool = False
+    cache: str = None
+    tolerance: float = None
+    iterations: int = None
+    history: str = None
+    step: int = None
+    ring: int = None
+    key: str = None
+    workers: int = None
+    features: list = None
+    warm: bool = False
+    strict: bool = False
+    resume: bool = False
+    checkpoint: Checkpoint = None
+    state: dict = None
+    full: str = None
+    path: str = None
+    settings: dict = None
+    regressor: LinearRegressor = None
+    x_km: numpy.ndarray = None
+    y_price: numpy.ndarray = None
+
+    metrics: str = ft_option(args, '-metrics')
+    profile: str = ft_option(args, '-profile')
+    if metrics is not None or profile is not None: telemetry.start('train', metrics, profile)
     if '-bonus' in args:
-        BONUS = True
+        bonus = True
         args.remove('-bonus')
-    if len(args) > 1:
-        raise Exception("Please provide path to CSV or/and -bonus flag only, or no arguments at all to use default path 'data.csv'.")
-    data = ft_load() if len(args) == 0 else ft_load(args[0])
-    x_km = data['km'].tolist()
-    y_price = data['price'].tolist()
-    histories = ft_train(ft_normalize_list(x_km), ft_normalize_list(y_price))
-    thetas = histories['theta0'][-1], histories['theta1'][-1]
-    ft_save(thetas)
-    print(message('\nFinal thetas value :'))
-    print(message(f'   - Theta0: { thetas[0] }'))
-    print(message(f'   - Theta1: { thetas[1] }'))
-    if BONUS: ft_plot(x_km, y_price, thetas, histories)
-
+    engine = ft_option(args, '-engine', ENGINE)
+    if engine not in ENGINES:
+        raise Exception(f"Unknown engine '{ engine }', must be one of: { ', '.join(ENGINES) }.")
+    if '-stream' in args:
+        stream = True
+        args.remove('-stream')
+    chunksize = ft_option(args, '-chunk', CHUNK_SIZE, int)
+    batchsize = ft_option(args, '-batch', BATCH_SIZE, int)
+    shuffle = ft_option(args, '-shuffle', 0, int)
+    if chunksize < 1 or batchsize < 1 or shuffle < 0:
+        raise Exception('Chunk and batch sizes must be positive, shuffle buffer size cannot be negative.')
+    solver = ft_option(args, '-solver', SOLVER)
+    if solver not in SOLVERS:
+        raise Exception(f"Unknown solver '{ solver }', must be one of: { ', '.join(SOLVERS) }.")
+    if '-fold' in args:
+        fold = True
+        args.remove('-fold')
+    if fold and solver != 'exact':
+        raise Exception('Folding new rows (-fold) is only available with the exact solver.')
+    render: str = ft_option(args, '-render')
+    plot: str = ft_option(args, '-plot', PLOT)
+    if plot not in PLOTS:
+        raise Exception(f"Unknown plot mode '{ plot }', must be one of: { ', '.join(PLOTS) }.")
+    if render is not None and not render.lower().endswith(('.png', '.svg')):
+        raise Exception('Plots can only be rendered to .png or .svg files.')
+    if (render is not None or plot != PLOT) and not bonus:
+        raise Exception('Options -render and -plot are only available with -bonus.')
+    if (stream or solver == 'exact') and bonus:
+        raise Exception('Plotting (-bonus) is not available in streaming mode or with the exact solver.')
+    tolerance = ft_option(args, '-tolerance', TOLERANCE, float)
+    iterations = ft_option(args, '-iterations', None, int)
+    if tolerance < 0 or (iterations is not None and iterations < 1):
+        raise Exception('Tolerance cannot be negative and the maximum number of iterations must be positive.')
+    history = ft_option(args, '-history', HISTORY if bonus else 'off')
+    step = ft_option(args, '-step', HISTORY_STEP, int)
+    ring = ft_option(args, '-ring', HISTORY_SIZE, int)
+    if history not in HISTORIES:
+        raise Exception(f"Unknown history mode '{ history }', must be one of: { ', '.join(HISTORIES) }.")
+    if step < 1 or ring < 1:
+        raise Exception('History step and ring size must be positive.')
+    cache = ft_option(args, '-cache', CACHE)
+    if cache not in CACHES:
+        raise Exception(f"Unknown cache mode '{ cache }', must be one of: { ', '.join(CACHES) }.")
+    key = ft_option(args, '-group')
+    workers = ft_option(args, '-workers', None, int)
+    if workers is not None and workers < 1:
+        raise Exception('Number of worker processes must be positive.')
+    if key is not None and (stream or solver == 'exact' or bonus or engine != 'numpy'):
+        raise Exception('Grouped mode (-group) is only available with the numpy engine, without -stream, -solver exact or -bonus.')
+    features = ft_option(args, '-features')
+    if features is not None:
+        features = [name.strip() for name in features.split(',')]
+        if '' in features or 'price' in features or len(set(features)) != len(features):
+            raise Exception("Features must be distinct column names other than 'price', separated by commas.")
+    if features is not None and (stream or fold or key is not None or bonus or engine != 'numpy'):
+        raise Exception('Multivariate mode (-features) is only available with the numpy engine, without -stream, -fold, -group or -bonus.')
+    if '-warm' in args:
+        args.remove('-warm')
+        warm = True
+    full = ft_option(args, '-full')
+    if full is not None and not warm:
+        raise Exception('Option -full is only available in warm start (-warm).')
+    if warm and (solver == 'exact' or features is not None or key is not None):
+        raise Exception('Warm start (-warm) is only available with gradient descent on the mileage alone (use -solver exact -fold to update an exact fit).')
+    if full is not None and stream:
+        raise Exception('Option -full is not available in streaming mode, append the new rows to the csv file instead.')
+    if '-resume' in args:
+        args.remove('-resume')
+        resume = True
+    every: int = ft_option(args, '-every', None, int)
+    seconds: float = ft_option(args, '-seconds', None, float)
+    target: str = ft_option(args, '-checkpoint')
+    if resume or every is not None or seconds is not None or target is not None:
+        if stream or solver == 'exact' or key is not None or features is not None:
+            raise Exception('Checkpoints (-checkpoint, -every, -seconds, -resume) are only available with gradient descent in memory, without -stream, -solver exact, -group or -features.')
+        if (every is not None and every < 0) or (seconds is not None and seconds < 0):
+            raise Exception('Checkpoint intervals cannot be negative.')
+        checkpoint = Checkpoint(target or PATH_CHECKPOINT, CHECKPOINT_EVERY if every is None else every, CHECKPOINT_SECONDS if seconds is None else seconds)
+    if '-strict' in args:
+        args.remove('-strict')
+        strict = True
+    memory: int = ft_option(args, '-shard-memory', None, int)
+    if memory is not None and memory < 0: raise Exception('Shard memory cannot be negative.')
+    if ft_sharded(args):
+        if features is not None or key is not None or cache in ('rebuild', 'invalidate'):
+            raise Exception('Sharded inputs are not available with -features, -group or the cache commands.')
+        path = Shards(ft_shards(args), workers, strict, SHARD_MEMORY if memory is None else memory << 20)
+    elif strict or memory is not None:
+        raise Exception('Options -strict and -shard-memory are only available with sharded inputs (many files, a directory, a glob or compressed files).')
+    else: path = PATH_DATA if len(args) == 0 else args[0]
+    settings = {
+        'engine': engine, 'solver': solver, 'tolerance': tolerance, 'iterations': MAX_ITERATIONS if iterations is None else iterations,
+        'history': history, 'step': step, 'size': ring, 'output': True, 'checkpoint': checkpoint, 'workers': workers,
+        'chunksize': chunksize, 'batchsize': batchsize, 'shuffle': shuffle, 'epochs': iterations,
+    }
+    if features is not None:
+        ft_main_features(path, features, settings)
+        return
+    if key is not None:
+        ft_main_groups(path, key, settings)
+        return
+    if cache == 'invalidate':
+        print(message(f'Cache of { path } { "invalidated" if ft_cache_invalidate(path) else "not found, nothing to invalidate" } √'))
+        return
+    if cache == 'rebuild':
+        ft_cache_invalidate(path)
+        ft_dataset(path)
+        print(message(f'Cache of { path } rebuilt √'))
+        return
+    if resume:
+        state = ft_checkpoint_read(checkpoint.path)
+        if state['data'] != ft_fingerprint(path, full): raise Exception(f'Checkpoint { checkpoint.path } was taken on other data, it can only be resumed on the same csv file(s), unchanged (with the same -full file in warm start).')
+        settings['engine'] = state['engine']
+    if checkpoint is not None: checkpoint.context['data'] = ft_fingerprint(path, full)
+    if warm and not resume:
+        with telemetry.stage('load'): regressor = ft_warm(settings)
+    else: regressor = LinearRegressor(**settings)
+    if fold: regressor.statistics = ft_load_statistics()
+    if stream or solver == 'exact': regressor.fit_stream(path, warm or fold)
+    else:
+        x_km, y_price = ft_dataset(path, cache == 'auto')
+        if full is not None:
+            x_full, y_full = ft_dataset(full, cache == 'auto', False)
+            x_km, y_price = numpy.concatenate((x_km, x_full)), numpy.concatenate((y_price, y_full))
+        with telemetry.stage('train', len(x_km)):
+            if resume: regressor.resume(x_km, y_price, state)
+            else: regressor.partial_fit(x_km, y_price)
+    with telemetry.stage('save'): regressor.save()
+    if checkpoint is not None: checkpoint.remove()
+    ft_report(regressor)
+    if bonus:
+        with telemetry.stage('plot', len(x_km)): ft_plot(x_km, y_price, regressor.thetas, regressor.histories, target=render, mode=plot)
 
 # Main
 # ----
@@ -276,3 +1621,4 @@ if __name__ == '__main__':
     except Exception as exc:
         print(error(f'[ ERROR ]: { exc }'))
         sys.exit(1)
+    finally: telemetry.finish()